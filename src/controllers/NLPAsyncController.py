@@ -4,26 +4,46 @@ from models.db_schemas import Project, DataChunk
 from stores.llm.LLMEnums import DocumentTypeEnum
 from typing import List
 import json 
-import asyncio
 from stores.templates import TemplateParser
+from stores.llm.SemanticCache import SemanticCache
 from models.enums.TemplatesEnum import TemplateDirectoriesAndFilesEnums, PromptsVariables
 
+# Template group/keys read on every RAG answer (once per retrieved chunk for the
+# document prompt), resolved once at import instead of through the enums each time
+_RAG_GROUP = TemplateDirectoriesAndFilesEnums.RAG.value
+_SYSTEM_PROMPT_KEY = PromptsVariables.SYSTEM_PROMPT.value
+_DOCUMENT_PROMPT_KEY = PromptsVariables.DOCUMENT_PROMPT.value
+_FOOTER_PROMPT_KEY = PromptsVariables.FOOTER_PROMPT.value
+
 class NLPAsyncController(BaseAsyncController):
-    def __init__(self, generation_client, embedding_client, vectordb_client, template_parser: TemplateParser):
+    def __init__(self, generation_client, embedding_client, vectordb_client, template_parser: TemplateParser,
+                 semantic_cache: SemanticCache = None, search_cache: SemanticCache = None):
         """
         Initializes the Async NLP Controller.
+        'semantic_cache' is optional; without it every RAG question hits the LLM.
+        'search_cache' is optional; without it every search hits the vector DB.
         """
         super().__init__()
         self.generation_client = generation_client
         self.embedding_client = embedding_client
         self.vectordb_client = vectordb_client
         self.template_parser = template_parser
+        self.semantic_cache = semantic_cache
+        self.search_cache = search_cache
 
     def create_collection_name(self, project_id: int):
         return f"Collection_{project_id}".strip()
     
+    def _invalidate_caches(self, project: Project):
+        """Drops the project's cached search results and answers once its collection changes."""
+        if self.search_cache is not None:
+            self.search_cache.invalidate(scope=project.project_id)
+        if self.semantic_cache is not None:
+            self.semantic_cache.invalidate(scope=project.project_id)
+
     async def reset_vector_db_collection(self, project: Project):
         collection_name = self.create_collection_name(project_id=project.project_id)
+        self._invalidate_caches(project)
         return await self.vectordb_client.delete_collection(collection_name=collection_name)
     
     async def get_vector_collection_info(self, project: Project):
@@ -34,104 +54,151 @@ class NLPAsyncController(BaseAsyncController):
             json.dumps(collection_info, default=lambda x: x.__dict__)
         )
     
+    async def ensure_collection(self, project: Project, do_reset: bool = False):
+        """
+        Creates (and optionally resets) the project's collection once per indexing run,
+        so the paging loop doesn't pay a metadata round-trip on every page.
+        """
+        collection_name = self.create_collection_name(project_id=project.project_id)
+        if do_reset:
+            self._invalidate_caches(project)
+        return await self.vectordb_client.create_collection(
+            collection_name=collection_name,
+            embedding_size=self.embedding_client.embedding_size,
+            do_reset=do_reset
+        )
+
     async def index_into_vector_db(self, project: Project, 
                                    chunks: List[DataChunk], 
-                                   chunks_ids: List[int], 
-                                   do_reset: bool = False):
+                                   chunks_ids: List[int]):
         """
         Handles the full indexing pipeline asynchronously.
+        Assumes ensure_collection() was already awaited for this project.
         """
         collection_name = self.create_collection_name(project_id=project.project_id)
         texts = [c.chunk_text for c in chunks]
         metadata = [i.chunk_metadata for i in chunks]
 
-        # 1. Offload heavy embedding to a worker thread
-        vectors = await asyncio.to_thread(
-            self.embedding_client.embed_batch,
+        # 1. Embed the whole page; providers dispatch sub-batches concurrently
+        vectors = await self.embedding_client.embed_batch(
             texts=texts,
             document_type=DocumentTypeEnum.DOCUMENT.value
         )
 
-        if not vectors:
+        if vectors is None or len(vectors) == 0:
             self.logger.error("Indexing failed: No vectors generated.")
             return False
 
-        # 2. Create collection (Async database call)
-        await self.vectordb_client.create_collection(
-            collection_name=collection_name,
-            embedding_size=self.embedding_client.embedding_size,
-            do_reset=do_reset
-        )
-
-        # 3. High-throughput async insertion
+        # 2. High-throughput async insertion; ensure_collection() already made sure
+        # the collection exists, so skip the per-page existence check
         result = await self.vectordb_client.insert_many(
             collection_name=collection_name,
             texts=texts,
             vectors=vectors,
             metadatas=metadata,
-            record_ids=chunks_ids
+            record_ids=chunks_ids,
+            assume_exists=True
         )
+        # Cached results and answers for this project no longer reflect the collection
+        self._invalidate_caches(project)
 
         return result
 
-    async def search_vector_db_collection(self, project: Project, text: str, limit: int = 10):
+    async def search_vector_db_collection(self, project: Project, text: str, limit: int = 10,
+                                          vector=None):
         """
         Asynchronous semantic search.
+        Pass 'vector' when the query was already embedded to skip a second embed call.
         """
         
         collection_name = self.create_collection_name(project_id=project.project_id)
 
-        # 1. Offload single-text embedding to a worker thread
-        # This fixes the "TypeError: object list can't be used in 'await' expression"
-        vector = await asyncio.to_thread(
-            self.embedding_client.embed_text,
-            text=text,
-            document_type=DocumentTypeEnum.QUERY.value
-        )
+        # 1. Embed the query; providers coalesce concurrent queries into shared requests
+        if vector is None:
+            vector = await self.embedding_client.embed_text(
+                text=text,
+                document_type=DocumentTypeEnum.QUERY.value
+            )
 
-        if not vector or len(vector) == 0:
+        if vector is None or len(vector) == 0:
             return []
 
-        # 2. Execute the async search against the vector store
+        # 2. Serve re-issued (near-identical) query vectors from the search cache; an
+        # entry is only reused if it was fetched with at least this many results
+        if self.search_cache is not None:
+            cached = self.search_cache.get(vector, scope=project.project_id)
+            if cached is not None and cached[0] >= limit:
+                return cached[1][:limit]
+
+        # 3. Execute the async search against the vector store
         results = await self.vectordb_client.search_by_vector(
             collection_name=collection_name,
             vector=vector,
             limit=limit
         )
 
-        return results if results else []
+        if not results:
+            return []
+
+        if self.search_cache is not None:
+            self.search_cache.put(vector, (limit, results), scope=project.project_id)
+        return results
     
-    async def asnwer_rag_question(self, project: Project, query: str, limit: int = 10):
-        answer, full_prompt, chat_history = None, None, None
-        
+    async def _lookup_semantic_cache(self, project: Project, query: str):
+        """
+        Embeds the query and checks the semantic cache for this project.
+
+        Returns:
+            (cached, query_vector): 'cached' is the stored (answer, full_prompt, chat_history)
+            on a hit, else None. 'query_vector' is None when no cache is configured.
+        """
+        if self.semantic_cache is None:
+            return None, None
+
+        query_vector = await self.embedding_client.embed_text(
+            text=query,
+            document_type=DocumentTypeEnum.QUERY.value
+        )
+        if query_vector is None:
+            return None, None
+
+        return self.semantic_cache.get(query_vector, scope=project.project_id), query_vector
+
+    async def construct_rag_prompt(self, project: Project, query: str, limit: int = 10,
+                                   query_vector=None):
+        """
+        Retrieves related chunks and renders the RAG prompt templates.
+
+        Returns:
+            (full_prompt, chat_history), or (None, None) if nothing was retrieved.
+        """
         # Step 1: Retrieve related documents (FIX: Added await)
         retrieved_documents = await self.search_vector_db_collection(
             project=project,
             text=query,
-            limit=limit
+            limit=limit,
+            vector=query_vector
         )
         
         if not retrieved_documents:
-            return answer, full_prompt, chat_history
+            return None, None
 
         # Step 2: Construct Prompt LLM (FIX: Added awaits for async template parser)
         system_prompt = await self.template_parser.get(
-            TemplateDirectoriesAndFilesEnums.RAG.value,
-            PromptsVariables.SYSTEM_PROMPT.value # Ensure this key exists in your enums
+            _RAG_GROUP,
+            _SYSTEM_PROMPT_KEY # Ensure this key exists in your enums
         )
         
-        # Process document templates asynchronously for maximum speed
-        doc_template_tasks = [
-            self.template_parser.get(
-                TemplateDirectoriesAndFilesEnums.RAG.value,
-                PromptsVariables.DOCUMENT_PROMPT.value, 
+        # Awaited in turn: after the first call the template is cached and get() never
+        # suspends, so a gather() here would only add one task per document
+        doc_prompts_list = [
+            await self.template_parser.get(
+                _RAG_GROUP,
+                _DOCUMENT_PROMPT_KEY, 
                 {"doc_num": idx + 1, "chunk_text": self.generation_client.process_text(doc.text)}
             )
             for idx, doc in enumerate(retrieved_documents)
         ]
-        
-        # Execute all string substitutions in parallel
-        doc_prompts_list = await asyncio.gather(*doc_template_tasks)
 
         # Clean up the list to remove any None values returned by the parser
         filtered_prompts = [p for p in doc_prompts_list if p is not None]
@@ -142,8 +209,8 @@ class NLPAsyncController(BaseAsyncController):
             documents_prompts = "\n".join(filtered_prompts)
 
         footer_prompt = await self.template_parser.get(
-            TemplateDirectoriesAndFilesEnums.RAG.value,
-            PromptsVariables.FOOTER_PROMPT.value,{"query": query}
+            _RAG_GROUP,
+            _FOOTER_PROMPT_KEY,{"query": query}
         )
         
         # Construct chat history using provider-specific roles
@@ -156,11 +223,71 @@ class NLPAsyncController(BaseAsyncController):
 
         full_prompt = "\n\n".join([documents_prompts, footer_prompt])
 
-        # Step 3: Generate Answer (Offload blocking sync LLM call to a thread)
-        answer = await asyncio.to_thread(
-            self.generation_client.generate_text,
+        return full_prompt, chat_history
+
+    async def asnwer_rag_question(self, project: Project, query: str, limit: int = 10,
+                                  no_cache: bool = False):
+        answer, full_prompt, chat_history = None, None, None
+
+        # Step 0: Serve near-identical questions for this project from the semantic cache
+        cached, query_vector = None, None
+        if not no_cache:
+            cached, query_vector = await self._lookup_semantic_cache(project=project, query=query)
+        if cached is not None:
+            return cached
+
+        full_prompt, chat_history = await self.construct_rag_prompt(
+            project=project, query=query, limit=limit, query_vector=query_vector
+        )
+        if full_prompt is None:
+            return answer, full_prompt, chat_history
+
+        # Step 3: Generate Answer (providers are async and enforce their own timeouts)
+        answer = await self.generation_client.generate_text(
             prompt=full_prompt,
             chat_history=chat_history
         )
 
-        return answer, full_prompt, chat_history
\ No newline at end of file
+        # Step 4: Remember successful answers for similar future questions
+        if answer and query_vector is not None:
+            self.semantic_cache.put(
+                query_vector, (answer, full_prompt, chat_history), scope=project.project_id
+            )
+
+        return answer, full_prompt, chat_history
+
+    async def stream_rag_answer(self, project: Project, query: str, limit: int = 10,
+                                no_cache: bool = False):
+        """
+        Streaming variant of asnwer_rag_question: yields answer text as it is generated.
+        Yields nothing if no related documents were found. Errors from the generation
+        stream propagate to the caller, and a failed answer is never cached.
+        """
+        cached, query_vector = None, None
+        if not no_cache:
+            cached, query_vector = await self._lookup_semantic_cache(project=project, query=query)
+        if cached is not None:
+            yield cached[0]
+            return
+
+        full_prompt, chat_history = await self.construct_rag_prompt(
+            project=project, query=query, limit=limit, query_vector=query_vector
+        )
+        if full_prompt is None:
+            return
+
+        pieces = []
+        async for piece in self.generation_client.generate_text_stream(
+            prompt=full_prompt,
+            chat_history=chat_history
+        ):
+            pieces.append(piece)
+            yield piece
+
+        # Only reached when the stream completed: a failure raised above, so a
+        # truncated answer never lands in the semantic cache
+        answer = "".join(pieces)
+        if answer and query_vector is not None:
+            self.semantic_cache.put(
+                query_vector, (answer, full_prompt, chat_history), scope=project.project_id
+            )
\ No newline at end of file
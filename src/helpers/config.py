@@ -1,23 +1,7 @@
 import os
-from enum import Enum
+from functools import lru_cache
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from models.enums.TemplatesEnum import TemplateLanguagesEnums
-# --- Enums for Type Safety ---
-
-class LLMEnums(Enum):
-    OPENAI = "openai"
-    COHERE = "cohere"
-    ANTHROPIC = "anthropic"
-
-class VectorDBEnums(Enum):
-    QDRANT = "QDRANT"
-    AsyncQDRANT = "AsyncQDRANT"
-    MILVUS = "MILVUS"
-    AsyncMILVUS = "AsyncMILVUS"
-
-class DocumentTypeEnum(Enum):
-    DOCUMENT = "document"
-    QUERY = "query"
 
 # --- Path Resolution ---
 current_file_path = os.path.abspath(__file__)
@@ -57,9 +41,36 @@ class Settings(BaseSettings):
     DEFUALT_OUTPUT_MAX_TOKENS: int = 200
     DEFAULT_GENERATION_TEMPERATURE: float = 0.1
 
+    # Max number of query embeddings kept in the in-process LRU cache
+    EMBED_CACHE_SIZE: int = 10000
+
+    # Per-attempt timeout (seconds) for generation calls, and retries after a timeout
+    LLM_REQUEST_TIMEOUT: float = 15.0
+    LLM_MAX_RETRIES: int = 2
+
+    # SQLite file (under assets/database) caching document embeddings across runs; empty disables it
+    EMBEDDING_CACHE_NAME: str = "embedding_cache"
+
+    # Semantic answer cache: max entries, and cosine similarity that counts as "same question"
+    SEMANTIC_CACHE_SIZE: int = 1024
+    SEMANTIC_CACHE_THRESHOLD: float = 0.95
+    # Seconds before a cached answer stops matching (0 = never expires)
+    SEMANTIC_CACHE_TTL: int = 3600
+
+    # Vector search result cache: repeated (or ~identical) query vectors skip the vector DB
+    SEARCH_CACHE_SIZE: int = 1024
+    SEARCH_CACHE_THRESHOLD: float = 0.99
+    SEARCH_CACHE_TTL: int = 60
+
     # Provider Keys
     OPENAI_API_KEY: str = None
     OPENAI_API_URL: str = None
+    # Route OpenAI requests through aiohttp (scales better under many concurrent embed calls)
+    OPENAI_USE_AIO_TRANSPORT: bool = False
+    # Ask streamed completions for a final usage chunk; some OpenAI-compatible endpoints reject it
+    OPENAI_STREAM_INCLUDE_USAGE: bool = False
+    # Embedding sub-batches in flight at once; lower it if you keep hitting rate limits
+    OPENAI_MAX_CONCURRENT_EMBED: int = 8
     COHERE_API_KEY: str = None
 
     # VectorDB Configuration (UPDATED for Scale)
@@ -69,6 +80,11 @@ class Settings(BaseSettings):
     # Add these for remote clusters/Docker
     VECTOR_DB_URL: str = None
     VECTOR_DB_API_KEY: str = None
+    # Use gRPC (packed vectors) instead of REST/JSON for remote Qdrant
+    VECTOR_DB_PREFER_GRPC: bool = True
+    VECTOR_DB_GRPC_PORT: int = 6334
+    # Keep payloads and the HNSW graph of new Qdrant collections in RAM (default: on disk)
+    VECTOR_DB_HIGH_RAM: bool = False
 
     model_config = SettingsConfigDict(
         env_file=env_path,
@@ -80,5 +96,7 @@ class Settings(BaseSettings):
     DEFAULT_LANG: str = TemplateLanguagesEnums.En.value
     PRIMARY_LANG: str = TemplateLanguagesEnums.En.value
 
+@lru_cache
 def get_settings():
+    # Parsed once per process: Settings() re-reads .env and re-validates every field
     return Settings()
\ No newline at end of file
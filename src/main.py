@@ -3,13 +3,17 @@ from contextlib import asynccontextmanager
 from routes import base, data, nlp
 from motor.motor_asyncio import AsyncIOMotorClient
 from helpers.config import get_settings
-from stores.llm.LLMProvidorFactory import LLMProviderFactory
+from stores.llm.LLMProviderFactory import LLMProviderFactory
+from stores.llm.SemanticCache import SemanticCache
 from stores.vector_db.VectorDBProviderFactory import VectorDBProviderFactory
 from stores.templates import TemplateParser
 from models.enums.TemplatesEnum import TemplateLanguagesEnums
 from urllib.parse import quote_plus # To handle special characters in passwords
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
+import logging
+
+logger = logging.getLogger('uvicorn.error')
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -43,6 +47,19 @@ async def lifespan(app: FastAPI):
         embedding_size=settings.EMBEDDING_MODEL_SIZE
     )
 
+    # Shared across requests: answers for near-identical questions are served from memory
+    app.semantic_cache = SemanticCache(
+        capacity=settings.SEMANTIC_CACHE_SIZE,
+        threshold=settings.SEMANTIC_CACHE_THRESHOLD,
+        ttl_seconds=settings.SEMANTIC_CACHE_TTL
+    )
+    # Same structure for retrieval: re-issued query vectors reuse the last search results
+    app.search_cache = SemanticCache(
+        capacity=settings.SEARCH_CACHE_SIZE,
+        threshold=settings.SEARCH_CACHE_THRESHOLD,
+        ttl_seconds=settings.SEARCH_CACHE_TTL
+    )
+
     # 4. Initialize Vector DB (FIXED: Added await for async create)
     # Since your factory's 'create' is now 'async def', you must await it.
     app.vectordb_client = await vector_DB_provider_factory.create(settings.VECTOR_DB_BACKEND)
@@ -52,7 +69,7 @@ async def lifespan(app: FastAPI):
             f"Check if '{settings.VECTOR_DB_BACKEND}' is correctly handled in the Factory."
         )    
     await app.vectordb_client.connect()
-    print(f"SUCCESS: VectorDB ({settings.VECTOR_DB_BACKEND}) connection established.")
+    logger.info("SUCCESS: VectorDB (%s) connection established.", settings.VECTOR_DB_BACKEND)
 
     app.template_parser = TemplateParser(default_language=settings.DEFAULT_LANG,
                                          language=settings.PRIMARY_LANG)
@@ -62,12 +79,15 @@ async def lifespan(app: FastAPI):
     # --- Shutdown ---
     # app.mongo_conn.close()
     await app.db_engine.dispose()
-    print("SUCCESS: MongoDB connection closed.")
+    logger.info("SUCCESS: Postgres connection closed.")
+
+    await llm_provider_factory.close()
+    logger.info("SUCCESS: LLM clients closed.")
 
     if hasattr(app, 'vectordb_client'):
         # FIXED: Added await for the disconnection call
         await app.vectordb_client.disconnect()
-        print("SUCCESS: VectorDB connection closed.")
+        logger.info("SUCCESS: VectorDB connection closed.")
 
 # Initialize FastAPI with the corrected lifespan
 app = FastAPI(lifespan=lifespan)
@@ -47,11 +47,18 @@ class ChunkModel(BaseDataModel):
             result = await self.db_session.execute(stmt)
             return result.rowcount
 
-    async def get_project_chunks(self, project_id: int, page_no: int = 1, page_size: int = 50):
+    async def get_project_chunks(self, project_id: int, last_chunk_id: int = 0, page_size: int = 50):
+            """
+            Keyset pagination: seeks past the last seen chunk_id instead of using OFFSET,
+            so every page costs the same regardless of how deep into the project we are.
+            """
             stmt = (
                 select(DataChunk)
-                .where(DataChunk.chunk_project_id == project_id)
-                .offset((page_no - 1) * page_size)
+                .where(
+                    DataChunk.chunk_project_id == project_id,
+                    DataChunk.chunk_id > last_chunk_id
+                )
+                .order_by(DataChunk.chunk_id)
                 .limit(page_size)
             )
             result = await self.db_session.execute(stmt)
@@ -54,7 +54,7 @@ async def upload_data(request: Request, project_id: int, file: UploadFile,
             while chunk := await file.read(app_settings.FILE_DEFAULT_CHUNK_SIZE):
                 await f.write(chunk)
     except Exception as e:
-        logger.error(f"Error while uploading file: {e}")
+        logger.error("Error while uploading file: %s", e)
         return JSONResponse(
             status_code=status.HTTP_400_BAD_REQUEST,
             content={"signal": ResponseSignal.FILE_UPLOAD_FAILED.value}
@@ -133,8 +133,11 @@ async def process_endpoint(request: Request, project_id: int, process_request: P
     for asset_id, file_name in project_file_ids.items():
         file_content = await process_controller.get_file_content(file_id=file_name)
 
-        if not file_content:
-            logger.warning(f"Skipping file {file_name}: unable to load content.")
+        # any() stops at the first page with real text; isspace() avoids a strip() copy per page
+        if not file_content or not any(
+            not rec.page_content.isspace() for rec in file_content if rec.page_content
+        ):
+            logger.warning("Skipping file %s: unable to load content.", file_name)
             continue
 
         file_chunks = await process_controller.process_file_content(
@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Depends, status, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 import logging
 
 # Updated Imports
@@ -36,26 +36,33 @@ async def index_project(request: Request, project_id: int, push_request: PushReq
         generation_client=request.app.generation_client,
         embedding_client=request.app.embedding_client,
         vectordb_client=request.app.vectordb_client,
-        template_parser=request.app.template_parser
-        
+        template_parser=request.app.template_parser,
+        semantic_cache=request.app.semantic_cache,
+        search_cache=request.app.search_cache
+    )
+
+    # Create/reset the collection once, outside the paging loop
+    await nlp_controller.ensure_collection(
+        project=project,
+        do_reset=push_request.do_reset
     )
 
     has_records = True
-    page_no = 1
+    last_chunk_id = 0
     inserted_items_count = 0
     idx = 0 
 
     while has_records:
         page_chunks = await chunk_model.get_project_chunks(
             project_id=project.project_id, 
-            page_no=page_no
+            last_chunk_id=last_chunk_id
         )
         
         if not page_chunks: # Simplified check
             has_records = False
             break
             
-        page_no += 1
+        last_chunk_id = page_chunks[-1].chunk_id
         chunks_ids = list(range(idx, idx + len(page_chunks)))
         idx += len(page_chunks)    
 
@@ -63,7 +70,6 @@ async def index_project(request: Request, project_id: int, push_request: PushReq
         is_inserted = await nlp_controller.index_into_vector_db(
             project=project,
             chunks=page_chunks,
-            do_reset=push_request.do_reset,
             chunks_ids=chunks_ids
         )
         
@@ -90,8 +96,9 @@ async def get_project_index_info(request: Request, project_id: int, db_session:
         vectordb_client=request.app.vectordb_client,
         generation_client=request.app.generation_client,
         embedding_client=request.app.embedding_client,
-        template_parser=request.app.template_parser
-        
+        template_parser=request.app.template_parser,
+        semantic_cache=request.app.semantic_cache,
+        search_cache=request.app.search_cache
     )
 
     collection_info = await nlp_controller.get_vector_collection_info(project=project)
@@ -112,7 +119,9 @@ async def search_index(request: Request, project_id: int, search_request: Search
         vectordb_client=request.app.vectordb_client,
         generation_client=request.app.generation_client,
         embedding_client=request.app.embedding_client,
-        template_parser=request.app.template_parser
+        template_parser=request.app.template_parser,
+        semantic_cache=request.app.semantic_cache,
+        search_cache=request.app.search_cache
     )
 
     # Corrected the results logic to prevent crash if results is False
@@ -144,14 +153,17 @@ async def inswer_index(request: Request, project_id: int, search_request: Search
         vectordb_client=request.app.vectordb_client,
         generation_client=request.app.generation_client,
         embedding_client=request.app.embedding_client,
-        template_parser=request.app.template_parser
+        template_parser=request.app.template_parser,
+        semantic_cache=request.app.semantic_cache,
+        search_cache=request.app.search_cache
     )
 
     # FIX: Added 'await' here to resolve the TypeError
     answer, full_prompt, chat_history = await nlp_controller.asnwer_rag_question(
         project=project,
         query=search_request.text,
-        limit=search_request.limit
+        limit=search_request.limit,
+        no_cache=search_request.no_cache
     )
 
     if not answer:
@@ -167,4 +179,62 @@ async def inswer_index(request: Request, project_id: int, search_request: Search
             "full_prompt": full_prompt,
             "chat_history": chat_history
         }
+    )
+
+async def _resume_stream(first_piece, stream):
+    """
+    Yields the already-fetched first piece, then the rest of the stream.
+    An error after the first piece propagates, which aborts the chunked response
+    so the client sees an incomplete body rather than a clean (truncated) answer.
+    """
+    if first_piece is not None:
+        yield first_piece
+    try:
+        async for piece in stream:
+            yield piece
+    except Exception as e:
+        logger.error(f"RAG answer stream failed mid-response: {e}")
+        raise
+
+@nlp_router.post("/index/answer/stream/{project_id}")
+async def stream_answer_index(request: Request, project_id: int, search_request: SearchRequest, db_session: AsyncSession = Depends(get_db)):
+    """
+    Same as /index/answer but streams the answer as plain text while it is generated,
+    so clients can render the first tokens without waiting for the full response.
+    """
+    project_model = await ProjectModel.create_instance(db_session=db_session)
+    project = await project_model.get_project_or_create_one(project_id=project_id)
+
+    nlp_controller = NLPAsyncController(
+        vectordb_client=request.app.vectordb_client,
+        generation_client=request.app.generation_client,
+        embedding_client=request.app.embedding_client,
+        template_parser=request.app.template_parser,
+        semantic_cache=request.app.semantic_cache,
+        search_cache=request.app.search_cache
+    )
+
+    stream = nlp_controller.stream_rag_answer(
+        project=project,
+        query=search_request.text,
+        limit=search_request.limit,
+        no_cache=search_request.no_cache
+    )
+
+    # Pull the first piece before the 200 status is sent, so a generation failure
+    # up front is reported as an error response instead of an empty 200
+    try:
+        first_piece = await stream.__anext__()
+    except StopAsyncIteration:
+        first_piece = None
+    except Exception as e:
+        logger.error(f"RAG answer stream failed: {e}")
+        return JSONResponse(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                content={"signal": ResponseSignal.RAG_ANSWER_FAILED.value}
+            )
+
+    return StreamingResponse(
+        _resume_stream(first_piece, stream),
+        media_type="text/plain"
     )
\ No newline at end of file
@@ -6,4 +6,6 @@ class PushRequest(BaseModel):
 
 class SearchRequest(BaseModel):
     text: str
-    limit: Optional[int]= 5
\ No newline at end of file
+    limit: Optional[int]= 5
+    # Skip the semantic answer cache (no lookup, no store), e.g. for sensitive prompts
+    no_cache: Optional[bool] = False
\ No newline at end of file
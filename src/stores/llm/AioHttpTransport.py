@@ -0,0 +1,94 @@
+import asyncio
+import aiohttp
+import httpx
+
+
+class _AioHttpResponseStream(httpx.AsyncByteStream):
+    """
+    Response body that reads from the aiohttp response as httpx consumes it, so
+    streamed completions are forwarded chunk by chunk instead of buffered whole
+    (and 'sock_read' stays a per-read timeout rather than a whole-body one).
+    """
+
+    def __init__(self, response: aiohttp.ClientResponse, request: httpx.Request):
+        self._response = response
+        self._request = request
+
+    async def __aiter__(self):
+        try:
+            async for chunk in self._response.content.iter_any():
+                yield chunk
+        # Same mapping as handle_async_request, for errors while reading the body
+        except asyncio.TimeoutError as e:
+            raise httpx.ReadTimeout(str(e) or "Read timed out", request=self._request) from e
+        except aiohttp.ClientError as e:
+            raise httpx.ReadError(str(e), request=self._request) from e
+
+    async def aclose(self) -> None:
+        # Hands the connection back to the pool (or closes it if the body wasn't fully read)
+        self._response.release()
+
+
+class AioHttpTransport(httpx.AsyncBaseTransport):
+    """
+    httpx transport that sends requests through an aiohttp ClientSession.
+
+    The OpenAI SDK talks httpx; its default transport loses throughput as the
+    number of concurrent requests grows, which is exactly the bulk-embedding case.
+    Plugging this transport into the SDK's httpx client keeps the SDK API (retries,
+    typed errors, parsing) while aiohttp's connector does the actual I/O.
+    """
+
+    def __init__(self, limit: int = 100):
+        """
+        Args:
+            limit (int): Max simultaneous connections in the aiohttp connector
+        """
+        self._limit = limit
+        self._session = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        # Created lazily so it binds to the running event loop
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self._limit),
+                # httpx decodes gzip/br itself based on the response headers
+                auto_decompress=False
+            )
+        return self._session
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        # Map httpx's per-request timeouts onto aiohttp's
+        timeouts = request.extensions.get("timeout", {})
+        timeout = aiohttp.ClientTimeout(
+            total=None,
+            sock_connect=timeouts.get("connect"),
+            sock_read=timeouts.get("read")
+        )
+
+        try:
+            # Not entered as a context manager: the body is read later through the
+            # returned stream, which releases the response when httpx closes it
+            response = await self._get_session().request(
+                method=request.method,
+                url=str(request.url),
+                headers=request.headers.multi_items(),
+                data=await request.aread(),
+                timeout=timeout,
+                allow_redirects=False
+            )
+            return httpx.Response(
+                status_code=response.status,
+                headers=response.raw_headers,
+                stream=_AioHttpResponseStream(response, request),
+                request=request
+            )
+        # Re-raise as httpx errors so the SDK classifies them (timeout vs connection) as usual
+        except asyncio.TimeoutError as e:
+            raise httpx.TimeoutException(str(e) or "Request timed out", request=request) from e
+        except aiohttp.ClientError as e:
+            raise httpx.NetworkError(str(e), request=request) from e
+
+    async def aclose(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
@@ -0,0 +1,107 @@
+import asyncio
+import hashlib
+import logging
+import sqlite3
+import threading
+import numpy as np
+
+
+class EmbeddingCache:
+    """
+    Persistent on-disk cache of embedding vectors, backed by SQLite.
+
+    Re-indexing a project mostly re-embeds chunks that were embedded before; with
+    this cache those vectors come from a local disk read instead of a paid API call.
+    Rows are keyed by a digest of (provider, model, input type, processed text) and
+    hold the vector as a packed float32 blob.
+
+    SQLite calls block, so the public methods are async and run in a worker thread.
+    One connection is shared by those threads and serialized with a lock.
+    """
+
+    def __init__(self, db_path: str):
+        """
+        Args:
+            db_path (str): Path of the SQLite file (created if missing)
+        """
+        self.db_path = db_path
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        # WAL + NORMAL: readers don't block the writer and commits skip an fsync
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB NOT NULL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(provider: str, model_id: str, input_type: str, text: str) -> str:
+        """
+        Builds the cache key for one processed text.
+        Any change in provider, model or input type yields a different vector, so all are part of the key.
+        """
+        raw = "\x00".join([provider, model_id or "", input_type or "", text])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _get_many_sync(self, keys: list) -> dict:
+        found = {}
+        unique_keys = list(dict.fromkeys(keys))
+
+        with self._lock:
+            # Stay well under SQLite's bound-parameter limit
+            for i in range(0, len(unique_keys), 500):
+                chunk = unique_keys[i:i + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})", chunk
+                ).fetchall()
+                for key, blob in rows:
+                    found[key] = np.frombuffer(blob, dtype=np.float32)
+
+        return found
+
+    def _put_many_sync(self, keys: list, vectors) -> None:
+        rows = [
+            (key, np.asarray(vector, dtype=np.float32).tobytes())
+            for key, vector in zip(keys, vectors)
+        ]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)", rows
+            )
+            self._conn.commit()
+
+    async def get_many(self, keys: list) -> dict:
+        """
+        Looks up several keys at once.
+
+        Returns:
+            dict mapping each cached key to its (read-only) float32 vector.
+            Missing keys are simply absent; errors are logged and yield {}.
+        """
+        if not keys:
+            return {}
+        try:
+            return await asyncio.to_thread(self._get_many_sync, keys)
+        except Exception as e:
+            self.logger.error(f"Embedding cache read failed: {e}")
+            return {}
+
+    async def put_many(self, keys: list, vectors) -> None:
+        """
+        Stores vectors under their keys (overwriting existing rows).
+        A failed write is logged and otherwise ignored; the cache is best-effort.
+        """
+        if not keys:
+            return
+        try:
+            await asyncio.to_thread(self._put_many_sync, keys, vectors)
+        except Exception as e:
+            self.logger.error(f"Embedding cache write failed: {e}")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional
+import numpy as np
 
 class LLMInterface(ABC):
     """
@@ -53,7 +54,7 @@ class LLMInterface(ABC):
         pass
 
     @abstractmethod
-    def generate_text(self, prompt: str, chat_history: list=[], max_output_tokens: int = None, 
+    async def generate_text(self, prompt: str, chat_history: Optional[list] = None, max_output_tokens: int = None, 
                      temperature: float = None) -> str:
         """
         Generate text response from the LLM based on a prompt and optional chat history.
@@ -66,7 +67,9 @@ class LLMInterface(ABC):
                    In RAG: typically includes both retrieved context and user query
             chat_history: List of previous conversation messages for context
                          Format varies by provider (e.g., [{"role": "user", "content": "..."}])
-                         Default: empty list (no history)
+                         Default: None (no history)
+                         Never modified; callers that keep a conversation must append
+                         the prompt and the returned answer themselves
             max_output_tokens: Maximum tokens in generated response (overrides default)
                               Controls response length and API costs
                               Default: None (uses provider's default setting)
@@ -87,9 +90,24 @@ class LLMInterface(ABC):
         """
         pass
 
-    def embed_text(self, text: str, document_type: Optional[str] = None) -> List[float]:
-        """Convert a single string into a vector (used for queries)."""
-        pass
+    async def generate_text_stream(self, prompt: str, chat_history: list = None, max_output_tokens: int = None,
+                                   temperature: float = None):
+        """
+        Async generator yielding the generated text in pieces as they arrive.
+        
+        Providers with a native streaming API should override this. The default
+        falls back to generate_text() and yields the whole answer as one piece.
+        """
+        text = await self.generate_text(
+            prompt=prompt,
+            chat_history=chat_history if chat_history is not None else [],
+            max_output_tokens=max_output_tokens,
+            temperature=temperature
+        )
+        if text:
+            yield text
+
+    async def embed_text(self, text: str, document_type: Optional[str] = None) -> np.ndarray:
         """
         Convert text into a dense vector embedding for semantic search.
         
@@ -109,31 +127,33 @@ class LLMInterface(ABC):
                           differently for queries vs documents, improving retrieval accuracy.
         
         Returns:
-            List of floats representing the embedding vector
+            1-D L2-normalized float32 numpy array representing the embedding vector
             Length matches embedding_size set in set_embedding_model()
             Returns None if embedding fails (client not initialized, model not set, API error)
         
-        Implementation requirements:
-            - Validate client and embedding model are configured
-            - Preprocess text (truncation, cleaning)
-            - Handle document_type appropriately for provider
-            - Call provider's embedding API
-            - Extract and return float vector
-            - Handle errors gracefully with logging
+        Default implementation:
+            Delegates to embed_batch([text]), so single texts get the same
+            sub-batching, retry and normalization logic as batches. Providers only
+            override this to add something on top (e.g. caching or coalescing).
         
         Usage in RAG:
             - Index time: embed_text(document_chunk, document_type=None) → store in MongoDB
             - Query time: embed_text(user_query, document_type=LLMEnums.QUERY) → search MongoDB
         """
-        pass
+        vectors = await self.embed_batch([text], document_type=document_type)
+        if vectors is None or len(vectors) == 0:
+            return None
+        return vectors[0]
     
     @abstractmethod
-    def embed_batch(self, texts: List[str], document_type: Optional[str] = None) -> List[List[float]]:
+    async def embed_batch(self, texts: List[str], document_type: Optional[str] = None) -> np.ndarray:
         """
-        Convert a list of strings into a list of vectors in a single call.
+        Convert a list of strings into a (len(texts), embedding_size) float32 array in a single call.
+        Rows are L2-normalized, so the 'dot' distance metric ranks exactly like 'cosine'.
         
         This is the high-performance method for RAG indexing. 
-        Implementations should include sub-batching and retry logic.
+        Implementations should include sub-batching and retry logic, and must
+        not block the event loop (use an async client or offload to a thread).
         """
         pass
 
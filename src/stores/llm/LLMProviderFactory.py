@@ -0,0 +1,70 @@
+import os
+from .providers import CohereProvider, OpenAIProvider
+from .EmbeddingCache import EmbeddingCache
+from .LLMEnums import LLMEnums
+from helpers.config import Settings
+
+class LLMProviderFactory:
+    def __init__(self, config: Settings = None):
+        self.config = config
+        self._embedding_cache = None
+
+    def get_embedding_cache(self):
+        """
+        Returns the SQLite embedding cache shared by every provider this factory creates,
+        opening it on first use. Returns None when EMBEDDING_CACHE_NAME is empty (cache disabled).
+        """
+        if not self.config.EMBEDDING_CACHE_NAME:
+            return None
+
+        if self._embedding_cache is None:
+            base_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+            database_dir = os.path.join(base_dir, "assets", "database")
+            os.makedirs(database_dir, exist_ok=True)
+            self._embedding_cache = EmbeddingCache(
+                db_path=os.path.join(database_dir, f"{self.config.EMBEDDING_CACHE_NAME}.sqlite")
+            )
+        return self._embedding_cache
+
+    async def close(self):
+        """
+        Releases resources shared by the providers: HTTP connection pools and the embedding cache.
+        """
+        await OpenAIProvider.close_clients()
+        await CohereProvider.close_clients()
+        if self._embedding_cache is not None:
+            self._embedding_cache.close()
+            self._embedding_cache = None
+
+    def create(self, provider_name: str):
+        """
+        Instantiates LLM providers. 
+        Ensure these providers use AsyncClients internally (e.g., OpenAI(AsyncClient)).
+        """
+        common_params = {
+            "api_key": self.config.OPENAI_API_KEY if provider_name == LLMEnums.OPENAI.value else self.config.COHERE_API_KEY,
+            "default_input_max_tokens": self.config.DEFAULT_INPUT_MAX_TOKENS,
+            "default_output_max_tokens": self.config.DEFUALT_OUTPUT_MAX_TOKENS,
+            "temperature": self.config.DEFAULT_GENERATION_TEMPERATURE,
+            "embedding_cache": self.get_embedding_cache()
+        }
+
+        if provider_name == LLMEnums.OPENAI.value:
+            return OpenAIProvider(
+                **common_params,
+                api_url=self.config.OPENAI_API_URL,
+                use_aio_transport=self.config.OPENAI_USE_AIO_TRANSPORT,
+                stream_include_usage=self.config.OPENAI_STREAM_INCLUDE_USAGE,
+                max_concurrency=self.config.OPENAI_MAX_CONCURRENT_EMBED
+            )
+        
+        elif provider_name == LLMEnums.COHERE.value:
+            return CohereProvider(
+                **common_params,
+                embed_cache_size=self.config.EMBED_CACHE_SIZE,
+                request_timeout=self.config.LLM_REQUEST_TIMEOUT,
+                max_retries=self.config.LLM_MAX_RETRIES
+            )
+         
+        else:
+            raise ValueError(f"Unsupported LLM provider: {provider_name}")
\ No newline at end of file
@@ -0,0 +1,134 @@
+import time
+import numpy as np
+
+
+class SemanticCache:
+    """
+    In-memory semantic cache for LLM answers.
+
+    Stores (embedding, value) pairs and serves the cached value for any new embedding
+    whose cosine similarity with a stored one reaches 'threshold', so paraphrased
+    questions skip the chat API entirely. A lookup is one matrix-vector product over
+    the live entries; once 'capacity' is reached the least recently used entry is
+    overwritten.
+
+    Every entry belongs to a 'scope' (the project id in RAG) and only matches lookups
+    made in the same scope, since the same question has different answers per project.
+    Entries older than 'ttl_seconds' never match, so answers follow re-indexed data.
+    """
+
+    def __init__(self, capacity: int = 1024, threshold: float = 0.95, ttl_seconds: float = 3600):
+        """
+        Args:
+            capacity (int): Maximum number of cached entries (0 disables the cache)
+            threshold (float): Minimum cosine similarity for a lookup to count as a hit
+            ttl_seconds (float): Max age of an entry before it stops matching (0 = no expiry)
+        """
+        self.capacity = capacity
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+
+        # Row i of every array below describes the same cache slot
+        self._vectors = None  # (capacity, dim) float32, allocated on first put()
+        self._scopes = np.zeros(capacity, dtype=np.int64)
+        self._last_used = np.zeros(capacity, dtype=np.int64)
+        self._created_at = np.zeros(capacity, dtype=np.float64)
+        self._values = [None] * capacity
+
+        self._size = 0   # Number of occupied slots
+        self._clock = 0  # Monotonic counter used as the LRU timestamp
+
+    @staticmethod
+    def _normalize(vector) -> np.ndarray:
+        """
+        Returns the vector as a unit-length float32 array, so dot product == cosine.
+        """
+        vector = np.asarray(vector, dtype=np.float32).ravel()
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def get(self, vector, scope: int = 0):
+        """
+        Looks up the most similar cached entry in 'scope'.
+
+        Args:
+            vector: Embedding of the incoming query
+            scope (int): Namespace the entry must belong to (e.g. project id)
+
+        Returns:
+            The cached value if the best match reaches the threshold, otherwise None
+        """
+        if self._size == 0:
+            return None
+
+        query = self._normalize(vector)
+        if query.shape[0] != self._vectors.shape[1]:
+            return None
+
+        # 1. Cosine similarity against every live entry in one BLAS call
+        scores = self._vectors[:self._size] @ query
+
+        # 2. Entries from other scopes, or past their TTL, can never match
+        scores[self._scopes[:self._size] != scope] = -np.inf
+        if self.ttl_seconds:
+            expired = self._created_at[:self._size] < time.monotonic() - self.ttl_seconds
+            scores[expired] = -np.inf
+            # Expired slots are the first to be reused
+            self._last_used[:self._size][expired] = 0
+
+        best = int(np.argmax(scores))
+        if scores[best] < self.threshold:
+            return None
+
+        self._clock += 1
+        self._last_used[best] = self._clock
+        return self._values[best]
+
+    def put(self, vector, value, scope: int = 0):
+        """
+        Stores 'value' under the given embedding, evicting the LRU entry if full.
+
+        Args:
+            vector: Embedding of the query that produced 'value'
+            value: Anything to hand back on a later hit (e.g. the generated answer)
+            scope (int): Namespace for the entry (e.g. project id)
+        """
+        if self.capacity <= 0:
+            return
+
+        query = self._normalize(vector)
+
+        # First entry, or the embedding model (and so the dimension) changed: start over
+        if self._vectors is None or query.shape[0] != self._vectors.shape[1]:
+            self._vectors = np.zeros((self.capacity, query.shape[0]), dtype=np.float32)
+            self._size = 0
+
+        if self._size < self.capacity:
+            slot = self._size
+            self._size += 1
+        else:
+            slot = int(np.argmin(self._last_used))
+
+        self._vectors[slot] = query
+        self._scopes[slot] = scope
+        self._values[slot] = value
+        self._created_at[slot] = time.monotonic()
+
+        self._clock += 1
+        self._last_used[slot] = self._clock
+
+    def invalidate(self, scope: int = 0):
+        """
+        Drops every entry in 'scope' (e.g. after the project's data was re-indexed).
+        The freed slots are the first to be reused.
+
+        Args:
+            scope (int): Namespace to clear
+        """
+        if self._size == 0:
+            return
+
+        stale = self._scopes[:self._size] == scope
+        # -1 is never a project id, so these slots can't match any lookup again
+        self._scopes[:self._size][stale] = -1
+        self._last_used[:self._size][stale] = 0
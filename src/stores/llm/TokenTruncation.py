@@ -0,0 +1,49 @@
+import re
+from itertools import islice
+from functools import lru_cache
+
+# Rough stand-in for the model tokenizer: every word and every punctuation mark
+# counts as one token. Sub-word tokenizers split rare or long words further, so
+# the real count can run somewhat higher; budgets should leave headroom below
+# the model's hard input limit.
+_APPROX_TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]")
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """
+    Trims 'text' to at most 'max_tokens' approximate tokens and strips whitespace.
+
+    Every token spans at least one character, so texts no longer than the budget
+    are returned (stripped) without being scanned at all.
+    """
+    if len(text) <= max_tokens:
+        return text.strip()
+    return _truncate_long_text(text, max_tokens)
+
+
+def truncate_many(texts: list[str], max_tokens: int) -> list[str]:
+    """
+    truncate_to_tokens over a whole batch in one pass.
+    The length check is inlined, so the common case (every chunk already fits)
+    costs one strip() per text and no per-item function calls.
+    """
+    return [
+        text.strip() if len(text) <= max_tokens else _truncate_long_text(text, max_tokens)
+        for text in texts
+    ]
+
+
+@lru_cache(maxsize=4096)
+def _truncate_long_text(text: str, max_tokens: int) -> str:
+    """
+    Cuts 'text' right after the last approximate token that fits in 'max_tokens'.
+    Memoized: the system prompt, re-asked questions and re-indexed chunks then
+    skip the regex scan.
+    """
+    last_token = None
+    for last_token in islice(_APPROX_TOKEN_PATTERN.finditer(text), max_tokens):
+        pass
+    if last_token is None:
+        return text.strip()
+
+    return text[:last_token.end()].strip()
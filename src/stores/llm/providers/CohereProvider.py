@@ -1,10 +1,41 @@
 from ..LLMInterface import LLMInterface
-from ..LLMEnums import CohereEnums, DocumentTypeEnum, LLMEnums
+from ..LLMEnums import CohereEnums, DocumentTypeEnum
+from ..TokenTruncation import truncate_to_tokens, truncate_many
 from helpers.config import get_settings
 import cohere
+import httpx
+import numpy as np
+import asyncio
+import hashlib
+import json
 import logging
-import time
 import random
+from collections import OrderedDict
+
+# Internal document type -> Cohere input_type, computed once at import.
+# Callers pass either the enum member or its .value, so both are keys.
+_INPUT_TYPE_MAP = {
+    DocumentTypeEnum.QUERY: CohereEnums.QUERY.value,
+    DocumentTypeEnum.QUERY.value: CohereEnums.QUERY.value,
+    DocumentTypeEnum.DOCUMENT: CohereEnums.DOCUMENT.value,
+    DocumentTypeEnum.DOCUMENT.value: CohereEnums.DOCUMENT.value,
+    None: CohereEnums.DOCUMENT.value,
+}
+_DEFAULT_INPUT_TYPE = CohereEnums.DOCUMENT.value
+
+# Full-jitter backoff: sleep a random time in [0, base * 2^attempt], never more than the cap
+_BACKOFF_BASE_SECONDS = 1.0
+_BACKOFF_CAP_SECONDS = 60.0
+
+# Transient failures worth backing off and retrying: rate limits, overloaded or
+# timed-out upstreams, and network hiccups. Anything else is a real error.
+_RETRYABLE_ERRORS = (
+    cohere.TooManyRequestsError,
+    cohere.ServiceUnavailableError,
+    cohere.GatewayTimeoutError,
+    httpx.TimeoutException,
+    httpx.NetworkError,
+)
 
 
 class CohereProvider(LLMInterface):
@@ -12,12 +43,46 @@ class CohereProvider(LLMInterface):
     Concrete implementation of LLMInterface for Cohere API integration.
     Provides text generation and embedding capabilities using Cohere's models.
     """
+
+    # One AsyncClient per API key, shared by every provider instance in the process
+    # so they reuse the same HTTP connection pool (and its warm TLS sessions).
+    _CLIENTS: dict = {}
+    # The httpx pools behind those clients, kept so they can be closed on shutdown
+    _HTTP_CLIENTS: dict = {}
+
+    @classmethod
+    def _get_client(cls, api_key: str):
+        """
+        Returns the shared AsyncClient for this API key, creating it on first use.
+        The pool is sized for many concurrent embedding sub-batches with keep-alive reuse.
+        """
+        client = cls._CLIENTS.get(api_key)
+        if client is None:
+            http_client = httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+            )
+            client = cohere.AsyncClient(api_key, httpx_client=http_client)
+            cls._CLIENTS[api_key] = client
+            cls._HTTP_CLIENTS[api_key] = http_client
+        return client
+
+    @classmethod
+    async def close_clients(cls):
+        """
+        Closes every shared client's connection pool. Called on app shutdown.
+        """
+        for http_client in cls._HTTP_CLIENTS.values():
+            await http_client.aclose()
+        cls._HTTP_CLIENTS.clear()
+        cls._CLIENTS.clear()
     
     def __init__(self, api_key: str = None, default_input_max_tokens: int = 1000,
                  default_output_max_tokens: int = 1000,
-                 temperature: float = 0.1):
-        settings = get_settings()
-        self.api_key = api_key or settings.COHERE_API_KEY
+                 temperature: float = 0.1, max_concurrency: int = 16,
+                 embed_cache_size: int = 10000, request_timeout: float = 15.0,
+                 max_retries: int = 2, embedding_cache=None):
+        # Settings are only loaded when the factory didn't pass a key explicitly
+        self.api_key = api_key or get_settings().COHERE_API_KEY
         
         # Maximum tokens to process from input text (truncation limit)
         self.default_input_max_tokens = default_input_max_tokens
@@ -27,14 +92,30 @@ class CohereProvider(LLMInterface):
         
         # Controls randomness in generation (0.0 = deterministic, higher = more creative)
         self.default_generation_temperature = temperature
+
+        # Per-attempt timeout for generation calls and how many times to retry after one
+        self.request_timeout = request_timeout
+        self.max_retries = max_retries
         
         # Model identifiers - set later via setter methods
         self.generation_model_id = None  # e.g., "command-r-plus"
         self.embedding_model_id = None   # e.g., "embed-english-v3.0"
         self.embedding_size = None   
         
-        # Initialize Cohere client with API key
-        self.client = cohere.Client(self.api_key)
+        # Initialize Cohere async client with API key (used for chat and embeddings)
+        self.aclient = CohereProvider._get_client(self.api_key)
+        # Caps how many embed requests are in flight at once
+        self._embed_semaphore = asyncio.Semaphore(max_concurrency)
+        # LRU of query embeddings: (model_id, input_type, text digest) -> vector
+        self._embed_cache = OrderedDict()
+        self._embed_cache_size = embed_cache_size
+        # Optional persistent (SQLite) cache of document embeddings, shared via the factory
+        self.embedding_cache = embedding_cache
+        # Micro-batching for embed_text: (processed text, input_type, future) waiting to be sent
+        self._pending = []
+        self._batch_task = None
+        self._coalesce_max_batch = 96     # Cohere accepts up to 96 texts per embed request
+        self._coalesce_delay = 0.010      # Max time (seconds) a text waits for company
         self.enums = CohereEnums
         # Logger for tracking operations and debugging
         self.logger = logging.getLogger(__name__)
@@ -67,57 +148,121 @@ class CohereProvider(LLMInterface):
         Preprocess text before sending to Cohere API.
         Truncates to max input tokens and removes extra whitespace.
         
+        The limit is applied to approximate tokens (words and punctuation),
+        not characters, so English text is no longer cut at ~1/4 of the budget.
+        
         Args:
             text: Raw input text
             
         Returns:
             Processed text within token limits
         """
-        return text[:self.default_input_max_tokens].strip()
+        return truncate_to_tokens(text, self.default_input_max_tokens)
 
-    def generate_text(self, prompt: str, chat_history: list = [], max_output_tokens: int = None,
+    def _to_message_text(self, prompt) -> str:
+        """
+        Cohere's 'message' parameter MUST be a string.
+        We extract just the text, not the dictionary from construct_prompt.
+        """
+        if isinstance(prompt, dict):
+            return prompt.get("content", prompt.get("message", str(prompt)))
+        # Just in case, process the raw string for truncation/cleaning
+        return self.process_text(prompt)
+
+    async def generate_text(self, prompt: str, chat_history: list = None, max_output_tokens: int = None,
                   temperature: float = None) -> str:
         """
         Generate text using Cohere's chat endpoint.
         Fixed to ensure 'message' is a string to avoid 422 errors.
+        
+        Each attempt is capped at 'request_timeout' seconds; a timed-out call is
+        abandoned and resubmitted up to 'max_retries' times so one stuck request
+        doesn't set the tail latency of the whole RAG answer.
         """
-        if not self.client or not self.generation_model_id:
+        if not self.aclient or not self.generation_model_id:
             self.logger.error("Cohere Client or Model ID not configured.")
             return None
         
         # 1. Cohere's 'message' parameter MUST be a string.
-        # We extract just the text, not the dictionary from construct_prompt.
-        message_text = prompt
-        if isinstance(prompt, dict):
-            message_text = prompt.get("content", prompt.get("message", str(prompt)))
-        else:
-            # Just in case, process the raw string for truncation/cleaning
-            message_text = self.process_text(prompt)
+        message_text = self._to_message_text(prompt)
+        if chat_history is None:
+            chat_history = []
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = await asyncio.wait_for(
+                    self.aclient.chat(
+                        model=self.generation_model_id,
+                        chat_history=chat_history, 
+                        message=message_text, # This is a string
+                        max_tokens=max_output_tokens if max_output_tokens else self.default_output_max_tokens,
+                        temperature=temperature if temperature else self.default_generation_temperature
+                    ),
+                    timeout=self.request_timeout
+                )
+                
+                if not response or not response.text:
+                    return None
+                    
+                return response.text
+
+            except asyncio.TimeoutError:
+                self.logger.warning(
+                    f"Cohere chat timed out after {self.request_timeout}s "
+                    f"(attempt {attempt + 1}/{self.max_retries + 1})"
+                )
+                continue
+
+            except Exception as e:
+                self.logger.error(f"Cohere API Error: {e}")
+                return None
+
+        self.logger.error(f"Cohere chat gave up after {self.max_retries + 1} timed-out attempts")
+        return None
+
+    async def generate_text_stream(self, prompt: str, chat_history: list = None, max_output_tokens: int = None,
+                                   temperature: float = None):
+        """
+        Stream text from Cohere's chat endpoint as it is generated.
+        
+        Yields the answer piece by piece, so the HTTP layer can forward the first
+        tokens while the rest are still being produced.
+        API errors are logged and re-raised, so callers can tell a failed stream
+        from a complete (possibly short) answer.
+        """
+        if not self.aclient or not self.generation_model_id:
+            self.logger.error("Cohere Client or Model ID not configured.")
+            return
+
+        message_text = self._to_message_text(prompt)
 
         try:
-            response = self.client.chat(
+            stream = self.aclient.chat_stream(
                 model=self.generation_model_id,
-                chat_history=chat_history, 
-                message=message_text, # This is a string
+                chat_history=chat_history if chat_history is not None else [],
+                message=message_text,
                 max_tokens=max_output_tokens if max_output_tokens else self.default_output_max_tokens,
                 temperature=temperature if temperature else self.default_generation_temperature
             )
-            
-            if not response or not response.text:
-                return None
-                
-            return response.text
+            async for event in stream:
+                # Only 'text-generation' events carry answer text
+                if event.event_type == "text-generation":
+                    yield event.text
 
         except Exception as e:
-            self.logger.error(f"Cohere API Error: {e}")
-            return None
+            self.logger.error(f"Cohere streaming API Error: {e}")
+            raise
 
-    def embed_text(self, text, document_type=None) -> list[float]:
+    async def embed_text(self, text, document_type=None) -> np.ndarray:
         """
         Generate embedding vector for text using Cohere's embed endpoint.
+
+        Single texts are not sent on their own: they are queued and flushed by
+        '_batch_loop' together with any other texts that arrive within the
+        coalescing window, so concurrent callers share one embed request.
         """
         # 1. Validation Logic
-        if not self.client:
+        if not self.aclient:
             self.logger.error(f"Cohere Client was not set")
             return None
         
@@ -127,90 +272,307 @@ class CohereProvider(LLMInterface):
 
         # 2. Map internal types to Cohere-specific strings
         # Cohere V3+ requires: "search_document", "search_query", etc.
-        cohere_input_type = CohereEnums.DOCUMENT.value # Default: "search_document"
-        
-        if document_type == DocumentTypeEnum.QUERY:
-            cohere_input_type = CohereEnums.QUERY.value # "search_query"
+        cohere_input_type = _INPUT_TYPE_MAP.get(document_type, _DEFAULT_INPUT_TYPE)
+
+        # 3. Serve repeated texts from the LRU cache (no network round-trip)
+        # blake2b is only used as a fast fingerprint here, not for security
+        cache_key = (
+            self.embedding_model_id,
+            cohere_input_type,
+            hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+        )
+        cached_vector = self._embed_cache.get(cache_key)
+        if cached_vector is not None:
+            self._embed_cache.move_to_end(cache_key)
+            return cached_vector
         
-        # 3. Call Cohere's embed API
-        try:
-            response = self.client.embed(
-                model=self.embedding_model_id,
-                texts=[self.process_text(text)],
-                input_type=cohere_input_type, # Passing the string value
-                embedding_types=["float"]
-            )
-            
-            # 4. Check response and return first (and only) embedding
-            if not response or not response.embeddings or not response.embeddings.float:
-                self.logger.error(f"Failed to get embeddings from Cohere for text")
-                return None
-                
-            return response.embeddings.float[0]
-            
-        except Exception as e:
-            self.logger.error(f"Error during Cohere embedding: {str(e)}")
+        # 4. Queue the text and wait for the coalescer to resolve our future
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((self.process_text(text), cohere_input_type, future))
+        if self._batch_task is None or self._batch_task.done():
+            self._batch_task = asyncio.create_task(self._batch_loop())
+
+        vector = await future
+        if vector is None:
+            self.logger.error(f"Failed to get embeddings from Cohere for text")
             return None
 
-    def embed_batch(self, texts: list[str], document_type=None, batch_size: int = 96) -> list[list[float]]:
+        # Packed float32 is 4 bytes/dim instead of a boxed Python float per dim.
+        # L2-normalized once here so cosine similarity downstream is a plain dot product.
+        # Read-only because the same array is handed out again from the cache.
+        vector = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        if norm:
+            vector /= norm
+        vector.flags.writeable = False
+
+        # 5. Remember the vector for the next identical query
+        self._embed_cache[cache_key] = vector
+        if len(self._embed_cache) > self._embed_cache_size:
+            self._embed_cache.popitem(last=False)  # Evict least recently used
+            
+        return vector
+
+    async def _batch_loop(self):
+        """
+        Drains the pending embed_text queue in micro-batches.
+
+        Each round waits up to 'coalesce_delay' for more callers to join (skipped
+        once a full batch is already waiting), then sends up to 'coalesce_max_batch'
+        texts in one request and hands each caller its own vector. Identical texts
+        (the same question from several users) are sent once and share the result.
+        The task exits when the queue is empty and embed_text restarts it on the next call.
+        """
+        while self._pending:
+            if len(self._pending) < self._coalesce_max_batch:
+                await asyncio.sleep(self._coalesce_delay)
+
+            batch = self._pending[:self._coalesce_max_batch]
+            del self._pending[:self._coalesce_max_batch]
+
+            # One embed call carries a single input_type, so split the batch by it
+            groups = {}
+            for processed_text, cohere_input_type, future in batch:
+                groups.setdefault(cohere_input_type, []).append((processed_text, future))
+
+            for cohere_input_type, items in groups.items():
+                # Send each distinct text once; every caller maps to its text's row
+                rows = {}
+                for processed_text, _ in items:
+                    rows.setdefault(processed_text, len(rows))
+                try:
+                    vectors = await self._embed_sub_batch(list(rows), cohere_input_type)
+                except Exception as e:
+                    self.logger.error(f"Error during Cohere embedding: {str(e)}")
+                    vectors = None
+
+                for processed_text, future in items:
+                    if not future.done():
+                        future.set_result(vectors[rows[processed_text]] if vectors is not None else None)
+
+    async def embed_batch(self, texts: list[str], document_type=None, batch_size: int = 96) -> np.ndarray:
         """
         Converts a list of strings into a list of embedding vectors.
         
         This method is optimized for high-volume indexing by:
         1. Splitting the input into 'sub-batches' to avoid API payload limits.
-        2. Implementing exponential backoff to handle 'Too Many Requests' (429) errors.
+        2. Dispatching the sub-batches concurrently on the AsyncClient, bounded by
+           a semaphore so we stay under Cohere's request-rate ceiling.
+        3. Implementing exponential backoff to handle 'Too Many Requests' (429) errors.
         """
         
         # Determine the purpose of the embedding (Indexing vs. Searching).
         # Cohere V3 models require an input_type to optimize vector performance.
-        cohere_input_type = CohereEnums.DOCUMENT.value # Default: for storing in Vector DB
-        if document_type == DocumentTypeEnum.QUERY:
-            cohere_input_type = CohereEnums.QUERY.value # For real-time search queries
+        # "search_document" for storing in Vector DB, "search_query" for real-time search
+        cohere_input_type = _INPUT_TYPE_MAP.get(document_type, _DEFAULT_INPUT_TYPE)
 
-        all_embeddings = []
-        
-        # --- SUB-BATCHING LOOP ---
-        # We iterate through the list of texts in steps of 'batch_size'.
+        # --- LENGTH BUCKETING ---
+        # Sort by length so each sub-batch holds texts of similar size and the
+        # server pads less; 'order' remembers where each text came from.
+        # Chunks shorter than the budget in characters can't exceed it in tokens,
+        # so only the long ones pay for a regex scan.
+        processed_texts = truncate_many(texts, self.default_input_max_tokens)
+
+        # --- PERSISTENT CACHE ---
+        # Chunks embedded before (e.g. on re-indexing) are read from disk;
+        # only the misses go to the API.
+        cached_vectors = {}
+        cache_keys = None
+        if self.embedding_cache is not None:
+            cache_keys = [
+                self.embedding_cache.make_key("cohere", self.embedding_model_id, cohere_input_type, t)
+                for t in processed_texts
+            ]
+            hits = await self.embedding_cache.get_many(cache_keys)
+            cached_vectors = {i: hits[key] for i, key in enumerate(cache_keys) if key in hits}
+
+        missing = [i for i in range(len(processed_texts)) if i not in cached_vectors]
+
+        # --- DEDUPLICATION ---
+        # Identical chunks (overlapping windows, repeated boilerplate) are embedded
+        # once; each later copy just remembers the row of its first occurrence.
+        first_index = {}
+        duplicates = []
+        for i in missing:
+            first = first_index.setdefault(processed_texts[i], i)
+            if first != i:
+                duplicates.append((i, first))
+
+        order = sorted(first_index.values(), key=lambda i: len(processed_texts[i]))
+
+        # --- SUB-BATCHING ---
+        # We split the sorted texts in steps of 'batch_size'.
         # This prevents sending requests that are physically too large for the API to process.
-        for i in range(0, len(texts), batch_size):
-            # Extract a slice of the text list (e.g., from index 0 to 95)
-            sub_batch = texts[i : i + batch_size]
-            
-            # Pre-process each text in the sub-batch (truncation, cleaning, etc.)
-            processed_texts = [self.process_text(t) for t in sub_batch]
-            
-            # --- RETRY LOGIC (EXPONENTIAL BACKOFF) ---
-            # If the API returns a rate limit error (429), we wait and try again.
-            max_retries = 3
-            for attempt in range(max_retries):
-                try:
-                    # Execute the API call for the current sub-batch
-                    response = self.client.embed(
+        sub_batches = [
+            [processed_texts[j] for j in order[i : i + batch_size]]
+            for i in range(0, len(order), batch_size)
+        ]
+
+        # gather() returns results in submission order, i.e. in sorted order.
+        results = await asyncio.gather(*[
+            self._embed_sub_batch(sub_batch, cohere_input_type) for sub_batch in sub_batches
+        ])
+
+        if any(result is None for result in results):
+            # Keep the sub-batches that did succeed, so a re-run only pays for the failed ones
+            if cache_keys is not None:
+                for start, result in zip(range(0, len(order), batch_size), results):
+                    if result is not None:
+                        norms = np.linalg.norm(result, axis=1, keepdims=True)
+                        await self.embedding_cache.put_many(
+                            [cache_keys[i] for i in order[start:start + batch_size]],
+                            result / np.where(norms == 0, 1, norms)
+                        )
+            return None
+
+        # Fill one preallocated float32 matrix slice by slice (rows in sorted order)
+        dim = results[0].shape[1] if results else 0
+        sorted_vectors = np.empty((len(order), dim), dtype=np.float32)
+        offset = 0
+        for result in results:
+            sorted_vectors[offset:offset + len(result)] = result
+            offset += len(result)
+
+        # Unit-length rows: cosine similarity reduces to a dot product at query time
+        if sorted_vectors.size:
+            norms = np.linalg.norm(sorted_vectors, axis=1, keepdims=True)
+            sorted_vectors /= np.where(norms == 0, 1, norms)
+
+            if cache_keys is not None:
+                await self.embedding_cache.put_many([cache_keys[i] for i in order], sorted_vectors)
+
+        # Scatter fresh and cached rows back so they line up with 'texts'
+        if sorted_vectors.size:
+            dim = sorted_vectors.shape[1]
+        elif cached_vectors:
+            dim = next(iter(cached_vectors.values())).shape[0]
+        else:
+            dim = self.embedding_size or 0
+
+        vectors = np.empty((len(texts), dim), dtype=np.float32)
+        if order:
+            vectors[order] = sorted_vectors
+        for i, vector in cached_vectors.items():
+            vectors[i] = vector
+        for i, first in duplicates:
+            vectors[i] = vectors[first]
+
+        return vectors
+
+    async def _embed_sub_batch(self, processed_texts: list[str], cohere_input_type: str):
+        """
+        Embeds a single sub-batch on the AsyncClient with retry logic.
+        Returns a (len(processed_texts), dim) float32 array, or None if the sub-batch ultimately fails.
+        """
+        # --- RETRY LOGIC (EXPONENTIAL BACKOFF) ---
+        # If the API returns a transient error (429, 503, 504, timeout, network), we wait and try again.
+        max_retries = 3
+        for attempt in range(max_retries):
+            try:
+                # Only 'max_concurrency' sub-batches are in flight at any time
+                async with self._embed_semaphore:
+                    response = await self.aclient.embed(
                         model=self.embedding_model_id,
                         texts=processed_texts,
                         input_type=cohere_input_type,
                         embedding_types=["float"]
                     )
-                    
-                    # If successful, add these vectors to our final list and exit the retry loop
-                    all_embeddings.extend(response.embeddings.float)
-                    break 
-                    
-                except Exception as e:
-                    # Check if the error is specifically a rate limit (HTTP 429)
-                    if "429" in str(e) and attempt < max_retries - 1:
-                        # Wait logic: 2^attempt gives us 1s, 2s, 4s...
-                        # random.random() adds 'jitter' to prevent simultaneous retries from multiple users.
-                        wait_time = (2 ** attempt) + random.random()
-                        self.logger.warning(f"Rate limit hit. Retrying in {wait_time:.2f}s...")
-                        time.sleep(wait_time)
-                    else:
-                        # If the error isn't a 429, or we ran out of retries, we log it and fail.
-                        self.logger.error(f"Batch failed after {max_retries} attempts: {e}")
-                        return None
-                        
-        return all_embeddings
+                return np.asarray(response.embeddings.float, dtype=np.float32)
+                
+            except _RETRYABLE_ERRORS as e:
+                if attempt == max_retries - 1:
+                    self.logger.error(f"Batch failed after {max_retries} attempts: {e}")
+                    return None
+
+                # Wait logic: honour the server's Retry-After if it sent one,
+                # otherwise "full jitter": a random wait in [0, 2^attempt] seconds (capped),
+                # which spreads simultaneous retries from many callers the most.
+                wait_time = min(_BACKOFF_CAP_SECONDS, random.uniform(0, _BACKOFF_BASE_SECONDS * 2 ** attempt))
+                headers = getattr(e, "headers", None) or {}
+                try:
+                    wait_time = min(_BACKOFF_CAP_SECONDS, float(headers.get("retry-after")) + random.random())
+                except (TypeError, ValueError):
+                    pass
+
+                self.logger.warning(f"Transient embed error ({type(e).__name__}). Retrying in {wait_time:.2f}s...")
+                await asyncio.sleep(wait_time)
+
+            except Exception as e:
+                # Not transient (bad request, auth, ...): retrying won't help
+                self.logger.error(f"Batch failed with non-retryable error: {e}")
+                return None
+        return None
     
+    async def submit_embed_job(self, texts: list[str], document_type=None) -> str:
+        """
+        Submits a large indexing workload to Cohere's asynchronous Embed Jobs API.
+        
+        Meant for bulk ingestion where latency does not matter: the texts are
+        uploaded once as an 'embed-input' dataset and embedded server-side,
+        instead of holding an interactive request open per sub-batch.
+        Query-time embeddings should keep using embed_text / embed_batch.
+        
+        Args:
+            texts: Document chunks to embed
+            document_type: Same meaning as in embed_batch (defaults to documents)
+            
+        Returns:
+            The embed job id to poll with get_embed_job, or None on failure
+        """
+        # 1. Validation Logic
+        if not self.aclient or not self.embedding_model_id:
+            self.logger.error(f"Cohere client or embedding model was not set")
+            return None
+
+        cohere_input_type = _INPUT_TYPE_MAP.get(document_type, _DEFAULT_INPUT_TYPE)
+
+        # 2. Serialize the inputs as JSONL, one {"text": ...} record per line
+        payload = "\n".join(
+            json.dumps({"text": self.process_text(t)}, ensure_ascii=False) for t in texts
+        ).encode('utf-8')
+
+        try:
+            # 3. Upload the dataset and wait until Cohere has validated it
+            dataset = await self.aclient.datasets.create(
+                name="mini-rag-embed-input",
+                type="embed-input",
+                data=("embed_input.jsonl", payload)
+            )
+            await self.aclient.wait(dataset)
+
+            # 4. Start the embed job on the uploaded dataset
+            job = await self.aclient.embed_jobs.create(
+                model=self.embedding_model_id,
+                dataset_id=dataset.id,
+                input_type=cohere_input_type,
+                embedding_types=["float"]
+            )
+            return job.job_id
+
+        except Exception as e:
+            self.logger.error(f"Failed to submit Cohere embed job: {e}")
+            return None
+
+    async def get_embed_job(self, job_id: str) -> dict:
+        """
+        Polls an embed job started by submit_embed_job.
+        
+        Returns:
+            {"status": ..., "output_dataset_id": ...} where status is one of
+            Cohere's job states ("processing", "complete", "failed", ...).
+            The output dataset holds the embeddings once status is "complete".
+            Returns None if the job could not be fetched.
+        """
+        try:
+            job = await self.aclient.embed_jobs.get(job_id)
+            return {
+                "status": job.status,
+                "output_dataset_id": job.output_dataset_id
+            }
+        except Exception as e:
+            self.logger.error(f"Failed to fetch Cohere embed job {job_id}: {e}")
+            return None
+
     def construct_prompt(self, prompt: str, role: str = "USER") -> dict:
         """
         Format prompt for Cohere-compatible chat history.
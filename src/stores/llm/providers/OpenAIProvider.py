@@ -1,10 +1,41 @@
 from ..LLMInterface import LLMInterface
-from openai import OpenAI
+import openai
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 from helpers.config import get_settings
 import logging
 from ..LLMEnums import OpenAIEnums
-import time
+from ..TokenTruncation import truncate_to_tokens, truncate_many
+import asyncio
+import httpx
+import json
+import numpy as np
 import random
+from ..AioHttpTransport import AioHttpTransport
+
+# Batch API limit on requests per input file
+_MAX_REQUESTS_PER_BATCH = 50000
+
+# Full-jitter backoff: sleep a random time in [0, base * 2^attempt], never more than the cap
+_BACKOFF_BASE_SECONDS = 1.0
+_BACKOFF_CAP_SECONDS = 60.0
+
+# Transient failures worth backing off and retrying; anything else is a real error.
+_RETRYABLE_ERRORS = (
+    openai.RateLimitError,
+    openai.APITimeoutError,
+    openai.APIConnectionError,
+    openai.InternalServerError,
+)
+
+def _normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    """
+    L2-normalizes every row in place (zero rows are left as is) and returns the matrix.
+    OpenAI's own models return unit-length vectors, but an OpenAI-compatible endpoint
+    (OPENAI_API_URL) may not, and the 'dot' distance metric relies on unit rows.
+    """
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    vectors /= np.where(norms == 0, 1, norms)
+    return vectors
 
 class OpenAIProvider(LLMInterface):
     """
@@ -12,18 +43,51 @@ class OpenAIProvider(LLMInterface):
     Supports both OpenAI's official API and OpenAI-compatible endpoints (via api_url).
     Provides text generation using chat completions and embedding capabilities.
     """
+
+    # One client per (API key, base URL), shared by every provider instance in the
+    # process so they reuse the same HTTP connection pool (and its warm TLS sessions).
+    _CLIENTS: dict = {}
+
+    @classmethod
+    def _get_client(cls, api_key: str, api_url: str = None, use_aio_transport: bool = False):
+        """
+        Returns the shared AsyncOpenAI client for this key/endpoint, creating it on first use.
+        The pool is sized for many concurrent embedding sub-batches with keep-alive reuse.
+        With 'use_aio_transport' the requests go through aiohttp instead of httpx's own transport.
+        """
+        client_key = (api_key, api_url, use_aio_transport)
+        client = cls._CLIENTS.get(client_key)
+        if client is None:
+            if use_aio_transport:
+                http_client = DefaultAsyncHttpxClient(transport=AioHttpTransport(limit=100))
+            else:
+                http_client = DefaultAsyncHttpxClient(
+                    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+                )
+            client = AsyncOpenAI(api_key=api_key, base_url=api_url, http_client=http_client)
+            cls._CLIENTS[client_key] = client
+        return client
+
+    @classmethod
+    async def close_clients(cls):
+        """
+        Closes every shared client (and its connection pool). Called on app shutdown.
+        """
+        for client in cls._CLIENTS.values():
+            await client.close()
+        cls._CLIENTS.clear()
     
     def __init__(self, api_key: str = None, api_url: str = None,
                  default_input_max_tokens: int = 1000, default_output_max_tokens: int = 1000,
-                 temperature: float = 0.1):
-        # Load settings from environment configuration
-        settings = get_settings()
-        
+                 temperature: float = 0.1, embedding_cache=None, max_concurrency: int = 8,
+                 use_aio_transport: bool = False, max_tokens_per_request: int = 300000,
+                 max_items_per_request: int = 2048, stream_include_usage: bool = False):
         # API key from parameter or fallback to settings
-        self.api_key = api_key or settings.OPENAI_API_KEY
+        # (settings are only loaded when the factory didn't pass a value explicitly)
+        self.api_key = api_key or get_settings().OPENAI_API_KEY
         
         # API base URL - allows using OpenAI-compatible endpoints (e.g., Azure OpenAI, local models)
-        self.api_url = api_url or settings.OPENAI_API_URL
+        self.api_url = api_url or get_settings().OPENAI_API_URL
         
         # Maximum tokens to process from input text (truncation limit)
         self.default_input_max_tokens = default_input_max_tokens
@@ -38,9 +102,25 @@ class OpenAIProvider(LLMInterface):
         self.generation_model_id = None  # e.g., "gpt-4", "gpt-3.5-turbo"
         self.embedding_model_id = None   # e.g., "text-embedding-3-small"
         self.embedding_size = None
+
+        # Optional persistent (SQLite) cache of embeddings, shared via the factory
+        self.embedding_cache = embedding_cache
         
-        # Initialize OpenAI client with API key and optional custom base URL
-        self.client = OpenAI(api_key=self.api_key, base_url=self.api_url)
+        # Initialize OpenAI async client with API key and optional custom base URL
+        self.client = OpenAIProvider._get_client(self.api_key, self.api_url, use_aio_transport)
+        # Same connection pool with the SDK's own retries off: _embed_sub_batch has its
+        # jittered, Retry-After-aware loop, and stacking both multiplies attempts
+        self._embed_client = self.client.with_options(max_retries=0)
+        # Caps how many embedding requests are in flight at once
+        self._embed_semaphore = asyncio.Semaphore(max_concurrency)
+
+        # Per-request limits of the embeddings endpoint; embed_batch packs sub-batches up to both
+        self.max_tokens_per_request = max_tokens_per_request
+        self.max_items_per_request = max_items_per_request
+
+        # Request a usage chunk at the end of streams (stream_options); opt-in because
+        # not every OpenAI-compatible endpoint accepts the parameter
+        self.stream_include_usage = stream_include_usage
         self.enums = OpenAIEnums
         # Logger for tracking operations and debugging
         self.logger = logging.getLogger(__name__)
@@ -73,15 +153,18 @@ class OpenAIProvider(LLMInterface):
         Preprocess text before sending to OpenAI API.
         Truncates to max input tokens and removes extra whitespace.
         
+        The limit is applied to approximate tokens (words and punctuation),
+        not characters, so English text is no longer cut at ~1/4 of the budget.
+        
         Args:
             text: Raw input text
             
         Returns:
             Processed text within token limits
         """
-        return text[:self.default_input_max_tokens].strip()
+        return truncate_to_tokens(text, self.default_input_max_tokens)
     
-    def generate_text(self, prompt: str, chat_history: list=[], max_output_tokens: int = None, 
+    async def generate_text(self, prompt: str, chat_history: list = None, max_output_tokens: int = None, 
                      temperature: float = None) -> str:
         """
         Generate text using OpenAI's chat completions endpoint.
@@ -109,17 +192,21 @@ class OpenAIProvider(LLMInterface):
         max_output_tokens = max_output_tokens if max_output_tokens else self.default_output_max_tokens
         temperature = temperature if temperature else self.default_generation_temperature
         
-        # Append current user prompt to chat history
-        # Note: This modifies the original chat_history list passed in
-        chat_history.append(self.construct_prompt(prompt, role=OpenAIEnums.USER.value))
+        # Copy, then append the current prompt: the caller's history is left untouched
+        messages = list(chat_history) if chat_history else []
+        messages.append(self.construct_prompt(prompt, role=OpenAIEnums.USER.value))
         
         # Call OpenAI's chat completions API
-        response = self.client.chat.completions.create(
-            model=self.generation_model_id,     # Model to use for generation
-            messages=chat_history,              # Full conversation history including current prompt
-            max_tokens=max_output_tokens,       # Maximum tokens to generate
-            temperature=temperature             # Randomness control
-        )
+        try:
+            response = await self.client.chat.completions.create(
+                model=self.generation_model_id,     # Model to use for generation
+                messages=messages,                  # Full conversation history including current prompt
+                max_tokens=max_output_tokens,       # Maximum tokens to generate
+                temperature=temperature             # Randomness control
+            )
+        except Exception as e:
+            self.logger.error(f"OpenAI API Error: {e}")
+            return None
         
         # Validate response structure and extract generated text
         # OpenAI returns: response.choices[0].message.content
@@ -128,67 +215,329 @@ class OpenAIProvider(LLMInterface):
             return None
         return response.choices[0].message.content
 
-    def embed_text(self, text, document_type = None) -> list[float]:
+    async def generate_text_stream(self, prompt: str, chat_history: list = None, max_output_tokens: int = None,
+                                   temperature: float = None):
         """
-        Generate embedding vector for text using OpenAI's embeddings endpoint.
+        Stream text from OpenAI's chat completions endpoint as it is generated.
         
-        Note: OpenAI does not differentiate between document and query embeddings
-        (unlike Cohere), so document_type parameter is ignored.
+        Yields content deltas as they arrive, so time-to-first-token is the prefill
+        time rather than the whole generation. With 'stream_include_usage' enabled, token
+        usage arrives in the last chunk (stream_options.include_usage) and is logged.
+        API errors are logged and re-raised, so callers can tell a failed stream
+        from a complete (possibly short) answer.
+        """
+        if not self.client or not self.generation_model_id:
+            self.logger.error(f"OpenAI Client or generation model was not set")
+            return
+
+        messages = list(chat_history) if chat_history is not None else []
+        messages.append(self.construct_prompt(prompt, role=OpenAIEnums.USER.value))
+
+        try:
+            stream = await self.client.chat.completions.create(
+                model=self.generation_model_id,
+                messages=messages,
+                max_tokens=max_output_tokens if max_output_tokens else self.default_output_max_tokens,
+                temperature=temperature if temperature else self.default_generation_temperature,
+                stream=True,
+                stream_options={"include_usage": True} if self.stream_include_usage else openai.NOT_GIVEN
+            )
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+                # The final chunk has no choices, only the usage totals
+                if chunk.usage:
+                    self.logger.info(
+                        f"OpenAI stream usage: {chunk.usage.prompt_tokens} prompt + "
+                        f"{chunk.usage.completion_tokens} completion tokens"
+                    )
+
+        except Exception as e:
+            self.logger.error(f"OpenAI streaming API Error: {e}")
+            raise
+
+    @staticmethod
+    def _estimate_tokens(text: str) -> int:
+        """
+        Upper-bound estimate of a text's token count, without loading a tokenizer.
+        Two UTF-8 bytes per token over-counts English (~4 chars/token) and stays
+        safe for Arabic and other multi-byte scripts.
+        """
+        return len(text.encode("utf-8")) // 2 + 1
+
+    def _pack_sub_batches(self, texts: list[str]) -> list[list[str]]:
+        """
+        Splits texts into consecutive sub-batches that each stay within
+        max_tokens_per_request and max_items_per_request.
+        Many short chunks share one request; long chunks never overflow it.
+        """
+        sub_batches = []
+        current_batch, current_tokens = [], 0
+
+        for text in texts:
+            tokens = self._estimate_tokens(text)
+            if current_batch and (current_tokens + tokens > self.max_tokens_per_request
+                                  or len(current_batch) >= self.max_items_per_request):
+                sub_batches.append(current_batch)
+                current_batch, current_tokens = [], 0
+            current_batch.append(text)
+            current_tokens += tokens
+
+        if current_batch:
+            sub_batches.append(current_batch)
+        return sub_batches
+
+    async def embed_batch(self, texts: list[str], document_type=None) -> np.ndarray:
+        """
+        Converts a list of strings into a (len(texts), dim) float32 matrix.
         
-        Args:
-            text: Text to convert to embedding vector
-            document_type: Ignored for OpenAI (no optimization difference)
-            
-        Returns:
-            List of floats representing the embedding vector, or None if error
+        Texts are packed into token-aware sub-batches (see _pack_sub_batches),
+        which are sent concurrently on the AsyncOpenAI client, bounded by a
+        semaphore. Rows are L2-normalized before returning, since OpenAI-compatible
+        endpoints don't all return unit-length vectors. Texts found in the persistent
+        embedding cache are not sent to the API.
         """
-        # Validate client is initialized
+        # Validate client and embedding model are configured
         if not self.client:
             self.logger.error(f"OpenAI Client was not set")
             return None
-        
-        # Validate embedding model is configured
+
         if not self.embedding_model_id:
             self.logger.error(f"Embedding model for OpenAI was not set")
             return None
+
+        # One pass over the batch; only texts longer than the budget get scanned
+        processed_texts = truncate_many(texts, self.default_input_max_tokens)
+
+        # 1. Look every processed text up in the cache (if one is configured)
+        hits, cache_keys = {}, None
+        if self.embedding_cache is not None:
+            cache_keys = [
+                self.embedding_cache.make_key("openai", self.embedding_model_id, None, t)
+                for t in processed_texts
+            ]
+            hits = await self.embedding_cache.get_many(cache_keys)
+
+        missing = [
+            i for i in range(len(processed_texts))
+            if cache_keys is None or cache_keys[i] not in hits
+        ]
+
+        # 2. Send each distinct text once; repeats point at their first occurrence
+        first_index = {}
+        duplicates = []
+        for i in missing:
+            first = first_index.setdefault(processed_texts[i], i)
+            if first != i:
+                duplicates.append((i, first))
+        missing = list(first_index.values())
+
+        # 3. Embed only the misses, all sub-batches in flight together
+        fresh = None
+        if missing:
+            sub_batches = self._pack_sub_batches([processed_texts[i] for i in missing])
+            # gather() keeps submission order, so rows line up with 'missing'
+            results = await asyncio.gather(*[
+                self._embed_sub_batch(sub_batch) for sub_batch in sub_batches
+            ])
+            if any(result is None for result in results):
+                # Keep the sub-batches that did succeed, so a re-run only pays for the failed ones
+                if cache_keys is not None:
+                    offset = 0
+                    for sub_batch, result in zip(sub_batches, results):
+                        if result is not None:
+                            await self.embedding_cache.put_many(
+                                [cache_keys[i] for i in missing[offset:offset + len(sub_batch)]], result
+                            )
+                        offset += len(sub_batch)
+                return None
+
+            # Fill one preallocated matrix slice by slice instead of concatenating lists
+            fresh = np.empty((len(missing), results[0].shape[1]), dtype=np.float32)
+            offset = 0
+            for result in results:
+                fresh[offset:offset + len(result)] = result
+                offset += len(result)
+            if cache_keys is not None:
+                await self.embedding_cache.put_many([cache_keys[i] for i in missing], fresh)
+
+        # 4. Stitch cached, fresh and duplicate rows back into input order
+        if fresh is not None:
+            dim = fresh.shape[1]
+        elif hits:
+            dim = next(iter(hits.values())).shape[0]
+        else:
+            dim = self.embedding_size or 0
+
+        vectors = np.empty((len(texts), dim), dtype=np.float32)
+        if fresh is not None:
+            vectors[missing] = fresh
+        if hits:
+            for i, key in enumerate(cache_keys):
+                if key in hits:
+                    vectors[i] = hits[key]
+        for i, first in duplicates:
+            vectors[i] = vectors[first]
+
+        # Covers fresh and cached rows alike (a no-op for already unit-length vectors)
+        return _normalize_rows(vectors)
+
+    async def _embed_sub_batch(self, processed_texts: list[str]):
+        """
+        Embeds a single sub-batch with retry logic.
+        Returns a (len(processed_texts), dim) float32 array, or None if the sub-batch ultimately fails.
+        """
+        max_retries = 3
+        for attempt in range(max_retries):
+            try:
+                # Only 'max_concurrency' sub-batches are in flight at any time
+                async with self._embed_semaphore:
+                    response = await self._embed_client.embeddings.create(
+                        input=processed_texts,
+                        model=self.embedding_model_id
+                    )
+                return np.asarray([item.embedding for item in response.data], dtype=np.float32)
+
+            except _RETRYABLE_ERRORS as e:
+                if attempt == max_retries - 1:
+                    self.logger.error(f"Batch failed after {max_retries} attempts: {e}")
+                    return None
+
+                # Full jitter spreads parallel retries out instead of bunching them at 2^attempt
+                wait_time = min(_BACKOFF_CAP_SECONDS, random.uniform(0, _BACKOFF_BASE_SECONDS * 2 ** attempt))
+                # A 429 says how long to wait in Retry-After; trust it over our guess
+                response = getattr(e, "response", None)
+                try:
+                    retry_after = float(response.headers.get("retry-after"))
+                    wait_time = min(_BACKOFF_CAP_SECONDS, retry_after + random.random())
+                except (AttributeError, TypeError, ValueError):
+                    pass
+
+                self.logger.warning(f"Transient embed error ({type(e).__name__}). Retrying in {wait_time:.2f}s...")
+                await asyncio.sleep(wait_time)
+
+            except Exception as e:
+                self.logger.error(f"Batch failed with non-retryable error: {e}")
+                return None
+        return None
+    
+    async def submit_embed_job(self, texts: list[str], offset: int = 0) -> str:
+        """
+        Submits texts to OpenAI's Batch API (/v1/batches) for offline embedding.
         
-        # Call OpenAI's embeddings API
-        response = self.client.embeddings.create(
-            input=self.process_text(text),
-            model=self.embedding_model_id   # Embedding model to use
-        )
+        Meant for bulk ingestion where up to 24h latency is acceptable: batch jobs
+        are billed at a discount and have their own, much higher rate limits.
+        Each line's custom_id is "row-<offset + i>" so results can be put back in order.
         
-        # Validate response structure and extract embedding vector
-        # OpenAI returns: response.data[0].embedding
-        if not response or not response.data or len(response.data) == 0 or not response.data[0].embedding:
-            self.logger.error(f"Failed to get embedding from OpenAI for text: {text}")
-            return None 
+        Returns:
+            The batch id to poll with get_embed_job, or None on failure
+        """
+        if not self.client or not self.embedding_model_id:
+            self.logger.error(f"OpenAI client or embedding model was not set")
+            return None
+
+        # 1. One JSONL line per text, in the Batch API request format
+        payload = "\n".join(
+            json.dumps({
+                "custom_id": f"row-{offset + i}",
+                "method": "POST",
+                "url": "/v1/embeddings",
+                "body": {"model": self.embedding_model_id, "input": self.process_text(text)}
+            }, ensure_ascii=False)
+            for i, text in enumerate(texts)
+        ).encode("utf-8")
+
+        try:
+            # 2. Upload the request file and start the batch on it
+            input_file = await self.client.files.create(
+                file=("embed_requests.jsonl", payload),
+                purpose="batch"
+            )
+            batch = await self.client.batches.create(
+                input_file_id=input_file.id,
+                endpoint="/v1/embeddings",
+                completion_window="24h"
+            )
+            return batch.id
+
+        except Exception as e:
+            self.logger.error(f"Failed to submit OpenAI embedding batch: {e}")
+            return None
+
+    async def get_embed_job(self, job_id: str) -> dict:
+        """
+        Polls a batch started by submit_embed_job.
         
-        return response.data[0].embedding  # Return the embedding vector
-    
-    def embed_batch(self, texts: list[str], document_type=None, batch_size: int = 100) -> list[list[float]]:
-            all_embeddings = []
-
-            for i in range(0, len(texts), batch_size):
-                sub_batch = texts[i : i + batch_size]
-                processed_texts = [self.process_text(t) for t in sub_batch]
-
-                max_retries = 3
-                for attempt in range(max_retries):
-                    try:
-                        response = self.client.embeddings.create(
-                            input=processed_texts,
-                            model=self.embedding_model_id
-                        )
-                        all_embeddings.extend([item.embedding for item in response.data])
-                        break
-                    except Exception as e:
-                        if "rate_limit" in str(e).lower() and attempt < max_retries - 1:
-                            time.sleep((2 ** attempt) + random.random())
-                        else:
-                            return None
-            return all_embeddings
-    
+        Returns:
+            {"status": ..., "output_file_id": ...} where status is one of the Batch API
+            states ("validating", "in_progress", "completed", "failed", "expired", ...).
+            Returns None if the batch could not be fetched.
+        """
+        try:
+            batch = await self.client.batches.retrieve(job_id)
+            return {"status": batch.status, "output_file_id": batch.output_file_id}
+        except Exception as e:
+            self.logger.error(f"Failed to fetch OpenAI batch {job_id}: {e}")
+            return None
+
+    async def embed_batch_offline(self, texts: list[str], poll_interval: float = 30) -> np.ndarray:
+        """
+        Embeds texts through the Batch API and waits for the results.
+        
+        Inputs above the per-batch request limit are split across several batches
+        that run in parallel. Returns a (len(texts), dim) float32 matrix in input
+        order, or None if any batch fails.
+        """
+        # 1. Submit one batch per 50k texts
+        job_ids = []
+        for start in range(0, len(texts), _MAX_REQUESTS_PER_BATCH):
+            job_id = await self.submit_embed_job(
+                texts[start:start + _MAX_REQUESTS_PER_BATCH], offset=start
+            )
+            if job_id is None:
+                return None
+            job_ids.append(job_id)
+
+        # 2. Wait for all of them
+        output_file_ids = []
+        for job_id in job_ids:
+            while True:
+                job = await self.get_embed_job(job_id)
+                if job is None:
+                    return None
+                if job["status"] == "completed":
+                    output_file_ids.append(job["output_file_id"])
+                    break
+                if job["status"] in ("failed", "expired", "cancelled", "cancelling"):
+                    self.logger.error(f"OpenAI batch {job_id} ended with status '{job['status']}'")
+                    return None
+                await asyncio.sleep(poll_interval)
+
+        # 3. Download the results; lines come back in any order, custom_id says where each goes
+        vectors = [None] * len(texts)
+        try:
+            for output_file_id in output_file_ids:
+                content = await self.client.files.content(output_file_id)
+                for line in content.text.splitlines():
+                    if not line.strip():
+                        continue
+                    record = json.loads(line)
+                    response = record.get("response") or {}
+                    if record.get("error") or response.get("status_code") != 200:
+                        self.logger.error(f"OpenAI batch row {record.get('custom_id')} failed: {record.get('error')}")
+                        return None
+                    row = int(record["custom_id"].split("-", 1)[1])
+                    vectors[row] = response["body"]["data"][0]["embedding"]
+        except Exception as e:
+            self.logger.error(f"Failed to read OpenAI batch results: {e}")
+            return None
+
+        if any(vector is None for vector in vectors):
+            self.logger.error(f"OpenAI batch results are missing rows")
+            return None
+
+        return _normalize_rows(np.asarray(vectors, dtype=np.float32))
+
     def construct_prompt(self, prompt: str, role: str = "user") -> dict:
         """
         Format prompt as OpenAI-compatible message dictionary.
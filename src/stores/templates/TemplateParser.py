@@ -1,55 +1,164 @@
 import os
+import sys
 import asyncio
 import importlib
 import logging
-from typing import Optional, Any
+from typing import Optional, Any, Mapping
 from string import Template
 from models.enums.TemplatesEnum import TemplateDirectoriesAndFilesEnums
 
+# Enum values used on every lookup, resolved once at import
+_STORES = TemplateDirectoriesAndFilesEnums.STORES.value
+_TEMPLATES = TemplateDirectoriesAndFilesEnums.TEMPLATES.value
+_LOCALES = TemplateDirectoriesAndFilesEnums.LOCALES.value
+
+class _CompiledTemplate:
+    """
+    A string.Template parsed once into literal pieces and placeholder slots.
+    Rendering fills the slots and joins the pieces; there is no regex scan per call.
+    """
+    __slots__ = ("_pieces", "_slots")
+
+    def __init__(self, pieces: tuple, slots: tuple):
+        self._pieces = pieces  # Literal text, with None where a placeholder goes
+        self._slots = slots    # (index in pieces, variable name)
+
+    def render(self, vars: Mapping[str, Any]) -> str:
+        pieces = list(self._pieces)
+        for index, name in self._slots:
+            # A missing variable raises KeyError, exactly like substitute()
+            pieces[index] = str(vars[name])
+        return "".join(pieces)
+
+
+def _compile_template(template: Template):
+    """
+    Parses a Template once, using its own placeholder pattern.
+
+    Returns:
+        The plain text if it has no placeholders, a _CompiledTemplate otherwise,
+        or the Template unchanged if its syntax is invalid (substitute() then raises as usual).
+    """
+    text = template.template
+    pieces, slots = [], []
+    literal, position = [], 0
+
+    for match in template.pattern.finditer(text):
+        literal.append(text[position:match.start()])
+        position = match.end()
+
+        # '$$' is just a literal '$'
+        if match.group("escaped") is not None:
+            literal.append(template.delimiter)
+            continue
+
+        name = match.group("named") or match.group("braced")
+        if name is None:
+            return template
+
+        pieces.append("".join(literal))
+        literal = []
+        slots.append((len(pieces), name))
+        pieces.append(None)
+
+    literal.append(text[position:])
+    pieces.append("".join(literal))
+
+    if not slots:
+        return pieces[0]
+    return _CompiledTemplate(tuple(pieces), tuple(slots))
+
 
 class TemplateParser:
+    __slots__ = (
+        "logger", "current_path", "default_language", "language", "_module_prefix",
+        "_module_cache", "_template_cache", "_languages", "_groups",
+    )
+
     def __init__(self, default_language: str, language: str):
         self.logger = logging.getLogger(__name__)
         self.current_path = os.path.dirname(os.path.abspath(__file__))
         self.default_language = default_language
         self.language = None
+        # Dotted package path of the locales, built once instead of on every import
+        self._module_prefix = f"{_STORES}.{_TEMPLATES}.{_LOCALES}."
         self._module_cache = {}
+        # (language, group, key) -> Template/str attribute, filled on first get()
+        self._template_cache = {}
+        self._scan_locales()
+        self._preload_modules()
         self._sync_set_language(language=language)
 
+    def _scan_locales(self):
+        """
+        Indexes the locales tree once, so language and group lookups are set
+        membership tests instead of an os.path.exists call each.
+        """
+        languages, groups = set(), set()
+        locales_path = os.path.join(self.current_path, _LOCALES)
+
+        with os.scandir(locales_path) as language_dirs:
+            for language_dir in language_dirs:
+                if not language_dir.is_dir() or language_dir.name.startswith("__"):
+                    continue
+                languages.add(language_dir.name)
+                with os.scandir(language_dir.path) as entries:
+                    for entry in entries:
+                        if entry.is_file() and entry.name.endswith(".py") and not entry.name.startswith("__"):
+                            groups.add((language_dir.name, entry.name[:-len(".py")]))
+
+        self._languages = frozenset(languages)
+        self._groups = frozenset(groups)
+
+    def _preload_modules(self):
+        """
+        Imports every indexed locale module up front (they are few and small),
+        so get() never waits on an import during a request.
+        A module that fails to import is logged and left to the lazy path.
+        """
+        for language, group in self._groups:
+            try:
+                self._import_template_module(language, group)
+            except ImportError:
+                continue
+
     def _sync_set_language(self, language: str):
         if not language:
             self.language = self.default_language
             return
 
-        language_path = os.path.join(
-            self.current_path,
-            TemplateDirectoriesAndFilesEnums.LOCALES.value,
-            language,
-        )
-        if os.path.exists(language_path):
+        if language in self._languages:
             self.language = language
         else:
             self.logger.warning(
-                f"Language '{language}' not found, falling back to default '{self.default_language}'"
+                "Language '%s' not found, falling back to default '%s'", language, self.default_language
             )
             self.language = self.default_language
 
-    async def get(self, group: str, key: str, vars: dict = {}) -> Optional[str]:
+    async def get(self, group: str, key: str, vars: Optional[Mapping[str, Any]] = None) -> Optional[str]:
         if not group or not key:
             return None
 
-        targeted_language = await asyncio.to_thread(
-            self._resolve_targeted_language, group
-        )
+        # Fast path: template already resolved, no path checks, imports or thread hops
+        key_attribute = self._template_cache.get((self.language, group, key))
+        if key_attribute is not None:
+            return self._render(key_attribute, key, group, vars)
+
+        # Resolving the language is a set lookup now; nothing to offload
+        targeted_language = self._resolve_targeted_language(group)
         if not targeted_language:
+            # %-style args: the message is only built if WARNING is enabled
             self.logger.warning(
-                f"Could not resolve language for group '{group}'"
+                "Could not resolve language for group '%s'", group
             )
             return None
 
-        module = await asyncio.to_thread(
-            self._import_template_module, targeted_language, group
-        )
+        # Only a module's first import runs in a worker thread
+        module = self._module_cache.get((targeted_language, group))
+        if module is None:
+            module = await asyncio.to_thread(
+                self._import_template_module, targeted_language, group
+            )
         if module is None:
             raise TemplateNotFound(
                 f"Could not import template module '{group}' for language '{targeted_language}'"
@@ -57,42 +166,50 @@ class TemplateParser:
 
         if not hasattr(module, key):
             self.logger.warning(
-                f"Template key '{key}' not found in {group}.py ({targeted_language})"
+                "Template key '%s' not found in %s.py (%s)", key, group, targeted_language
             )
             raise TemplateNotFound(
                 f"Template key '{key}' not found in {group}.py ({targeted_language})"
             )
 
         key_attribute = getattr(module, key)
-
+        # Parse Templates once: a placeholder-free one (e.g. system_prompt) becomes its
+        # plain text, the rest become slot lists, so later calls skip substitute()'s regex pass
         if isinstance(key_attribute, Template):
-            return key_attribute.substitute(vars)
-        elif isinstance(key_attribute, str):
+            key_attribute = _compile_template(key_attribute)
+        self._template_cache[(self.language, group, key)] = key_attribute
+
+        return self._render(key_attribute, key, group, vars)
+
+    def _render(self, key_attribute: Any, key: str, group: str, vars: Optional[Mapping[str, Any]]) -> str:
+        # Plain strings (including placeholder-free templates) come back as-is, whatever 'vars' is
+        if isinstance(key_attribute, str):
             return key_attribute
+        elif isinstance(key_attribute, _CompiledTemplate):
+            return key_attribute.render(vars if vars is not None else {})
+        elif isinstance(key_attribute, Template):
+            return key_attribute.substitute(vars) if vars else key_attribute.substitute()
         else:
             raise InvalidTemplate(
                 f"Attribute '{key}' in {group}.py is not a Template object"
             )
 
+    def reload(self):
+        """
+        Drops every cached template and re-imports the locale modules,
+        so edits to the template files are picked up without a restart.
+        """
+        for module in self._module_cache.values():
+            importlib.reload(module)
+        self._scan_locales()
+        self._preload_modules()
+        self._template_cache.clear()
+
     def _resolve_targeted_language(self, group: str) -> Optional[str]:
-        group_filename = f"{group}.py"
-
-        path = os.path.join(
-            self.current_path,
-            TemplateDirectoriesAndFilesEnums.LOCALES.value,
-            self.language,
-            group_filename,
-        )
-        if os.path.exists(path):
+        if (self.language, group) in self._groups:
             return self.language
 
-        default_path = os.path.join(
-            self.current_path,
-            TemplateDirectoriesAndFilesEnums.LOCALES.value,
-            self.default_language,
-            group_filename,
-        )
-        if os.path.exists(default_path):
+        if (self.default_language, group) in self._groups:
             return self.default_language
 
         return None
@@ -102,27 +219,26 @@ class TemplateParser:
             if (language, group) in self._module_cache:
                 return self._module_cache[(language, group)]
 
-            module_path = (
-                f"{TemplateDirectoriesAndFilesEnums.STORES.value}."
-                f"{TemplateDirectoriesAndFilesEnums.TEMPLATES.value}."
-                f"{TemplateDirectoriesAndFilesEnums.LOCALES.value}."
-                f"{language}."
-                f"{group}"
-            )
+            module_path = f"{self._module_prefix}{language}.{group}"
 
-            module = importlib.import_module(module_path)
+            # Already imported (by another parser or an earlier run): skip the import machinery
+            module = sys.modules.get(module_path)
+            if module is None:
+                module = importlib.import_module(module_path)
             self._module_cache[(language, group)] = module
             return module
         except ImportError as e:
             self.logger.error(
-                f"Failed to import template module '{group}' for language '{language}': {e}"
+                "Failed to import template module '%s' for language '%s': %s", group, language, e
             )
             raise
 
 
 class TemplateNotFound(Exception):
     """Custom exception for when a template is not found."""
+    __slots__ = ()
 
 
 class InvalidTemplate(Exception):
     """Custom exception for when a template is not a Template object."""
+    __slots__ = ()
@@ -0,0 +1,46 @@
+import os
+import uuid
+from qdrant_client import models
+from typing import List
+
+# Shared stand-in for missing metadata, so points without metadata don't each
+# allocate their own empty dict (the client only serializes it)
+EMPTY_METADATA: dict = {}
+
+# Qdrant's default indexing_threshold (KB), restored after a bulk ingest when the
+# collection reported none (or was already paused at 0)
+DEFAULT_INDEXING_THRESHOLD = 20000
+
+
+def random_uuids(n: int) -> List[str]:
+    """
+    Returns 'n' random (version 4) UUID strings drawn from a single os.urandom read,
+    instead of one uuid4() call (and urandom syscall) per record.
+    """
+    buf = os.urandom(16 * n)
+    return [str(uuid.UUID(bytes=buf[i:i + 16], version=4)) for i in range(0, 16 * n, 16)]
+
+def fill_record_ids(record_ids: list, count: int) -> list:
+    """
+    Returns one ID per record: 'record_ids' as given when complete, otherwise with
+    every missing (None) ID filled from one bulk draw, or all new IDs if none were given.
+    """
+    if not record_ids:
+        return random_uuids(count)
+    if any(r_id is None for r_id in record_ids):
+        record_ids = list(record_ids)
+        missing = [idx for idx, r_id in enumerate(record_ids) if r_id is None]
+        for idx, new_id in zip(missing, random_uuids(len(missing))):
+            record_ids[idx] = new_id
+    return record_ids
+
+def indexing_threshold_config(threshold: int) -> models.OptimizersConfigDiff:
+    """Optimizer update setting the collection's indexing_threshold (0 pauses HNSW indexing)."""
+    return models.OptimizersConfigDiff(indexing_threshold=threshold)
+
+def threshold_to_restore(info) -> int:
+    """
+    The indexing_threshold to put back after a bulk ingest, read from the collection
+    info taken before pausing; falls back to Qdrant's default if it reported none or 0.
+    """
+    return info.config.optimizer_config.indexing_threshold or DEFAULT_INDEXING_THRESHOLD
@@ -1,4 +1,6 @@
 from abc import ABC, abstractmethod
+from typing import Sequence, Union
+import numpy as np
 
 class VectorDBInterface(ABC):
     """
@@ -26,6 +28,17 @@ class VectorDBInterface(ABC):
         This method should clean up any resources and gracefully close the connection.
         """
         pass
+
+    def __enter__(self):
+        """
+        Connects on entering a 'with' block, so the connection is always paired with
+        a disconnect (even on errors) instead of leaking and forcing reconnects.
+        """
+        self.connect()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.disconnect()
     
     @abstractmethod
     def is_collection_exists(self, collection_name: str) -> bool:
@@ -81,18 +94,19 @@ class VectorDBInterface(ABC):
     
     @abstractmethod
     def insert_many(self, collection_name: str, texts: list,
-                    vectors: list, metadatas: list = None,
-                    record_ids: list = None, batch_size: int = 5):
+                    vectors: Union[np.ndarray, Sequence[Sequence[float]]], metadatas: list = None,
+                    record_ids: list = None, batch_size: int = 128):
         """
         Insert multiple vector records into a collection in batches.
         
         Args:
             collection_name (str): The target collection name
             texts (list): List of original text contents
-            vectors (list): List of embedding vectors (each vector is a list of floats)
+            vectors (np.ndarray | list): (N, dim) float32 matrix, or one list of floats per text
             metadatas (list, optional): List of metadata dictionaries (one per vector)
             record_ids (list, optional): List of unique identifiers (auto-generated if not provided)
-            batch_size (int): Number of records to insert per batch (default: 5)
+            batch_size (int): Number of records to insert per batch (default: 128).
+                Each batch is one round-trip; Qdrant handles 64-256 well, Milvus even more
         """
         pass    
 
@@ -132,4 +146,22 @@ class VectorDBInterface(ABC):
         Returns:
             list: List of search results with scores and payloads
         """
-        pass
\ No newline at end of file
+        pass
+
+    def search_many_by_vector(self, collection_name: str,
+                              vectors: Union[np.ndarray, Sequence[Sequence[float]]], limit: int = 5):
+        """
+        Search for several query vectors at once.
+        
+        This default calls search_by_vector once per vector. Backends with a
+        multi-query endpoint should override it to answer all queries in one round-trip.
+        
+        Args:
+            collection_name (str): The name of the collection to search in
+            vectors (np.ndarray | list): (N, dim) matrix or list of query vectors
+            limit (int): Maximum number of results per query (default: 5)
+            
+        Returns:
+            list: One list of search results per query vector, in input order
+        """
+        return [self.search_by_vector(collection_name, vector, limit) for vector in vectors]
\ No newline at end of file
@@ -1,6 +1,8 @@
+import asyncio
 from abc import ABC, abstractmethod
 from models.db_schemas import RetrievedDocument
-from typing import List
+from typing import List, Sequence, Union
+import numpy as np
 class VectorDBInterfaceAsync(ABC):
     """
     Abstract interface for asynchronous vector database operations.
@@ -27,6 +29,17 @@ class VectorDBInterfaceAsync(ABC):
         This method should clean up any resources and gracefully close the connection.
         """
         pass
+
+    async def __aenter__(self):
+        """
+        Connects on entering an 'async with' block, so the connection is always paired
+        with a disconnect (even on errors) instead of leaking and forcing reconnects.
+        """
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.disconnect()
     
     @abstractmethod
     async def is_collection_exists(self, collection_name: str) -> bool:
@@ -67,7 +80,7 @@ class VectorDBInterfaceAsync(ABC):
     @abstractmethod
     async def insert_one(self, collection_name: str, text: str,
                         vector: list, metadata: dict = None,
-                        record_id: str = None):
+                        record_id: str = None, assume_exists: bool = False):
         """
         Insert a single vector record into a collection.
         
@@ -77,23 +90,28 @@ class VectorDBInterfaceAsync(ABC):
             vector (list): The embedding vector (list of floats)
             metadata (dict, optional): Additional metadata to store with the vector
             record_id (str, optional): Unique identifier for the record (auto-generated if not provided)
+            assume_exists (bool): Skip the collection-exists check when the caller already
+                knows the collection is there (e.g. right after create_collection)
         """
         pass
     
     @abstractmethod
     async def insert_many(self, collection_name: str, texts: list,
-                         vectors: list, metadatas: list = None,
-                         record_ids: list = None, batch_size: int = 5):
+                         vectors: Union[np.ndarray, Sequence[Sequence[float]]], metadatas: list = None,
+                         record_ids: list = None, batch_size: int = 128,
+                         assume_exists: bool = False):
         """
         Insert multiple vector records into a collection in batches.
         
         Args:
             collection_name (str): The target collection name
             texts (list): List of original text contents
-            vectors (list): List of embedding vectors (each vector is a list of floats)
+            vectors (np.ndarray | list): (N, dim) float32 matrix, or one list of floats per text
             metadatas (list, optional): List of metadata dictionaries (one per vector)
             record_ids (list, optional): List of unique identifiers (auto-generated if not provided)
-            batch_size (int): Number of records to insert per batch (default: 5)
+            batch_size (int): Number of records to insert per batch (default: 128).
+                Each batch is one round-trip; Qdrant handles 64-256 well, Milvus even more
+            assume_exists (bool): Skip the collection-exists check (see insert_one)
         """
         pass
 
@@ -122,7 +140,8 @@ class VectorDBInterfaceAsync(ABC):
 
     @abstractmethod
     async def search_by_vector(self, collection_name: str,
-                                vector: list, limit: int = 5) -> List[RetrievedDocument]:
+                                vector: list, limit: int = 5,
+                                assume_exists: bool = False) -> List[RetrievedDocument]:
         """
         Search for similar vectors in a collection.
         
@@ -130,8 +149,30 @@ class VectorDBInterfaceAsync(ABC):
             collection_name (str): The name of the collection to search in
             vector (list): The query vector (list of floats)
             limit (int): Maximum number of results to return (default: 5)
+            assume_exists (bool): Skip the collection-exists check (see insert_one)
             
         Returns:
             list: List of search results with scores and payloads
         """
-        pass
\ No newline at end of file
+        pass
+
+    async def search_many_by_vector(self, collection_name: str,
+                                    vectors: Union[np.ndarray, Sequence[Sequence[float]]],
+                                    limit: int = 5) -> List[List[RetrievedDocument]]:
+        """
+        Search for several query vectors at once.
+        
+        This default runs one search_by_vector per vector concurrently. Backends with
+        a multi-query endpoint should override it to answer all queries in one round-trip.
+        
+        Args:
+            collection_name (str): The name of the collection to search in
+            vectors (np.ndarray | list): (N, dim) matrix or list of query vectors
+            limit (int): Maximum number of results per query (default: 5)
+            
+        Returns:
+            list: One list of search results per query vector, in input order
+        """
+        return list(await asyncio.gather(*[
+            self.search_by_vector(collection_name, vector, limit) for vector in vectors
+        ]))
\ No newline at end of file
@@ -1,10 +1,11 @@
 import os
+import asyncio
 import logging
 from .providers.QDrantProvider import QDrantProvider
 from .providers.QDrantAsyncProvider import QDrantAsyncProvider
 from .providers.MilvusProvider import MilvusProvider
 from .providers.MilvusAsyncProvider import MilvusAsyncProvider
-from helpers.config import VectorDBEnums 
+from .VectorDBEnums import VectorDBEnums
 from controllers.BaseAsyncController import BaseAsyncController
 
 class VectorDBProviderFactory:
@@ -20,14 +21,43 @@ class VectorDBProviderFactory:
         self.config = config
         self.base_controller = BaseAsyncController()
         self.logger = logging.getLogger(__name__)
+        # (provider, VECTOR_DB_NAME) -> provider instance already built by this factory
+        self._cache = {}
+        self._lock = asyncio.Lock()
+        # Provider value -> builder, so _build() is one dict lookup instead of an if/elif chain
+        self._builders = {
+            VectorDBEnums.AsyncQDRANT.value: self._build_async_qdrant,
+            VectorDBEnums.QDRANT.value: self._build_qdrant,
+            VectorDBEnums.AsyncMILVUS.value: self._build_async_milvus,
+            VectorDBEnums.MILVUS.value: self._build_milvus,
+        }
 
     async def create(self, provider: str):
         """
         Returns the appropriate Vector DB provider instance.
+        Instances are memoized per (provider, VECTOR_DB_NAME): repeated calls return the
+        same object without re-validating config, re-creating the directory or a new client.
 
         Args:
             provider (str): The value from VectorDBEnums (e.g., "AsyncQDRANT").
         """
+        key = (provider, self.config.VECTOR_DB_NAME)
+        instance = self._cache.get(key)
+        if instance is not None:
+            return instance
+
+        # Double-checked under the lock so concurrent first calls build only one instance
+        async with self._lock:
+            instance = self._cache.get(key)
+            if instance is None:
+                instance = await self._build(provider)
+                self._cache[key] = instance
+        return instance
+
+    async def _build(self, provider: str):
+        """
+        Builds a new provider instance for 'provider' (see create()).
+        """
         # Validate critical configuration
         if not self.config.VECTOR_DB_NAME:
             raise ValueError("VECTOR_DB_NAME is missing in configuration.")
@@ -35,46 +65,47 @@ class VectorDBProviderFactory:
         if not self.config.VECTOR_DB_DISTANCE_METRIC:
             raise ValueError("VECTOR_DB_DISTANCE_METRIC is missing in configuration.")
 
-        # 1. Logic for Asynchronous Qdrant (Optimized for Scale)
-        if provider == VectorDBEnums.AsyncQDRANT.value:
-            # Await the directory path creation
-            db_path = await self.base_controller.get_database_path(db_name=self.config.VECTOR_DB_NAME)
-
-            return QDrantAsyncProvider(
-                db_path=db_path,
-                url=self.config.VECTOR_DB_URL, 
-                api_key=self.config.VECTOR_DB_API_KEY,
-                distance_metric=self.config.VECTOR_DB_DISTANCE_METRIC
-            )
+        builder = self._builders.get(provider)
+        if builder is None:
+            # Explicitly raise an error if the provider string is invalid
+            raise ValueError(f"Unknown Vector DB provider: {provider}. Please check your .env file.")
 
-        # 2. Logic for Synchronous Qdrant (Fallback)
-        elif provider == VectorDBEnums.QDRANT.value:
-            db_path = await self.base_controller.get_database_path(db_name=self.config.VECTOR_DB_NAME)
+        # Every backend stores under the same per-database directory, resolved once here
+        db_path = await self.base_controller.get_database_path(db_name=self.config.VECTOR_DB_NAME)
+        return builder(db_path)
 
-            return QDrantProvider(
-                db_path=db_path,
-                distance_metric=self.config.VECTOR_DB_DISTANCE_METRIC
-            )
+    def _milvus_db_file(self, db_path: str) -> str:
+        return os.path.join(db_path, f"milvus_{self.config.VECTOR_DB_NAME}.db")
 
-        # 3. Logic for Asynchronous Milvus (Optimized for Scale)
-        elif provider == VectorDBEnums.AsyncMILVUS.value:
-            db_path = await self.base_controller.get_database_path(db_name=self.config.VECTOR_DB_NAME)
-            milvus_db_file = os.path.join(db_path, f"milvus_{self.config.VECTOR_DB_NAME}.db")
+    # 1. Logic for Asynchronous Qdrant (Optimized for Scale)
+    def _build_async_qdrant(self, db_path: str):
+        return QDrantAsyncProvider(
+            db_path=db_path,
+            url=self.config.VECTOR_DB_URL, 
+            api_key=self.config.VECTOR_DB_API_KEY,
+            distance_metric=self.config.VECTOR_DB_DISTANCE_METRIC,
+            prefer_grpc=self.config.VECTOR_DB_PREFER_GRPC,
+            grpc_port=self.config.VECTOR_DB_GRPC_PORT,
+            high_ram=self.config.VECTOR_DB_HIGH_RAM
+        )
 
-            return MilvusAsyncProvider(
-                db_path=milvus_db_file,
-                distance_metric=self.config.VECTOR_DB_DISTANCE_METRIC
-            )
+    # 2. Logic for Synchronous Qdrant (Fallback)
+    def _build_qdrant(self, db_path: str):
+        return QDrantProvider(
+            db_path=db_path,
+            distance_metric=self.config.VECTOR_DB_DISTANCE_METRIC
+        )
 
-        # 4. Logic for Synchronous Milvus
-        elif provider == VectorDBEnums.MILVUS.value:
-            db_path = await self.base_controller.get_database_path(db_name=self.config.VECTOR_DB_NAME)
-            milvus_db_file = os.path.join(db_path, f"milvus_{self.config.VECTOR_DB_NAME}.db")
+    # 3. Logic for Asynchronous Milvus (Optimized for Scale)
+    def _build_async_milvus(self, db_path: str):
+        return MilvusAsyncProvider(
+            db_path=self._milvus_db_file(db_path),
+            distance_metric=self.config.VECTOR_DB_DISTANCE_METRIC
+        )
 
-            return MilvusProvider(
-                db_path=milvus_db_file,
-                distance_metric=self.config.VECTOR_DB_DISTANCE_METRIC
-            )
-        
-        # Explicitly raise an error if the provider string is invalid
-        raise ValueError(f"Unknown Vector DB provider: {provider}. Please check your .env file.")
\ No newline at end of file
+    # 4. Logic for Synchronous Milvus
+    def _build_milvus(self, db_path: str):
+        return MilvusProvider(
+            db_path=self._milvus_db_file(db_path),
+            distance_metric=self.config.VECTOR_DB_DISTANCE_METRIC
+        )
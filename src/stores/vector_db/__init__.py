@@ -1,4 +1,4 @@
-from .VectorDBEnums import DistanceMetricEnums, LLMEnums, OpenAIEnums, CohereEnums
+from .VectorDBEnums import DistanceMetricEnums, VectorDBEnums
 from .VectorDBInterface import VectorDBInterface
 from .VectorDBInterfaceAsync import VectorDBInterfaceAsync
 from .VectorDBProviderFactory import VectorDBProviderFactory
\ No newline at end of file
@@ -1,19 +1,63 @@
 import asyncio
 import logging
 import os
-from pymilvus import MilvusClient
+import time
+from itertools import repeat
+from pymilvus import AsyncMilvusClient, MilvusClient
 from ..VectorDBInterfaceAsync import VectorDBInterfaceAsync
 from ..VectorDBEnums import DistanceMetricEnums
 from models.db_schemas import RetrievedDocument
-from typing import List
+from typing import ClassVar, List
+
+# Shared stand-in for missing metadata, so rows without metadata don't each
+# allocate their own empty dict (the client only serializes it)
+_EMPTY_METADATA: dict = {}
+
+# Database directories already created in this process, so later connects skip the syscall
+_ENSURED_DIRS: set[str] = set()
+
+# URI schemes that point at a Milvus server rather than a local Milvus Lite file
+_SERVER_URI_PREFIXES = ("http://", "https://", "tcp://", "grpc://")
+
+
+def _is_server_uri(uri: str) -> bool:
+    """True if 'uri' addresses a Milvus server; anything else is a local Milvus Lite database file."""
+    return uri.lower().startswith(_SERVER_URI_PREFIXES)
+
+
+def _hits_to_documents(hits) -> List[RetrievedDocument]:
+    """
+    Maps one query's Milvus hits to RetrievedDocument.
+    A successful search always returns 'entity' (with the requested output fields) and
+    'distance', so they are read by subscript; model_construct skips pydantic
+    validation, which is redundant for these already-typed values.
+    """
+    construct = RetrievedDocument.model_construct
+    return [construct(text=hit["entity"]["text"], score=hit["distance"]) for hit in hits]
 
 class MilvusAsyncProvider(VectorDBInterfaceAsync):
     """
     MilvusAsyncProvider: Asynchronous implementation of the Milvus vector database provider.
     
-    This provider wraps synchronous MilvusClient calls using asyncio.to_thread()
-    to provide async/await interface compatibility. Uses MilvusClient for local file storage.
+    Against a Milvus server this provider uses pymilvus' native AsyncMilvusClient, so
+    every call is awaited directly on the event loop. Milvus Lite (a local database file)
+    doesn't implement every RPC the async client relies on (create_collection's index wait
+    calls AllocTimestamp, which Milvus Lite answers with UNIMPLEMENTED), so for local files
+    the sync MilvusClient is used instead, with each call run in a worker thread.
     """
+
+    # One client per database file/URI, shared by every provider in the process and
+    # reference-counted so the file is opened once and closed with its last user.
+    _CLIENTS: dict = {}
+    _REFCOUNTS: dict = {}
+    _CLIENTS_LOCK = asyncio.Lock()
+
+    # Distance metrics from enum values to Milvus metric types, built once for the class
+    _METRIC_MAP: ClassVar[dict[str, str]] = {
+        DistanceMetricEnums.COSINE.value: "COSINE",
+        DistanceMetricEnums.EUCLIDEAN.value: "L2",  # Milvus uses L2 for Euclidean
+        DistanceMetricEnums.DOT.value: "IP"  # Inner Product for dot product
+    }
     
     def __init__(self, db_path: str,
                  distance_metric: str = DistanceMetricEnums.COSINE.value):
@@ -21,50 +65,113 @@ class MilvusAsyncProvider(VectorDBInterfaceAsync):
         Initialize the async Milvus provider.
         
         Args:
-            db_path (str): Full path to the Milvus database file (e.g., "milvus_demo.db")
+            db_path (str): Full path to the Milvus database file (e.g., "milvus_demo.db"),
+                or a Milvus server URI (e.g., "http://localhost:19530")
             distance_metric (str): Distance metric to use (cosine, euclidean, or dot)
         """
         self.db_path = db_path
         self.client = None
         self.logger = logging.getLogger(__name__)
+
+        # Server URIs get the native async client; local Milvus Lite files the sync one
+        self._is_server = _is_server_uri(db_path)
+
+        # Collections seen to exist, so hot insert/search paths skip the has_collection
+        # round-trip; kept in sync by create_collection/delete_collection
+        self._known_collections: set[str] = set()
+
+        # Short-lived cache of list_all_collections: (monotonic timestamp, names)
+        self._collections_list_cache: tuple[float, list] = (0.0, None)
+        self._collections_list_ttl = 5.0
+
+        # Search coalescing: (collection_name, limit, vector, future) waiting to be sent
+        self._pending_searches = []
+        self._search_task = None
+        self._coalesce_max_batch = 64     # Max query vectors per coalesced search call
+        self._coalesce_delay = 0.001      # Max time (seconds) a query waits for company
         
-        # Map distance metrics from enum values to Milvus metric types
-        metric_map = {
-            DistanceMetricEnums.COSINE.value: "COSINE",
-            DistanceMetricEnums.EUCLIDEAN.value: "L2",  # Milvus uses L2 for Euclidean
-            DistanceMetricEnums.DOT.value: "IP"  # Inner Product for dot product
-        }
-        
-        if distance_metric not in metric_map:
+        if distance_metric not in self._METRIC_MAP:
             raise ValueError(f"Unsupported distance metric: {distance_metric}")
         
-        self.distance_metric = metric_map[distance_metric]
+        self.distance_metric = self._METRIC_MAP[distance_metric]
     
-    async def _ensure_connected(self):
-        """Internal helper to ensure client is connected before operations."""
+    def _ensure_connected(self):
+        """
+        Internal helper to ensure client is connected before operations.
+        Plain (not async): it's a None-check, so awaiting it only cost a coroutine per call.
+        """
         if self.client is None:
             raise RuntimeError("Client not connected. Call connect() first.")
+
+    async def _call(self, method: str, **kwargs):
+        """
+        Calls 'method' on the client: awaited directly on the async (server) client,
+        or run in a worker thread on the sync (Milvus Lite) client so it doesn't block the loop.
+        """
+        func = getattr(self.client, method)
+        if self._is_server:
+            return await func(**kwargs)
+        return await asyncio.to_thread(func, **kwargs)
     
     async def connect(self):
         """
         Establish an asynchronous connection to the Milvus database.
-        Creates the client with the specified database file path.
+        Reuses the process-wide client for this database file if one is open,
+        otherwise creates it with the specified database file path.
         """
-        def _connect_sync():
-            # Ensure the directory exists
-            db_dir = os.path.dirname(self.db_path)
-            if db_dir and not os.path.exists(db_dir):
-                os.makedirs(db_dir, exist_ok=True)
-            
-            return MilvusClient(self.db_path)
-        
-        self.client = await asyncio.to_thread(_connect_sync)
-        self.logger.info(f"Connected to Milvus (async) at: {self.db_path}")
+        if self.client is not None:
+            return
+
+        cls = MilvusAsyncProvider
+        async with cls._CLIENTS_LOCK:
+            client = cls._CLIENTS.get(self.db_path)
+            if client is None:
+                if self._is_server:
+                    # Built on the event loop: its gRPC aio channel binds to the running loop
+                    client = AsyncMilvusClient(uri=self.db_path)
+                else:
+                    # Ensure the directory exists (makedirs with exist_ok needs no exists() check)
+                    db_dir = os.path.dirname(self.db_path)
+                    if db_dir and db_dir not in _ENSURED_DIRS:
+                        os.makedirs(db_dir, exist_ok=True)
+                        _ENSURED_DIRS.add(db_dir)
+
+                    # Opening the file starts the Milvus Lite server, so keep it off the loop
+                    client = await asyncio.to_thread(MilvusClient, uri=self.db_path)
+                cls._CLIENTS[self.db_path] = client
+            cls._REFCOUNTS[self.db_path] = cls._REFCOUNTS.get(self.db_path, 0) + 1
+
+        self.client = client
+        self.logger.info("Connected to Milvus (async) at: %s", self.db_path)
     
     async def disconnect(self):
-        """Close the connection to the Milvus database."""
-        if self.client:
-            self.client = None
+        """
+        Release this provider's handle; the shared client is closed
+        only when the last provider using the same database file disconnects.
+        """
+        if self.client is None:
+            return
+
+        cls = MilvusAsyncProvider
+        async with cls._CLIENTS_LOCK:
+            remaining = cls._REFCOUNTS.get(self.db_path, 1) - 1
+            if remaining <= 0:
+                cls._REFCOUNTS.pop(self.db_path, None)
+                client = cls._CLIENTS.pop(self.db_path, None)
+                if client is not None:
+                    # Close now rather than leaving the file handles and gRPC channel
+                    # to the GC; a failed close still releases this provider's handle
+                    try:
+                        if self._is_server:
+                            await client.close()
+                        else:
+                            await asyncio.to_thread(client.close)
+                    except Exception as e:
+                        self.logger.error("Error closing Milvus client: %s", e)
+            else:
+                cls._REFCOUNTS[self.db_path] = remaining
+
+        self.client = None
         self.logger.info("Disconnected from Milvus")
     
     async def is_collection_exists(self, collection_name: str) -> bool:
@@ -77,29 +184,50 @@ class MilvusAsyncProvider(VectorDBInterfaceAsync):
         Returns:
             bool: True if collection exists, False otherwise
         """
-        await self._ensure_connected()
+        self._ensure_connected()
         try:
-            return await asyncio.to_thread(
-                self.client.has_collection,
+            return await self._call(
+                "has_collection",
                 collection_name=collection_name
             )
         except Exception as e:
-            self.logger.error(f"Error checking if collection exists: {e}")
+            self.logger.error("Error checking if collection exists: %s", e)
             return False
     
+    async def _is_collection_known(self, collection_name: str) -> bool:
+        """
+        Like is_collection_exists, but answers from the known-collections cache when it can
+        and only asks Milvus on a miss (remembering the collection if it exists).
+        """
+        if collection_name in self._known_collections:
+            return True
+
+        exists = await self.is_collection_exists(collection_name)
+        if exists:
+            self._known_collections.add(collection_name)
+        return exists
+    
     async def list_all_collections(self) -> list:
         """
         List all collections in the Milvus database.
+        The catalog rarely changes, so results are reused for '_collections_list_ttl'
+        seconds (create/delete through this provider invalidate it immediately).
         
         Returns:
             list: A list of collection names (strings)
         """
-        await self._ensure_connected()
+        self._ensure_connected()
+        cached_at, cached = self._collections_list_cache
+        if cached is not None and time.monotonic() - cached_at < self._collections_list_ttl:
+            return cached
+
         try:
-            collections = await asyncio.to_thread(self.client.list_collections)
-            return list(collections) if collections else []
+            # The client already returns a list; no need to copy it
+            collections = await self._call("list_collections") or []
+            self._collections_list_cache = (time.monotonic(), collections)
+            return collections
         except Exception as e:
-            self.logger.error(f"Error listing collections: {e}")
+            self.logger.error("Error listing collections: %s", e)
             return []
     
     async def get_collection_info(self, collection_name: str):
@@ -112,9 +240,9 @@ class MilvusAsyncProvider(VectorDBInterfaceAsync):
         Returns:
             dict: Collection metadata including size, embedding dimension, etc.
         """
-        await self._ensure_connected()
+        self._ensure_connected()
         try:
-            exists = await self.is_collection_exists(collection_name)
+            exists = await self._is_collection_known(collection_name)
             if not exists:
                 return None
             
@@ -125,7 +253,7 @@ class MilvusAsyncProvider(VectorDBInterfaceAsync):
                 "exists": True
             }
         except Exception as e:
-            self.logger.error(f"Error retrieving collection info: {e}")
+            self.logger.error("Error retrieving collection info: %s", e)
             return None
     
     async def delete_collection(self, collection_name: str):
@@ -138,20 +266,23 @@ class MilvusAsyncProvider(VectorDBInterfaceAsync):
         Returns:
             bool: True if deletion was successful, False otherwise
         """
-        await self._ensure_connected()
+        self._ensure_connected()
         try:
             if await self.is_collection_exists(collection_name):
-                await asyncio.to_thread(
-                    self.client.drop_collection,
+                await self._call(
+                    "drop_collection",
                     collection_name=collection_name
                 )
-                self.logger.info(f"Successfully deleted collection: {collection_name}")
+                self._known_collections.discard(collection_name)
+                self._collections_list_cache = (0.0, None)
+                self.logger.info("Successfully deleted collection: %s", collection_name)
                 return True
             
-            self.logger.warning(f"Attempted to delete non-existent collection: {collection_name}")
+            self._known_collections.discard(collection_name)
+            self.logger.warning("Attempted to delete non-existent collection: %s", collection_name)
             return False
         except Exception as e:
-            self.logger.error(f"Failed to delete collection '{collection_name}': {e}")
+            self.logger.error("Failed to delete collection '%s': %s", collection_name, e)
             return False
     
     async def create_collection(self, collection_name: str, embedding_size: int, do_reset: bool = False):
@@ -166,28 +297,30 @@ class MilvusAsyncProvider(VectorDBInterfaceAsync):
         Returns:
             bool: True if collection was created, False otherwise
         """
-        await self._ensure_connected()
+        self._ensure_connected()
         try:
             if do_reset:
                 await self.delete_collection(collection_name)
             
-            if not await self.is_collection_exists(collection_name):
+            if not await self._is_collection_known(collection_name):
                 # MilvusClient.create_collection uses dimension parameter
-                await asyncio.to_thread(
-                    self.client.create_collection,
+                await self._call(
+                    "create_collection",
                     collection_name=collection_name,
                     dimension=embedding_size,
                     metric_type=self.distance_metric
                 )
-                self.logger.info(f"Collection '{collection_name}' created with dimension {embedding_size} and metric {self.distance_metric}")
+                self._known_collections.add(collection_name)
+                self._collections_list_cache = (0.0, None)
+                self.logger.info("Collection '%s' created with dimension %s and metric %s", collection_name, embedding_size, self.distance_metric)
                 return True
             return False
         except Exception as e:
-            self.logger.error(f"Error creating collection: {e}")
+            self.logger.error("Error creating collection: %s", e)
             return False
     
     async def insert_one(self, collection_name: str, text: str, vector: list, 
-                         metadata: dict = None, record_id: str = None):
+                         metadata: dict = None, record_id: str = None, assume_exists: bool = False):
         """
         Insert a single vector record into a collection.
         
@@ -197,16 +330,21 @@ class MilvusAsyncProvider(VectorDBInterfaceAsync):
             vector (list): The embedding vector (list of floats)
             metadata (dict, optional): Additional metadata to store with the vector
             record_id (str, optional): Unique identifier for the record
+            assume_exists (bool): Skip the collection-exists check (caller knows it exists)
             
         Returns:
             bool: True if insertion was successful, False otherwise
         """
-        await self._ensure_connected()
+        self._ensure_connected()
         # Validation: Check if collection exists before attempting insert
-        if not await self.is_collection_exists(collection_name):
-            self.logger.error(f"Cannot insert: Collection '{collection_name}' does not exist.")
+        if not assume_exists and not await self._is_collection_known(collection_name):
+            self.logger.error("Cannot insert: Collection '%s' does not exist.", collection_name)
             return False
         
+        # Embeddings arrive as numpy arrays; the client wants plain lists
+        if hasattr(vector, "tolist"):
+            vector = vector.tolist()
+
         try:
             # Format data as Milvus expects: list of dictionaries
             data = [{
@@ -216,151 +354,226 @@ class MilvusAsyncProvider(VectorDBInterfaceAsync):
                 "metadata": metadata if metadata is not None else {}
             }]
             
-            await asyncio.to_thread(
-                self.client.insert,
+            await self._call(
+                "insert",
                 collection_name=collection_name,
                 data=data
             )
-            self.logger.info(f"Successfully inserted record into '{collection_name}'")
+            self.logger.info("Successfully inserted record into '%s'", collection_name)
             return True
         except Exception as e:
-            self.logger.error(f"An error occurred while inserting into '{collection_name}': {e}")
+            self.logger.error("An error occurred while inserting into '%s': %s", collection_name, e)
             return False
     
     async def insert_many(self, collection_name: str, texts: list, vectors: list, 
-                          metadatas: list = None, record_ids: list = None, batch_size: int = 50):
+                          metadatas: list = None, record_ids: list = None, batch_size: int = 128,
+                          max_concurrency: int = 8, assume_exists: bool = False):
         """
         Insert multiple vector records into a collection in batches.
         
         Args:
             collection_name (str): The target collection name
             texts (list): List of original text contents
-            vectors (list): List of embedding vectors (each vector is a list of floats)
+            vectors (np.ndarray | list): (N, dim) float32 matrix, or one list of floats per text
             metadatas (list, optional): List of metadata dictionaries (one per vector)
             record_ids (list, optional): List of unique identifiers (auto-generated if not provided)
-            batch_size (int): Number of records to insert per batch (default: 50)
+            batch_size (int): Number of records to insert per batch (default: 128)
+            max_concurrency (int): Max batches in flight at once (default: 8)
+            assume_exists (bool): Skip the collection-exists check (caller knows it exists)
             
         Returns:
             bool: True if the process completes, even if some batches failed (errors are logged)
         """
-        await self._ensure_connected()
+        self._ensure_connected()
+
+        # Nothing to insert: skip the existence check and batching altogether
+        if not texts:
+            return True
         
         # Validation: Check if collection exists before attempting insert
-        if not await self.is_collection_exists(collection_name):
-            self.logger.error(f"Cannot insert: Collection '{collection_name}' does not exist.")
+        if not assume_exists and not await self._is_collection_known(collection_name):
+            self.logger.error("Cannot insert: Collection '%s' does not exist.", collection_name)
             return False
-        
-        if metadatas is None:
-            metadatas = [None] * len(texts)
-        
-        if record_ids is None:
-            record_ids = [None] * len(texts)
-        
-        # Validate input lengths match
-        if not (len(texts) == len(vectors) == len(metadatas) == len(record_ids)):
+
+        # Validate input lengths match (missing metadatas/record_ids are filled per batch
+        # with repeat(None), so no N-sized placeholder lists are allocated)
+        n_texts = len(texts)
+        if (len(vectors) != n_texts
+                or (metadatas is not None and len(metadatas) != n_texts)
+                or (record_ids is not None and len(record_ids) != n_texts)):
             self.logger.error("Input lists must have the same length")
             return False
         
-        # Create batches
-        tasks = []
-        for i in range(0, len(texts), batch_size):
-            batch_end = i + batch_size
-            
-            # Slice the input lists to get the current batch
-            b_texts = texts[i:batch_end]
-            b_vectors = vectors[i:batch_end]
-            b_metadata = metadatas[i:batch_end]
-            b_ids = record_ids[i:batch_end]
-            
-            # Format data as Milvus expects: list of dictionaries
-            batch_data = [
-                {
-                    "id": r_id if r_id is not None else i + idx,  # Use index if no ID provided
-                    "vector": vec,
-                    "text": txt,
-                    "metadata": meta if meta is not None else {}
-                }
-                for idx, (txt, vec, meta, r_id) in enumerate(zip(b_texts, b_vectors, b_metadata, b_ids))
-            ]
-            
-            # Queue the insert task for this batch
-            tasks.append(
-                asyncio.to_thread(
-                    self.client.insert,
+        # Only 'max_concurrency' batches run at once, so a large insert doesn't flood the
+        # database with requests; each batch is built inside its slot, so only in-flight
+        # batches hold their row dicts in memory
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _insert_batch(i: int):
+            async with semaphore:
+                batch_end = i + batch_size
+                
+                # Slice the input lists to get the current batch
+                b_texts = texts[i:batch_end]
+                b_vectors = vectors[i:batch_end]
+                b_metadata = metadatas[i:batch_end] if metadatas is not None else repeat(None)
+                b_ids = record_ids[i:batch_end] if record_ids is not None else repeat(None)
+
+                # A float32 matrix is sliced as a view and converted per batch in one
+                # C-level pass, so only in-flight batches ever exist as Python lists
+                if hasattr(b_vectors, "tolist"):
+                    b_vectors = b_vectors.tolist()
+                
+                # Format data as Milvus expects: list of dictionaries
+                batch_data = [
+                    {
+                        "id": r_id if r_id is not None else i + idx,  # Use index if no ID provided
+                        "vector": vec,
+                        "text": txt,
+                        "metadata": meta if meta is not None else _EMPTY_METADATA
+                    }
+                    for idx, (txt, vec, meta, r_id) in enumerate(zip(b_texts, b_vectors, b_metadata, b_ids))
+                ]
+                
+                return await self._call(
+                    "insert",
                     collection_name=collection_name,
                     data=batch_data
                 )
-            )
         
-        # Execute all batch insert tasks concurrently
+        # Execute the batch inserts concurrently, bounded by the semaphore
+        tasks = [_insert_batch(i) for i in range(0, len(texts), batch_size)]
         results = await asyncio.gather(*tasks, return_exceptions=True)
         
-        successful_batches = 0
-        for idx, res in enumerate(results):
-            if isinstance(res, Exception):
-                batch_start = idx * batch_size
-                self.logger.error(f"Batch processing failed at batch index {idx} (starting at record {batch_start}): {res}")
-            else:
-                successful_batches += 1
+        # Only failed batches are materialized; successes are just counted
+        failures = [(idx, res) for idx, res in enumerate(results) if isinstance(res, Exception)]
+        successful_batches = len(results) - len(failures)
+        for idx, res in failures:
+            self.logger.error("Batch processing failed at batch index %s (starting at record %s): %s", idx, idx * batch_size, res)
         
         total_batches = len(tasks)
         if successful_batches == 0:
-            self.logger.error(f"All {total_batches} batches failed for collection '{collection_name}'")
+            self.logger.error("All %s batches failed for collection '%s'", total_batches, collection_name)
             return False
         
         if successful_batches < total_batches:
-            self.logger.warning(f"Only {successful_batches}/{total_batches} batches succeeded for collection '{collection_name}'")
+            self.logger.warning("Only %s/%s batches succeeded for collection '%s'", successful_batches, total_batches, collection_name)
         
         return True
     
     async def search_by_vector(self, collection_name: str,
-                                vector: list, limit: int = 5) -> List[RetrievedDocument]:
+                                vector: list, limit: int = 5,
+                                assume_exists: bool = False) -> List[RetrievedDocument]:
         """
         Asynchronously searches for similar vectors in a Milvus collection.
 
-        This method wraps the synchronous Milvus search call in a thread to maintain 
-        async compatibility. It retrieves the associated text and maps the output 
-        to the project's standardized 'RetrievedDocument' schema.
+        The query is queued and flushed by '_search_loop' together with any other
+        searches that arrive within the coalescing window, so concurrent callers
+        share one search request. It retrieves the associated text and maps the output to the project's
+        standardized 'RetrievedDocument' schema.
 
         Args:
             collection_name (str): The name of the collection to search in.
             vector (list): The query embedding vector (list of floats).
             limit (int, optional): Maximum number of results to return. Defaults to 5.
+            assume_exists (bool, optional): Skip the collection-exists check. Defaults to False.
 
         Returns:
             list[RetrievedDocument]: A list of retrieved documents with their text 
                 and similarity/distance scores. Returns an empty list [] if no 
                 results are found or if an error occurs.
         """
-        await self._ensure_connected()
+        self._ensure_connected()
+        # Embeddings arrive as numpy arrays; the client wants plain lists
+        if hasattr(vector, "tolist"):
+            vector = vector.tolist()
         try:
-            if not await self.is_collection_exists(collection_name):
-                self.logger.error(f"Cannot search: Collection '{collection_name}' does not exist.")
+            if not assume_exists and not await self._is_collection_known(collection_name):
+                self.logger.error("Cannot search: Collection '%s' does not exist.", collection_name)
                 return []
-            
-            # 1. Perform the search in a separate thread to avoid blocking
-            # Milvus returns: [[{'id': 1, 'distance': 0.9, 'entity': {...}}, ...]]
-            results = await asyncio.to_thread(
-                self.client.search,
+        except Exception as e:
+            self.logger.error("Error searching in collection '%s': %s", collection_name, e)
+            return []
+
+        # Queue the query and wait for the coalescer to resolve our future
+        future = asyncio.get_running_loop().create_future()
+        self._pending_searches.append((collection_name, limit, vector, future))
+        if self._search_task is None or self._search_task.done():
+            self._search_task = asyncio.create_task(self._search_loop())
+
+        return await future
+
+    async def _search_loop(self):
+        """
+        Drains the pending search_by_vector queue in micro-batches.
+
+        Each round waits up to 'coalesce_delay' for more callers to join (skipped
+        once a full batch is already waiting), then sends each (collection, limit)
+        group as one multi-vector search and hands every caller
+        its own hits. The task exits when the queue is empty and search_by_vector
+        restarts it on the next call.
+        """
+        while self._pending_searches:
+            if len(self._pending_searches) < self._coalesce_max_batch:
+                await asyncio.sleep(self._coalesce_delay)
+
+            batch = self._pending_searches[:self._coalesce_max_batch]
+            del self._pending_searches[:self._coalesce_max_batch]
+
+            # One search call targets a single collection with a single limit
+            groups = {}
+            for collection_name, limit, vector, future in batch:
+                groups.setdefault((collection_name, limit), []).append((vector, future))
+
+            for (collection_name, limit), items in groups.items():
+                try:
+                    results = await self._call(
+                        "search",
+                        collection_name=collection_name,
+                        data=[vector for vector, _ in items],
+                        limit=limit,
+                        output_fields=["text", "metadata"]
+                    )
+                    documents = [_hits_to_documents(hits) for hits in results or []]
+                except Exception as e:
+                    self.logger.error("Error searching in collection '%s': %s", collection_name, e)
+                    documents = []
+
+                for idx, (_, future) in enumerate(items):
+                    if not future.done():
+                        future.set_result(documents[idx] if idx < len(documents) else [])
+
+    async def search_many_by_vector(self, collection_name: str,
+                                    vectors: list, limit: int = 5) -> List[List[RetrievedDocument]]:
+        """
+        Searches for several query vectors in one Milvus search call.
+
+        Milvus accepts a list of query vectors in 'data' and returns one hit list
+        per vector, so N queries cost a single round-trip.
+
+        Returns:
+            list[list[RetrievedDocument]]: One result list per query vector, in input
+                order. On error, every query gets an empty list.
+        """
+        self._ensure_connected()
+        # Convert the whole query matrix in one C-level pass
+        if hasattr(vectors, "tolist"):
+            vectors = vectors.tolist()
+        try:
+            if not await self._is_collection_known(collection_name):
+                self.logger.error("Cannot search: Collection '%s' does not exist.", collection_name)
+                return [[] for _ in vectors]
+
+            results = await self._call(
+                "search",
                 collection_name=collection_name,
-                data=[vector], 
+                data=vectors,
                 limit=limit,
                 output_fields=["text", "metadata"]
             )
-            
-            if not results or len(results) == 0:
-                return []
 
-            # 2. Map Milvus 'hits' to the RetrievedDocument schema
-            # results[0] contains hits for our single query vector
-            return [
-                RetrievedDocument(
-                    text=hit.get("entity", {}).get("text", ""),
-                    score=hit.get("distance", 0.0)
-                )
-                for hit in results[0]
-            ]
-            
+            return [_hits_to_documents(hits) for hits in results]
+
         except Exception as e:
-            self.logger.error(f"Error searching in collection '{collection_name}': {e}")
-            return []
\ No newline at end of file
+            self.logger.error("Error batch searching in collection '%s': %s", collection_name, e)
+            return [[] for _ in vectors]
\ No newline at end of file
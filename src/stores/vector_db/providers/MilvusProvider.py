@@ -1,9 +1,31 @@
 from ..VectorDBInterface import VectorDBInterface
 from pymilvus import MilvusClient
+from typing import ClassVar
 import logging
+import numpy as np
 import os
+import threading
+from itertools import repeat
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from ..VectorDBEnums import DistanceMetricEnums
 
+# Shared stand-in for missing metadata, so rows without metadata don't each
+# allocate their own empty dict (the client only serializes it)
+_EMPTY_METADATA: dict = {}
+
+# Milvus rejects gRPC messages over 64 MB, so one insert batch must stay below it
+_MAX_GRPC_MSG_BYTES = 64 * 1024 * 1024
+# Rough per-row allowance for id, metadata and framing on top of the vector and text
+_ROW_OVERHEAD_BYTES = 256
+# Texts sampled to estimate the average row size
+_SIZE_SAMPLE_ROWS = 32
+
+
+def _is_message_too_large(error: Exception) -> bool:
+    """True if 'error' is gRPC rejecting a request over the max message size."""
+    message = str(error)
+    return "RESOURCE_EXHAUSTED" in message or "larger than max" in message
+
 class MilvusProvider(VectorDBInterface):
     """
     MilvusProvider: Synchronous implementation of the Milvus vector database provider.
@@ -11,31 +33,45 @@ class MilvusProvider(VectorDBInterface):
     This provider uses MilvusClient for local file storage, following the same
     interface contract as other vector database providers in the system.
     """
+
+    # One MilvusClient per database file, shared by every provider in the process and
+    # reference-counted so the file is opened once and closed with its last user.
+    _CLIENTS: dict = {}
+    _REFCOUNTS: dict = {}
+    _CLIENTS_LOCK = threading.Lock()
+
+    # Distance metrics from enum values to Milvus metric types, built once for the class
+    _METRIC_MAP: ClassVar[dict[str, str]] = {
+        DistanceMetricEnums.COSINE.value: "COSINE",
+        DistanceMetricEnums.EUCLIDEAN.value: "L2",  # Milvus uses L2 for Euclidean
+        DistanceMetricEnums.DOT.value: "IP"  # Inner Product for dot product
+    }
     
     def __init__(self, db_path: str,
-                 distance_metric: str = DistanceMetricEnums.COSINE.value):
+                 distance_metric: str = DistanceMetricEnums.COSINE.value,
+                 default_batch_size: int = 1000):
         """
         Initialize the Milvus provider.
         
         Args:
             db_path (str): Full path to the Milvus database file (e.g., "milvus_demo.db")
             distance_metric (str): Distance metric to use (cosine, euclidean, or dot)
+            default_batch_size (int): Records per insert batch when insert_many isn't given
+                one. Each batch pays a fixed round-trip, and Milvus keeps gaining
+                throughput well into the thousands of rows per batch.
         """
         self.db_path = db_path
+        self.default_batch_size = default_batch_size
         self.client = None
         self.logger = logging.getLogger(__name__)
+        # Collections seen to exist, so inserts/searches skip the has_collection
+        # round-trip; kept in sync by create_collection/delete_collection
+        self._known_collections: set[str] = set()
         
-        # Map distance metrics from enum values to Milvus metric types
-        metric_map = {
-            DistanceMetricEnums.COSINE.value: "COSINE",
-            DistanceMetricEnums.EUCLIDEAN.value: "L2",  # Milvus uses L2 for Euclidean
-            DistanceMetricEnums.DOT.value: "IP"  # Inner Product for dot product
-        }
-        
-        if distance_metric not in metric_map:
+        if distance_metric not in self._METRIC_MAP:
             raise ValueError(f"Unsupported distance metric: {distance_metric}")
         
-        self.distance_metric = metric_map[distance_metric]
+        self.distance_metric = self._METRIC_MAP[distance_metric]
     
     def _ensure_connected(self):
         """Internal helper to ensure client is connected before operations."""
@@ -45,27 +81,57 @@ class MilvusProvider(VectorDBInterface):
     def connect(self):
         """
         Establish a connection to the Milvus database.
-        Creates the client with the specified database file path.
+        Reuses the process-wide client for this database file if one is open,
+        otherwise creates it with the specified database file path.
         """
-        # Ensure the directory exists
-        db_dir = os.path.dirname(self.db_path)
-        if db_dir and not os.path.exists(db_dir):
-            os.makedirs(db_dir, exist_ok=True)
-        
-        self.client = MilvusClient(self.db_path)
+        if self.client is not None:
+            return
+
+        cls = MilvusProvider
+        with cls._CLIENTS_LOCK:
+            client = cls._CLIENTS.get(self.db_path)
+            if client is None:
+                # Ensure the directory exists
+                db_dir = os.path.dirname(self.db_path)
+                if db_dir:
+                    os.makedirs(db_dir, exist_ok=True)
+                
+                client = MilvusClient(self.db_path)
+                cls._CLIENTS[self.db_path] = client
+            cls._REFCOUNTS[self.db_path] = cls._REFCOUNTS.get(self.db_path, 0) + 1
+
+        self.client = client
         self.logger.info(f"Connected to Milvus at: {self.db_path}")
     
     def disconnect(self):
-        """Close the connection to the Milvus database."""
-        if self.client:
-            # MilvusClient doesn't have an explicit close method in Lite mode
-            # Setting to None is sufficient
-            self.client = None
+        """
+        Release this provider's handle; the shared client is closed
+        only when the last provider using the same database file disconnects.
+        """
+        if self.client is None:
+            return
+
+        cls = MilvusProvider
+        with cls._CLIENTS_LOCK:
+            remaining = cls._REFCOUNTS.get(self.db_path, 1) - 1
+            if remaining <= 0:
+                cls._REFCOUNTS.pop(self.db_path, None)
+                client = cls._CLIENTS.pop(self.db_path, None)
+                if client is not None:
+                    try:
+                        client.close()
+                    except Exception as e:
+                        self.logger.error(f"Error closing Milvus client: {e}")
+            else:
+                cls._REFCOUNTS[self.db_path] = remaining
+
+        self.client = None
         self.logger.info("Disconnected from Milvus")
     
     def is_collection_exists(self, collection_name: str) -> bool:
         """
         Check if a collection exists in Milvus.
+        Collections already seen to exist are answered from '_known_collections'.
         
         Args:
             collection_name (str): The name of the collection to check
@@ -74,8 +140,13 @@ class MilvusProvider(VectorDBInterface):
             bool: True if collection exists, False otherwise
         """
         self._ensure_connected()
+        if collection_name in self._known_collections:
+            return True
         try:
-            return self.client.has_collection(collection_name=collection_name)
+            exists = self.client.has_collection(collection_name=collection_name)
+            if exists:
+                self._known_collections.add(collection_name)
+            return exists
         except Exception as e:
             self.logger.error(f"Error checking if collection exists: {e}")
             return False
@@ -124,6 +195,8 @@ class MilvusProvider(VectorDBInterface):
     def delete_collection(self, collection_name: str):
         """
         Delete a collection from Milvus.
+        drop_collection doesn't fail for a missing collection, so existence is checked
+        first (answered from '_known_collections' without a round-trip when possible).
         
         Args:
             collection_name (str): The name of the collection to delete
@@ -133,13 +206,14 @@ class MilvusProvider(VectorDBInterface):
         """
         self._ensure_connected()
         try:
-            if self.is_collection_exists(collection_name):
-                self.client.drop_collection(collection_name=collection_name)
-                self.logger.info(f"Successfully deleted collection: {collection_name}")
-                return True
-            
-            self.logger.warning(f"Attempted to delete non-existent collection: {collection_name}")
-            return False
+            if not self.is_collection_exists(collection_name):
+                self.logger.warning(f"Attempted to delete non-existent collection: {collection_name}")
+                return False
+
+            self.client.drop_collection(collection_name=collection_name)
+            self._known_collections.discard(collection_name)
+            self.logger.info(f"Successfully deleted collection: {collection_name}")
+            return True
         except Exception as e:
             self.logger.error(f"Failed to delete collection '{collection_name}': {e}")
             return False
@@ -147,6 +221,8 @@ class MilvusProvider(VectorDBInterface):
     def create_collection(self, collection_name: str, embedding_size: int, do_reset: bool = False):
         """
         Create a new collection in Milvus.
+        Existence is answered from '_known_collections' when possible, so only the first
+        call for a collection (e.g. after a restart) asks the server.
         
         Args:
             collection_name (str): The name of the collection to create
@@ -161,17 +237,19 @@ class MilvusProvider(VectorDBInterface):
             if do_reset:
                 self.delete_collection(collection_name)
             
-            if not self.is_collection_exists(collection_name):
-                # MilvusClient.create_collection uses dimension parameter
-                # Note: metric_type defaults to COSINE, but we'll set it explicitly
-                self.client.create_collection(
-                    collection_name=collection_name,
-                    dimension=embedding_size,
-                    metric_type=self.distance_metric
-                )
-                self.logger.info(f"Collection '{collection_name}' created with dimension {embedding_size} and metric {self.distance_metric}")
-                return True
-            return False
+            if self.is_collection_exists(collection_name):
+                return False
+            
+            # MilvusClient.create_collection uses dimension parameter
+            # Note: metric_type defaults to COSINE, but we'll set it explicitly
+            self.client.create_collection(
+                collection_name=collection_name,
+                dimension=embedding_size,
+                metric_type=self.distance_metric
+            )
+            self._known_collections.add(collection_name)
+            self.logger.info(f"Collection '{collection_name}' created with dimension {embedding_size} and metric {self.distance_metric}")
+            return True
         except Exception as e:
             self.logger.error(f"Error creating collection: {e}")
             return False
@@ -196,6 +274,10 @@ class MilvusProvider(VectorDBInterface):
         if not self.is_collection_exists(collection_name):
             self.logger.error(f"Cannot insert: Collection '{collection_name}' does not exist.")
             return False
+
+        # Embeddings arrive as numpy arrays; the client wants plain lists
+        if hasattr(vector, "tolist"):
+            vector = vector.tolist()
         
         try:
             # Format data as Milvus expects: list of dictionaries
@@ -215,17 +297,22 @@ class MilvusProvider(VectorDBInterface):
     
     def insert_many(self, collection_name: str, texts: list,
                     vectors: list, metadatas: list = None,
-                    record_ids: list = None, batch_size: int = 50):
+                    record_ids: list = None, batch_size: int = None,
+                    max_workers: int = 4):
         """
         Insert multiple vector records into a collection in batches.
+        Batches are sent from a small thread pool: the client releases the GIL while
+        waiting on gRPC, so several inserts proceed in parallel.
         
         Args:
             collection_name (str): The target collection name
             texts (list): List of original text contents
-            vectors (list): List of embedding vectors (each vector is a list of floats)
+            vectors (np.ndarray | list): (N, dim) float32 matrix, or one list of floats per text
             metadatas (list, optional): List of metadata dictionaries (one per vector)
             record_ids (list, optional): List of unique identifiers (auto-generated if not provided)
-            batch_size (int): Number of records to insert per batch (default: 50)
+            batch_size (int, optional): Number of records to insert per batch (default: the
+                provider's 'default_batch_size'), capped so a batch fits in one gRPC message
+            max_workers (int): Batches inserted in parallel (default: 4)
             
         Returns:
             bool: True if the process completes, even if some batches failed (errors are logged)
@@ -236,30 +323,50 @@ class MilvusProvider(VectorDBInterface):
             self.logger.error(f"Cannot insert: Collection '{collection_name}' does not exist.")
             return False
         
-        # Initialize metadatas and record_ids as lists of None if not provided
-        if metadatas is None:
-            metadatas = [None] * len(texts)
-        
-        if record_ids is None:
-            record_ids = [None] * len(texts)
-        
-        # Validate input lengths match
-        if not (len(texts) == len(vectors) == len(metadatas) == len(record_ids)):
+        # Nothing to insert: skip batching altogether
+        if not texts:
+            return True
+
+        # Validate input lengths match (missing metadatas/record_ids are filled per batch
+        # with repeat(None), so no N-sized placeholder lists are allocated or sliced)
+        n_texts = len(texts)
+        if (len(vectors) != n_texts
+                or (metadatas is not None and len(metadatas) != n_texts)
+                or (record_ids is not None and len(record_ids) != n_texts)):
             self.logger.error("Input lists must have the same length")
             return False
+
+        # Normalize an embedding matrix to one contiguous float32 block, so every batch
+        # below is a zero-copy view (float64 or strided input would otherwise be copied
+        # or converted at double the bytes per batch)
+        if isinstance(vectors, np.ndarray):
+            vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+
+        if batch_size is None:
+            batch_size = self.default_batch_size
+        # Keep each batch within half the gRPC message cap: 4 bytes per float32 dimension
+        # plus the sampled average text size and a fixed allowance per row
+        sample = texts[:_SIZE_SAMPLE_ROWS]
+        avg_text_bytes = sum(len(txt.encode("utf-8")) for txt in sample) // len(sample)
+        row_bytes = len(vectors[0]) * 4 + avg_text_bytes + _ROW_OVERHEAD_BYTES
+        batch_size = min(batch_size, max(1, _MAX_GRPC_MSG_BYTES // 2 // row_bytes))
         
         successful_batches = 0
         total_batches = (len(texts) + batch_size - 1) // batch_size
-        
-        # Process data in chunks to optimize memory and network usage
-        for i in range(0, len(texts), batch_size):
+
+        def _insert_batch(i: int):
             batch_end = i + batch_size
             
             # Slice the input lists to get the current batch
             b_texts = texts[i:batch_end]
             b_vectors = vectors[i:batch_end]
-            b_metadata = metadatas[i:batch_end]
-            b_ids = record_ids[i:batch_end]
+            b_metadata = metadatas[i:batch_end] if metadatas is not None else repeat(None)
+            b_ids = record_ids[i:batch_end] if record_ids is not None else repeat(None)
+
+            # A float32 matrix is sliced as a view and converted per batch in one
+            # C-level pass, so only in-flight batches ever exist as Python lists
+            if hasattr(b_vectors, "tolist"):
+                b_vectors = b_vectors.tolist()
             
             # Format data as Milvus expects: list of dictionaries
             batch_data = [
@@ -267,18 +374,28 @@ class MilvusProvider(VectorDBInterface):
                     "id": r_id if r_id is not None else i + idx,  # Use index if no ID provided
                     "vector": vec,
                     "text": txt,
-                    "metadata": meta if meta is not None else {}
+                    "metadata": meta if meta is not None else _EMPTY_METADATA
                 }
                 for idx, (txt, vec, meta, r_id) in enumerate(zip(b_texts, b_vectors, b_metadata, b_ids))
             ]
             
-            try:
-                # Send the current batch to the database
-                self.client.insert(collection_name=collection_name, data=batch_data)
-                successful_batches += 1
-            except Exception as e:
-                # Log the error for this specific batch and continue with the next
-                self.logger.error(f"Error while inserting batch starting at index {i}: {e}")
+            # Send the current batch to the database
+            self._insert_rows(collection_name, batch_data)
+        
+        # Process data in chunks to optimize memory and network usage; each worker
+        # builds its own batch, so only in-flight batches exist as row dicts
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="milvus-insert") as executor:
+            futures = {
+                executor.submit(_insert_batch, i): i
+                for i in range(0, len(texts), batch_size)
+            }
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                    successful_batches += 1
+                except Exception as e:
+                    # Log the error for this specific batch; the others carry on
+                    self.logger.error(f"Error while inserting batch starting at index {futures[future]}: {e}")
         
         if successful_batches == 0:
             self.logger.error(f"All {total_batches} batches failed for collection '{collection_name}'")
@@ -289,6 +406,21 @@ class MilvusProvider(VectorDBInterface):
         
         return True
     
+    def _insert_rows(self, collection_name: str, rows: list):
+        """
+        Inserts 'rows' in one call. If the request still exceeds the gRPC message size
+        (the size estimate missed, e.g. one unusually large text or metadata), it is
+        split in half and each half retried.
+        """
+        try:
+            self.client.insert(collection_name=collection_name, data=rows)
+        except Exception as e:
+            if len(rows) < 2 or not _is_message_too_large(e):
+                raise
+            mid = len(rows) // 2
+            self._insert_rows(collection_name, rows[:mid])
+            self._insert_rows(collection_name, rows[mid:])
+    
     def search_by_vector(self, collection_name: str, vector: list, limit: int = 5):
         """
         Search for similar vectors in a collection.
@@ -302,6 +434,9 @@ class MilvusProvider(VectorDBInterface):
             list: List of search results with scores and payloads, normalized to match Qdrant format
         """
         self._ensure_connected()
+        # Embeddings arrive as numpy arrays; the client wants plain lists
+        if hasattr(vector, "tolist"):
+            vector = vector.tolist()
         try:
             if not self.is_collection_exists(collection_name):
                 self.logger.error(f"Cannot search: Collection '{collection_name}' does not exist.")
@@ -319,21 +454,65 @@ class MilvusProvider(VectorDBInterface):
             # Normalize results to match Qdrant format
             # Qdrant returns: [ScoredPoint(id=..., score=..., payload={...})]
             # We'll convert to a similar dict format for consistency
-            normalized_results = []
-            if results and len(results) > 0:
-                # results is a list where each element corresponds to a query vector
-                # Since we only pass one vector, results[0] contains the matches
-                for hit in results[0]:
-                    normalized_results.append({
-                        "id": hit.get("id"),
-                        "score": hit.get("distance"),
-                        "payload": {
-                            "text": hit.get("entity", {}).get("text", ""),
-                            "metadata": hit.get("entity", {}).get("metadata", {})
-                        }
-                    })
-            
-            return normalized_results
+            # results is a list where each element corresponds to a query vector
+            # Since we only pass one vector, results[0] contains the matches.
+            # Every hit carries id, distance and the requested output fields (insert
+            # always writes text and metadata), so they are read by subscript
+            hits = results[0] if results else []
+            return [
+                {
+                    "id": hit["id"],
+                    "score": hit["distance"],
+                    "payload": {"text": hit["entity"]["text"], "metadata": hit["entity"]["metadata"]}
+                }
+                for hit in hits
+            ]
         except Exception as e:
             self.logger.error(f"Error searching in collection '{collection_name}': {e}")
             return []
+
+    def search_many_by_vector(self, collection_name: str, vectors: list, limit: int = 5):
+        """
+        Search for several query vectors in one call.
+        Milvus takes a list of query vectors and returns one hit list per query,
+        so all queries share a single round-trip instead of one search each.
+        
+        Args:
+            collection_name (str): The name of the collection to search in
+            vectors (np.ndarray | list): (N, dim) matrix or list of query vectors
+            limit (int): Maximum number of results per query (default: 5)
+            
+        Returns:
+            list: One list of results per query vector, in input order, in the same
+                format as search_by_vector
+        """
+        self._ensure_connected()
+        # Convert the whole query matrix in one C-level pass
+        if hasattr(vectors, "tolist"):
+            vectors = vectors.tolist()
+        try:
+            if not self.is_collection_exists(collection_name):
+                self.logger.error(f"Cannot search: Collection '{collection_name}' does not exist.")
+                return [[] for _ in vectors]
+            
+            results = self.client.search(
+                collection_name=collection_name,
+                data=vectors,
+                limit=limit,
+                output_fields=["text", "metadata"]
+            )
+            
+            return [
+                [
+                    {
+                        "id": hit["id"],
+                        "score": hit["distance"],
+                        "payload": {"text": hit["entity"]["text"], "metadata": hit["entity"]["metadata"]}
+                    }
+                    for hit in hits
+                ]
+                for hits in results
+            ]
+        except Exception as e:
+            self.logger.error(f"Error batch searching in collection '{collection_name}': {e}")
+            return [[] for _ in vectors]
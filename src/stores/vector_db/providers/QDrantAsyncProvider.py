@@ -1,11 +1,84 @@
 import uuid
 import logging
 import asyncio
+import time
+import grpc
+import httpx
+import numpy as np
 from qdrant_client import AsyncQdrantClient, models
+from qdrant_client.http.exceptions import UnexpectedResponse
 from ..VectorDBInterfaceAsync import VectorDBInterfaceAsync
 from ..VectorDBEnums import DistanceMetricEnums
+from ..QDrantCommon import (
+    EMPTY_METADATA, fill_record_ids, indexing_threshold_config, threshold_to_restore
+)
 from models.db_schemas import RetrievedDocument
-from typing import List
+from typing import ClassVar, List, Optional
+
+# Qdrant's default max request size (service.max_request_size_mb) is 32 MB
+_MAX_REQUEST_BYTES = 32 * 1024 * 1024
+# Rough per-point allowance for id, metadata and JSON framing on top of vector and text
+_POINT_OVERHEAD_BYTES = 256
+# Texts sampled to estimate the average point size
+_SIZE_SAMPLE_POINTS = 32
+# Searches score against the int8 copy, fetch 2x the candidates and rescore those with
+# the original float32 vectors, so quantization costs no recall at the requested limit
+_SEARCH_PARAMS = models.SearchParams(
+    quantization=models.QuantizationSearchParams(rescore=True, oversampling=2.0)
+)
+# Keep-alive connections in the REST client's pool. Sized above what concurrent
+# insert_many/search calls keep in flight, so requests reuse open (TLS) connections
+# instead of queueing for one or reconnecting past httpx's keep-alive default of 20
+_HTTP_POOL_SIZE = 64
+# REST connections opened up front by connect(), matching insert_many's default
+# max_concurrency so the first bulk upload doesn't pay TCP/TLS setup per request
+_WARMUP_CONNECTIONS = 4
+
+
+def _points_to_documents(points) -> List[RetrievedDocument]:
+    """
+    Maps one query's ScoredPoints to RetrievedDocument.
+    model_construct skips pydantic validation, which is redundant for the already-typed
+    payload text and score the client returns.
+    """
+    construct = RetrievedDocument.model_construct
+    return [construct(text=hit.payload.get("text", ""), score=hit.score) for hit in points]
+
+def _is_collection_not_found(error: Exception) -> bool:
+    """
+    True if 'error' means the target collection doesn't exist: remote servers answer
+    404 (NOT_FOUND over gRPC), the embedded (local) client raises
+    ValueError("Collection ... not found").
+    """
+    if isinstance(error, UnexpectedResponse):
+        return error.status_code == 404
+    if isinstance(error, grpc.RpcError):
+        return error.code() == grpc.StatusCode.NOT_FOUND
+    return isinstance(error, ValueError) and "not found" in str(error)
+
+def _is_request_too_large(error: Exception) -> bool:
+    """True if the server rejected a request for its size (HTTP 413 / gRPC RESOURCE_EXHAUSTED)."""
+    if isinstance(error, UnexpectedResponse):
+        return error.status_code == 413
+    return isinstance(error, grpc.RpcError) and error.code() == grpc.StatusCode.RESOURCE_EXHAUSTED
+
+
+def _build_batch(ids: list, vectors, texts: list, metadatas: list) -> models.Batch:
+    """
+    Builds one upsert batch. Plain CPU work (vector list conversion, payload dicts),
+    so insert_many runs it in a worker thread to overlap with other batches' I/O.
+    """
+    # A float32 matrix slice is converted in one C-level pass
+    if hasattr(vectors, "tolist"):
+        vectors = vectors.tolist()
+
+    # Columnar Batch instead of one PointStruct per record: three plain
+    # lists, no per-point pydantic model
+    return models.Batch(
+        ids=ids,
+        vectors=vectors,
+        payloads=[{"text": txt, "metadata": meta or EMPTY_METADATA} for txt, meta in zip(texts, metadatas)]
+    )
 
 class QDrantAsyncProvider(VectorDBInterfaceAsync):
     """
@@ -17,8 +90,23 @@ class QDrantAsyncProvider(VectorDBInterfaceAsync):
     It also includes scalability optimizations like sharding and on-disk storage.
     """
 
+    # One AsyncQdrantClient per server (url, api_key) or local path, shared by every
+    # provider in the process and reference-counted so it is closed with its last user.
+    _CLIENTS: dict = {}
+    _REFCOUNTS: dict = {}
+    _CLIENTS_LOCK = asyncio.Lock()
+
+    # Metric strings from Enums to internal Qdrant distance models, built once for the class
+    _METRIC_MAP: ClassVar[dict[str, models.Distance]] = {
+        DistanceMetricEnums.COSINE.value: models.Distance.COSINE,
+        DistanceMetricEnums.EUCLIDEAN.value: models.Distance.EUCLID,
+        DistanceMetricEnums.DOT.value: models.Distance.DOT
+    }
+
     def __init__(self, db_path: str, url: str = None, api_key: str = None,
-                 distance_metric: str = DistanceMetricEnums.COSINE.value):
+                 distance_metric: str = DistanceMetricEnums.COSINE.value,
+                 default_batch_size: int = 64, prefer_grpc: bool = True,
+                 grpc_port: int = 6334, high_ram: bool = False):
         """
         Initializes the asynchronous provider with configuration settings.
 
@@ -27,66 +115,168 @@ class QDrantAsyncProvider(VectorDBInterfaceAsync):
             url (str, optional): Connection URL for remote Qdrant servers/clusters.
             api_key (str, optional): Security key for authenticated remote servers.
             distance_metric (str): Similarity calculation method (Cosine, Euclidean, or Dot).
+            default_batch_size (int): Points per upsert when insert_many isn't given one;
+                Qdrant uploads are fastest around 32-128 points per request.
+            prefer_grpc (bool): Talk to a remote server over gRPC, where vectors travel as
+                packed floats, instead of REST/JSON (~5x fewer bytes per vector and no JSON
+                parsing). Ignored for local path storage.
+            grpc_port (int): The server's gRPC port (Qdrant's default is 6334).
+            high_ram (bool): Keep payloads and the HNSW graph of new collections in RAM
+                for latency-sensitive deployments; by default both live on disk.
         """
         self.db_path = db_path
         self.url = url
         self.api_key = api_key
+        self.default_batch_size = default_batch_size
+        self.prefer_grpc = prefer_grpc
+        self.grpc_port = grpc_port
+        self.high_ram = high_ram
         self.client = None
         self.logger = logging.getLogger(__name__)
+        # Collections seen to exist, so inserts skip the collection_exists round-trip;
+        # kept in sync by create_collection/delete_collection (no lock: one event loop)
+        self._known_collections: set[str] = set()
+        # Short-TTL memo of catalog reads: (expiry, names) and name -> (expiry, info);
+        # create_collection/delete_collection reset them
+        self._metadata_ttl = 2.0
+        self._collections_cache: tuple = (0.0, None)
+        self._collection_info_cache: dict = {}
+        # Concurrent insert_one calls are queued as (collection, id, vector, text,
+        # metadata, future) and flushed by '_insert_loop' as one upsert per collection
+        self._pending_inserts = []
+        self._insert_task = None
+        self._coalesce_max_batch = 256    # Max points per coalesced upsert
+        self._coalesce_delay = 0.002      # Max time (seconds) a point waits for company
         
-        # Mapping metric strings from Enums to internal Qdrant distance models
-        metric_map = {
-            DistanceMetricEnums.COSINE.value: models.Distance.COSINE,
-            DistanceMetricEnums.EUCLIDEAN.value: models.Distance.EUCLID,
-            DistanceMetricEnums.DOT.value: models.Distance.DOT
-        }
-        self.distance_metric = metric_map.get(distance_metric, models.Distance.COSINE)
-
-    async def _ensure_connected(self):
-        """Internal helper to ensure client is connected before operations."""
+        self.distance_metric = self._METRIC_MAP.get(distance_metric, models.Distance.COSINE)
+
+    def _ensure_connected(self):
+        """
+        Internal helper to ensure client is connected before operations.
+        Plain (not async): it's a None-check, so awaiting it only cost a coroutine per call.
+        """
         if self.client is None:
             raise RuntimeError("Client not connected. Call connect() first.")
 
-    async def connect(self):
-        """Initializes the client with connection pooling settings."""
+    def _client_key(self) -> tuple:
         if self.url:
-            # For large scale, we specify limits and timeouts
-            self.client = AsyncQdrantClient(
-                url=self.url, 
-                api_key=self.api_key,
-                timeout=60
-            )
-        else:
-            self.client = AsyncQdrantClient(path=self.db_path)
+            return ("url", self.url, self.api_key, self.prefer_grpc, self.grpc_port)
+        return ("path", self.db_path)
+
+    async def connect(self):
+        """
+        Initializes the client with connection pooling settings.
+        Reuses the process-wide client for the same server or local path if one is open,
+        so providers share one connection pool (and an embedded store is opened once).
+        """
+        if self.client is not None:
+            return
+
+        key = self._client_key()
+        cls = QDrantAsyncProvider
+        async with cls._CLIENTS_LOCK:
+            client = cls._CLIENTS.get(key)
+            if client is None:
+                if self.url:
+                    # For large scale, we specify limits and timeouts
+                    client = AsyncQdrantClient(
+                        url=self.url, 
+                        api_key=self.api_key,
+                        prefer_grpc=self.prefer_grpc,
+                        grpc_port=self.grpc_port,
+                        timeout=60,
+                        # Used by the REST transport only (gRPC multiplexes one channel)
+                        limits=httpx.Limits(
+                            max_connections=_HTTP_POOL_SIZE,
+                            max_keepalive_connections=_HTTP_POOL_SIZE
+                        )
+                    )
+                    await self._warm_up(client)
+                else:
+                    client = AsyncQdrantClient(path=self.db_path)
+                cls._CLIENTS[key] = client
+            cls._REFCOUNTS[key] = cls._REFCOUNTS.get(key, 0) + 1
+
+        self.client = client
         self.logger.info("Async Qdrant client connected.")
 
+    async def _warm_up(self, client: AsyncQdrantClient):
+        """
+        Opens the connection(s) of a new remote client with cheap get_collections calls,
+        so the first real request doesn't pay connection setup. gRPC multiplexes one
+        channel (one call is enough); REST opens one pooled connection per concurrent call.
+        A failure here is only logged: the client reconnects on first use.
+        """
+        calls = 1 if self.prefer_grpc else _WARMUP_CONNECTIONS
+        try:
+            await asyncio.gather(*[client.get_collections() for _ in range(calls)])
+        except Exception as e:
+            self.logger.warning(f"Qdrant connection warm-up failed: {e}")
+
     async def disconnect(self):
-        """Ensures the underlying HTTP client is closed."""
-        if self.client:
-            await self.client.close()
-            self.client = None
-            self.logger.info("Async Qdrant client closed.")
+        """
+        Releases this provider's handle; the shared client (and its HTTP pool) is
+        closed only when the last provider using it disconnects.
+        """
+        if self.client is None:
+            return
+
+        # Let queued insert_one calls reach the server before the handle goes away
+        if self._insert_task is not None:
+            await self._insert_task
+
+        key = self._client_key()
+        cls = QDrantAsyncProvider
+        async with cls._CLIENTS_LOCK:
+            remaining = cls._REFCOUNTS.get(key, 1) - 1
+            if remaining <= 0:
+                cls._REFCOUNTS.pop(key, None)
+                client = cls._CLIENTS.pop(key, None)
+                if client is not None:
+                    await client.close()
+            else:
+                cls._REFCOUNTS[key] = remaining
+
+        self.client = None
+        self.logger.info("Async Qdrant client closed.")
 
     async def is_collection_exists(self, collection_name: str) -> bool:
         """
         Asynchronously checks if a collection exists.
+        Collections already seen to exist are answered from '_known_collections'.
         Returns: True if exists, False otherwise.
         """
-        await self._ensure_connected()
+        self._ensure_connected()
+        if collection_name in self._known_collections:
+            return True
         try:
-            return await self.client.collection_exists(collection_name)
+            exists = await self.client.collection_exists(collection_name)
+            if exists:
+                self._known_collections.add(collection_name)
+            return exists
         except Exception as e:
             self.logger.error(f"Error checking collection existence: {e}")
             return False
 
+    def _invalidate_metadata_cache(self, collection_name: str):
+        """Drops the memoized catalog and this collection's info after a create/delete."""
+        self._collections_cache = (0.0, None)
+        self._collection_info_cache.pop(collection_name, None)
+
     async def list_all_collections(self) -> list:
         """
         Retrieves a list of all existing collection names in the database.
+        Repeated calls within '_metadata_ttl' seconds are answered from memory.
         """
-        await self._ensure_connected()
+        self._ensure_connected()
+        expiry, cached = self._collections_cache
+        if cached is not None and time.monotonic() < expiry:
+            return cached
         try:
             collections_response = await self.client.get_collections()
-            return [col.name for col in collections_response.collections]
+            names = [col.name for col in collections_response.collections]
+            self._collections_cache = (time.monotonic() + self._metadata_ttl, names)
+            return names
         except Exception as e:
             self.logger.error(f"Error listing collections: {e}")
             return []
@@ -94,11 +284,17 @@ class QDrantAsyncProvider(VectorDBInterfaceAsync):
     async def get_collection_info(self, collection_name: str):
         """
         Retrieves technical metadata about a specific collection.
+        Repeated calls within '_metadata_ttl' seconds are answered from memory.
         Returns: A dictionary/object containing collection details or None if failed.
         """
-        await self._ensure_connected()
+        self._ensure_connected()
+        cached = self._collection_info_cache.get(collection_name)
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
         try:
-            return await self.client.get_collection(collection_name=collection_name)
+            info = await self.client.get_collection(collection_name=collection_name)
+            self._collection_info_cache[collection_name] = (time.monotonic() + self._metadata_ttl, info)
+            return info
         except Exception as e:
             self.logger.error(f"Error retrieving info for '{collection_name}': {e}")
             return None
@@ -107,10 +303,12 @@ class QDrantAsyncProvider(VectorDBInterfaceAsync):
         """
         Permanently deletes a collection and its data.
         """
-        await self._ensure_connected()
+        self._ensure_connected()
         try:
             if await self.is_collection_exists(collection_name):
                 await self.client.delete_collection(collection_name=collection_name)
+                self._known_collections.discard(collection_name)
+                self._invalidate_metadata_cache(collection_name)
                 self.logger.info(f"Successfully deleted collection: {collection_name}")
                 return True
             return False
@@ -126,8 +324,13 @@ class QDrantAsyncProvider(VectorDBInterfaceAsync):
             - shard_number (6): Splits data into 6 pieces. Ready for future horizontal scaling.
             - on_disk (True): Raw vectors are stored on disk, keeping RAM free for fast indexing.
             - replication_factor (1): Standard for single nodes; increase for clusters.
+            - quantization_config (int8): Keeps a 4x smaller int8 copy of the vectors in RAM
+              for scoring, while the full float32 vectors stay on disk.
+            - on_disk_payload / hnsw_config.on_disk: Chunk text, metadata and the HNSW graph
+              are read from disk too, so RAM holds only the int8 vectors (unless 'high_ram').
+              m=16, ef_construct=100 are Qdrant's recommended general-purpose graph settings.
         """
-        await self._ensure_connected()
+        self._ensure_connected()
         try:
             if do_reset:
                 await self.delete_collection(collection_name)
@@ -141,8 +344,19 @@ class QDrantAsyncProvider(VectorDBInterfaceAsync):
                         on_disk=True  # Saves RAM for massive datasets
                     ),
                     shard_number=6,    # Ready for horizontal multi-server distribution
-                    replication_factor=1 
+                    replication_factor=1,
+                    on_disk_payload=not self.high_ram,  # Payload text dominates RAM otherwise
+                    hnsw_config=models.HnswConfigDiff(m=16, ef_construct=100, on_disk=not self.high_ram),
+                    quantization_config=models.ScalarQuantization(
+                        scalar=models.ScalarQuantizationConfig(
+                            type=models.ScalarType.INT8,
+                            quantile=0.99,   # Clip outliers so the int8 range isn't wasted on them
+                            always_ram=True  # Quantized vectors in RAM, originals on disk
+                        )
+                    )
                 )
+                self._known_collections.add(collection_name)
+                self._invalidate_metadata_cache(collection_name)
                 self.logger.info(f"Collection '{collection_name}' created successfully.")
                 return True
             return False
@@ -151,112 +365,254 @@ class QDrantAsyncProvider(VectorDBInterfaceAsync):
             return False
 
     async def insert_one(self, collection_name: str, text: str, vector: list, 
-                         metadata: dict = None, record_id: str = None):
+                         metadata: dict = None, record_id: str = None, assume_exists: bool = False):
         """
-        Inserts a single vector record. 
-        Uses 'upload_records' to keep structure consistent with tutorial images.
+        Inserts a single vector record.
+        The record is queued and written by '_insert_loop' together with any other
+        insert_one calls made around the same time, so a loop of concurrent single
+        inserts costs one upsert per collection instead of one round-trip per point.
+        Still resolves only once the upsert has completed (True) or failed (False).
+        The write is attempted directly (no collection_exists round-trip first); a
+        missing collection is recognized from the error, so 'assume_exists' is only
+        kept for interface compatibility.
         """
-        await self._ensure_connected()
-        if not await self.is_collection_exists(collection_name):
-            self.logger.error(f"Cannot insert: Collection '{collection_name}' not found.")
-            return False
+        self._ensure_connected()
 
-        try:
-            await self.client.upload_records(
-                collection_name=collection_name,
-                records=[
-                    models.Record(
-                        id=record_id or str(uuid.uuid4()),
-                        vector=vector,
-                        payload={
-                            "text": text,        # Stored for RAG retrieval
-                            "metadata": metadata # Extra info (page number, source, etc.)
-                        }
+        # Embeddings arrive as numpy arrays; the client wants plain lists
+        if hasattr(vector, "tolist"):
+            vector = vector.tolist()
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending_inserts.append(
+            (collection_name, record_id or str(uuid.uuid4()), vector, text, metadata, future)
+        )
+        if self._insert_task is None or self._insert_task.done():
+            self._insert_task = asyncio.create_task(self._insert_loop())
+        return await future
+
+    async def _insert_loop(self):
+        """
+        Drains the pending insert_one queue in micro-batches.
+
+        Each round waits up to 'coalesce_delay' for more callers to join (skipped
+        once a full batch is already waiting), then upserts each collection's points
+        as one batch and resolves every caller's future. The task exits when the
+        queue is empty and insert_one restarts it on the next call.
+        """
+        while self._pending_inserts:
+            if len(self._pending_inserts) < self._coalesce_max_batch:
+                await asyncio.sleep(self._coalesce_delay)
+
+            batch = self._pending_inserts[:self._coalesce_max_batch]
+            del self._pending_inserts[:self._coalesce_max_batch]
+
+            # One upsert targets a single collection
+            groups = {}
+            for collection_name, *item in batch:
+                groups.setdefault(collection_name, []).append(item)
+
+            for collection_name, items in groups.items():
+                ids, vectors, texts, metadatas, futures = zip(*items)
+                try:
+                    await self.client.upsert(
+                        collection_name=collection_name,
+                        points=_build_batch(list(ids), list(vectors), list(texts), list(metadatas)),
+                        wait=True
                     )
-                ]
-            )
-            return True
-        except Exception as e:
-            self.logger.error(f"Error in insert_one: {e}")
-            return False
+                    ok = True
+                except Exception as e:
+                    if _is_collection_not_found(e):
+                        self._known_collections.discard(collection_name)
+                        self.logger.error(f"Cannot insert: Collection '{collection_name}' not found.")
+                    else:
+                        self.logger.error(f"Error in insert_one: {e}")
+                    ok = False
+
+                for future in futures:
+                    if not future.done():
+                        future.set_result(ok)
 
     async def insert_many(self, collection_name: str, texts: list, vectors: list, 
-                            metadatas: list = None, record_ids: list = None, batch_size: int = 50):
+                            metadatas: list = None, record_ids: list = None, batch_size: int = None,
+                            assume_exists: bool = False, max_concurrency: int = 4,
+                            wait: bool = False, bulk_mode: bool = False):
             """
             High-throughput batch insertion using native 'upsert' coroutines.
-            Optimized for large scale by allowing true parallel I/O.
+            Optimized for large scale by allowing parallel I/O, capped at 'max_concurrency'
+            batches in flight so big uploads don't swamp the connection pool.
+            'batch_size' defaults to the provider's 'default_batch_size' and is capped so
+            one request stays under Qdrant's max request size.
+            Batches are sent without a collection_exists round-trip first; a missing
+            collection is recognized from the errors ('assume_exists' is only kept for
+            interface compatibility).
+            'wait' (default False) returns as soon as Qdrant has accepted each batch and
+            lets indexing finish in the background, which is what bulk ingest wants; pass
+            wait=True when the points must be searchable the moment this returns.
+            (insert_one always waits.)
+            'bulk_mode' sets the collection's indexing_threshold to 0 for the duration of
+            the upload and restores it afterwards, so HNSW is built once over the loaded
+            segments instead of being rebuilt while they keep growing. Use it for large
+            one-off ingests; concurrent bulk ingests into one collection shouldn't overlap.
             """
-            await self._ensure_connected()
-            
-            # 1. Validation
-            if not await self.is_collection_exists(collection_name):
-                self.logger.error(f"Collection '{collection_name}' not found.")
-                return False
+            self._ensure_connected()
             
             count = len(texts)
-            metadatas = metadatas or [{}] * count
-            # Ensure we use UUIDs or standard IDs for Qdrant
-            record_ids = record_ids or [str(uuid.uuid4()) for _ in range(count)]
-
-            # 2. Parallel Batching
-            tasks = []
-            for i in range(0, count, batch_size):
-                batch_points = [
-                    models.PointStruct(
-                        id=p_id,
-                        vector=vec,
-                        payload={"text": txt, "metadata": meta or {}}
-                    )
-                    for txt, vec, meta, p_id in zip(
-                        texts[i:i + batch_size], 
-                        vectors[i:i + batch_size], 
-                        metadatas[i:i + batch_size], 
-                        record_ids[i:i + batch_size]
-                    )
-                ]
+            metadatas = metadatas or [EMPTY_METADATA] * count
+
+            # Normalize an embedding matrix to one contiguous float32 block, so every batch
+            # below is a zero-copy view (float64 or strided input would otherwise be copied
+            # or converted at double the bytes per batch)
+            if isinstance(vectors, np.ndarray):
+                vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+
+            if batch_size is None:
+                batch_size = self.default_batch_size
+            # Keep each request within half the size cap: 4 bytes per float32 dimension
+            # plus the sampled average text size and a fixed allowance per point
+            if count:
+                sample = texts[:_SIZE_SAMPLE_POINTS]
+                avg_text_bytes = sum(len(txt.encode("utf-8")) for txt in sample) // len(sample)
+                point_bytes = len(vectors[0]) * 4 + avg_text_bytes + _POINT_OVERHEAD_BYTES
+                batch_size = min(batch_size, max(1, _MAX_REQUEST_BYTES // 2 // point_bytes))
+            # Ensure we use UUIDs or standard IDs for Qdrant; missing ones come from one bulk draw
+            record_ids = fill_record_ids(record_ids, count)
+
+            # 2. Parallel Batching, bounded: each batch is built only once it holds a
+            # semaphore slot, so only in-flight batches are held in memory
+            semaphore = asyncio.Semaphore(max_concurrency)
+
+            async def _upsert_range(start: int, end: int):
+                # Built off the event loop, so building batch N+1 overlaps the
+                # network I/O of batch N
+                batch = await asyncio.to_thread(
+                    _build_batch,
+                    record_ids[start:end],
+                    vectors[start:end],
+                    texts[start:end],
+                    metadatas[start:end]
+                )
                 
                 # FIX: Use 'upsert' instead of 'upload_points'.
                 # 'upsert' returns a coroutine that asyncio.gather can manage.
-                tasks.append(
-                    self.client.upsert(
+                try:
+                    return await self.client.upsert(
                         collection_name=collection_name,
-                        points=batch_points,
-                        wait=True 
+                        points=batch,
+                        wait=wait 
                     )
-                )
+                except Exception as e:
+                    # Too large: the size estimate missed (e.g. one huge payload); split and retry
+                    if not _is_request_too_large(e) or end - start < 2:
+                        raise
+                    mid = (start + end) // 2
+                    await _upsert_range(start, mid)
+                    return await _upsert_range(mid, end)
+
+            async def _upsert_batch(i: int):
+                async with semaphore:
+                    return await _upsert_range(i, min(i + batch_size, count))
 
-            # 3. Concurrent Execution
-            # This will now work because 'tasks' contains valid coroutines
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            tasks = [_upsert_batch(i) for i in range(0, count, batch_size)]
+
+            # Pause HNSW indexing while the points stream in (restored even on failure)
+            restore_threshold = None
+            if bulk_mode and count:
+                restore_threshold = await self._pause_indexing(collection_name)
+
+            # 3. Concurrent Execution (at most 'max_concurrency' upserts at a time)
+            try:
+                results = await asyncio.gather(*tasks, return_exceptions=True)
+            finally:
+                if restore_threshold is not None:
+                    await self._set_indexing_threshold(collection_name, restore_threshold)
             
             # 4. Error Checking
-            successful_batches = 0
-            for idx, res in enumerate(results):
-                if isinstance(res, Exception):
-                    self.logger.error(f"Batch {idx} failed: {res}")
+            # Only failed batches are materialized; successes are just counted
+            failures = [(idx, res) for idx, res in enumerate(results) if isinstance(res, Exception)]
+            successful_batches = len(results) - len(failures)
+            collection_missing = False
+            for idx, res in failures:
+                if _is_collection_not_found(res):
+                    collection_missing = True
                 else:
-                    successful_batches += 1
+                    self.logger.error(f"Batch {idx} failed: {res}")
+
+            if collection_missing:
+                self._known_collections.discard(collection_name)
+                self.logger.error(f"Collection '{collection_name}' not found.")
             
             return successful_batches == len(tasks)
     
-    async def search_by_vector(self, collection_name: str, vector: list, limit: int = 5) -> List[RetrievedDocument]:
-        """Optimized search with explicit mapping and error handling."""
-        await self._ensure_connected()
+    async def _set_indexing_threshold(self, collection_name: str, threshold: int) -> bool:
+        """Updates the collection's optimizer indexing_threshold; logs and returns False on error."""
+        try:
+            await self.client.update_collection(
+                collection_name=collection_name,
+                optimizers_config=indexing_threshold_config(threshold)
+            )
+            self._invalidate_metadata_cache(collection_name)
+            return True
+        except Exception as e:
+            self.logger.error(f"Error setting indexing_threshold={threshold} on '{collection_name}': {e}")
+            return False
+
+    async def _pause_indexing(self, collection_name: str) -> Optional[int]:
+        """
+        Disables indexing (indexing_threshold=0) for a bulk ingest.
+        Returns: The threshold to restore afterwards, or None if indexing wasn't paused.
+        """
+        info = await self.get_collection_info(collection_name)
+        if info is None:
+            return None
+        restore = threshold_to_restore(info)
+        if not await self._set_indexing_threshold(collection_name, 0):
+            return None
+        return restore
+
+    async def search_by_vector(self, collection_name: str, vector: list, limit: int = 5,
+                               assume_exists: bool = False) -> List[RetrievedDocument]:
+        """
+        Optimized search with explicit mapping and error handling.
+        Never pre-checks the collection (a missing one just fails the query), so
+        'assume_exists' is accepted only for interface compatibility.
+        """
+        self._ensure_connected()
+        # Embeddings arrive as numpy arrays; the client wants plain lists
+        if hasattr(vector, "tolist"):
+            vector = vector.tolist()
         try:
             response = await self.client.query_points(
                 collection_name=collection_name,
                 query=vector,
-                limit=limit
+                limit=limit,
+                search_params=_SEARCH_PARAMS
             )
             
             # response.points is a list of ScoredPoint
-            return [
-                RetrievedDocument(
-                    text=hit.payload.get("text", ""),
-                    score=hit.score
-                )
-                for hit in response.points
-            ]
+            return _points_to_documents(response.points)
         except Exception as e:
             self.logger.error(f"Search failed: {e}")
-            return []
\ No newline at end of file
+            return []
+
+    async def search_many_by_vector(self, collection_name: str, vectors: list,
+                                    limit: int = 5) -> List[List[RetrievedDocument]]:
+        """Answers every query vector in a single query_batch_points round-trip."""
+        self._ensure_connected()
+        # Convert the whole query matrix in one C-level pass
+        if hasattr(vectors, "tolist"):
+            vectors = vectors.tolist()
+        try:
+            responses = await self.client.query_batch_points(
+                collection_name=collection_name,
+                requests=[
+                    models.QueryRequest(query=vector, limit=limit, with_payload=True,
+                                        params=_SEARCH_PARAMS)
+                    for vector in vectors
+                ]
+            )
+
+            # One QueryResponse per request, in request order
+            return [_points_to_documents(response.points) for response in responses]
+        except Exception as e:
+            self.logger.error(f"Batch search failed: {e}")
+            return [[] for _ in vectors]
\ No newline at end of file
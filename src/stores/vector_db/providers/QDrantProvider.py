@@ -1,25 +1,35 @@
 from ..VectorDBInterface import VectorDBInterface
 from qdrant_client import QdrantClient, models
 import logging
+import numpy as np
 from ..VectorDBEnums import DistanceMetricEnums
+from ..QDrantCommon import (
+    EMPTY_METADATA, fill_record_ids, indexing_threshold_config, threshold_to_restore
+)
 import uuid
+from typing import ClassVar, Optional
 
 class QDrantProvider(VectorDBInterface):
+    # Metric strings from Enums to Qdrant distance models, built once for the class
+    _METRIC_MAP: ClassVar[dict[str, models.Distance]] = {
+        DistanceMetricEnums.COSINE.value: models.Distance.COSINE,
+        DistanceMetricEnums.EUCLIDEAN.value: models.Distance.EUCLID,
+        DistanceMetricEnums.DOT.value: models.Distance.DOT
+    }
+
     def __init__(self, db_path: str,
                  distance_metric: str = DistanceMetricEnums.COSINE.value):
         self.db_path = db_path
-        self.distance_metric = None
         self.client = None
         self.logger = logging.getLogger(__name__)
+        # Collections seen to exist, so inserts/searches skip the collection_exists
+        # round-trip; kept in sync by create_collection/delete_collection
+        self._known_collections: set[str] = set()
         
-        if distance_metric == DistanceMetricEnums.COSINE.value:
-            self.distance_metric = models.Distance.COSINE
-        elif distance_metric == DistanceMetricEnums.EUCLIDEAN.value:
-            self.distance_metric = models.Distance.EUCLID
-        elif distance_metric == DistanceMetricEnums.DOT.value:
-            self.distance_metric = models.Distance.DOT
-        else:
+        if distance_metric not in self._METRIC_MAP:
             raise ValueError(f"Unsupported distance metric: {distance_metric}")
+        
+        self.distance_metric = self._METRIC_MAP[distance_metric]
 
     def _ensure_connected(self):
         """Internal helper to ensure client is connected before operations."""
@@ -35,10 +45,16 @@ class QDrantProvider(VectorDBInterface):
         self.logger.info("Disconnected from Qdrant")
 
     def is_collection_exists(self, collection_name: str) -> bool:
+        """Collections already seen to exist are answered from '_known_collections'."""
         self._ensure_connected()
+        if collection_name in self._known_collections:
+            return True
         try:
             # Note: client.collection_exists returns a boolean directly
-            return self.client.collection_exists(collection_name)
+            exists = self.client.collection_exists(collection_name)
+            if exists:
+                self._known_collections.add(collection_name)
+            return exists
         except Exception as e:
             self.logger.error(f"Error checking if collection exists: {e}")
             return False
@@ -71,6 +87,7 @@ class QDrantProvider(VectorDBInterface):
         try:
             if self.is_collection_exists(collection_name):
                 result = self.client.delete_collection(collection_name=collection_name)
+                self._known_collections.discard(collection_name)
                 self.logger.info(f"Successfully deleted collection: {collection_name}")
                 return result
             
@@ -98,6 +115,7 @@ class QDrantProvider(VectorDBInterface):
                     shard_number=6, 
                     replication_factor=1
                 )
+                self._known_collections.add(collection_name)
                 self.logger.info(f"Collection '{collection_name}' created.")
                 return True
             return False
@@ -122,6 +140,10 @@ class QDrantProvider(VectorDBInterface):
         if record_id is None:
             record_id = str(uuid.uuid4())
 
+        # Embeddings arrive as numpy arrays; the client wants plain lists
+        if hasattr(vector, "tolist"):
+            vector = vector.tolist()
+
         try:
             _ = self.client.upload_points(
                 collection_name=collection_name,
@@ -145,28 +167,35 @@ class QDrantProvider(VectorDBInterface):
 
     def insert_many(self, collection_name: str, texts: list,
                     vectors: list, metadatas: list = None,
-                    record_ids: list = None, batch_size: int = 50):
+                    record_ids: list = None, batch_size: int = 128,
+                    bulk_mode: bool = False, parallel: int = 1):
         """
-        Inserts a list of records into a Qdrant collection using batch processing.
+        Inserts a list of records into a Qdrant collection using the client's upload_collection.
 
-        This function optimizes the insertion process by splitting large datasets into smaller 
-        chunks (batches). This prevents memory spikes and ensures stable performance when 
-        handling high volumes of data. It uses Python's `zip` function to align 
-        text, vectors, and metadata efficiently.
+        The client splits the data into batches of 'batch_size' itself, pulls vectors and
+        payloads lazily from the inputs (no per-record Python objects are built here and an
+        ndarray is passed as-is) and retries failed batches. With 'parallel' > 1 it pushes
+        batches from that many worker processes; that only applies to a Qdrant server,
+        embedded (path) storage always uploads in-process.
 
         Args:
             collection_name (str): The name of the target Qdrant collection.
             texts (list): A list of strings representing the original content to be stored.
-            vectors (list): A list of embedding vectors (list of floats) corresponding to the texts.
+            vectors (np.ndarray | list): (N, dim) float32 matrix, or one list of floats per text.
             metadatas (list, optional): A list of dictionaries containing extra info (e.g., source, date). 
                 Defaults to None.
-            record_ids (list, optional): A list of unique IDs for each record. If None, Qdrant 
-                generates IDs automatically. Defaults to None.
+            record_ids (list, optional): A list of unique IDs for each record. Missing IDs
+                (None, or no list at all) are filled with random UUIDs generated here in
+                one bulk draw. Defaults to None.
             batch_size (int, optional): Number of records to send in each request. 
-                Defaults to 50.
+                Defaults to 128.
+            bulk_mode (bool, optional): Set the collection's indexing_threshold to 0 while
+                uploading and restore it afterwards, so HNSW is built once over the loaded
+                data instead of being rebuilt as segments grow. Defaults to False.
+            parallel (int, optional): Number of upload worker processes. Defaults to 1.
 
         Returns:
-            bool: True if the process completes, even if some batches failed (errors are logged).
+            bool: True if every record was uploaded, False otherwise (errors are logged).
         """
         self._ensure_connected()
         # Validation: Check if collection exists before attempting insert
@@ -174,63 +203,76 @@ class QDrantProvider(VectorDBInterface):
             self.logger.error(f"Cannot insert: Collection '{collection_name}' does not exist.")
             return False
 
-        # Initialize metadatas and record_ids as lists of None if not provided
         if metadatas is None:
             metadatas = [None] * len(texts)
 
-        if record_ids is None:
-            record_ids = [None] * len(texts)
-
         # Validate input lengths match
-        if not (len(texts) == len(vectors) == len(metadatas) == len(record_ids)):
+        if not (len(texts) == len(vectors) == len(metadatas)) or \
+                (record_ids is not None and len(record_ids) != len(texts)):
             self.logger.error("Input lists must have the same length")
             return False
 
-        successful_batches = 0
-        total_batches = (len(texts) + batch_size - 1) // batch_size
+        # Generate missing IDs in one bulk draw rather than letting the client call
+        # uuid4() (an urandom syscall) once per point
+        record_ids = fill_record_ids(record_ids, len(texts))
 
-        # Process data in chunks to optimize memory and network usage
-        for i in range(0, len(texts), batch_size):
-            batch_end = i + batch_size
-            
-            # Slice the input lists to get the current batch
-            b_texts = texts[i:batch_end]
-            b_vectors = vectors[i:batch_end]
-            b_metadata = metadatas[i:batch_end]
-            b_ids = record_ids[i:batch_end]
-
-            # Use zip to pair elements and create a list of Record objects
-            batch_records = [
-                models.Record(
-                    id=r_id,
-                    vector=vec,
-                    payload={
+        # Normalize an embedding matrix to one contiguous float32 block, so each batch the
+        # client slices off is a zero-copy view (float64 or strided input would otherwise
+        # be converted at double the bytes per batch). Lists are passed through as-is:
+        # round-tripping them through an array would only add a conversion.
+        if isinstance(vectors, np.ndarray):
+            vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+
+        # Pause HNSW indexing while the points stream in (restored even on failure)
+        restore_threshold = self._pause_indexing(collection_name) if bulk_mode and texts else None
+
+        try:
+            self.client.upload_collection(
+                collection_name=collection_name,
+                vectors=vectors,
+                payload=(
+                    {
                         "text": txt,        # Stored for retrieval by the LLM later
-                        "metadata": meta    # Nested metadata dictionary
+                        "metadata": meta or EMPTY_METADATA    # Nested metadata dictionary
                     }
-                )
-                for txt, vec, meta, r_id in zip(b_texts, b_vectors, b_metadata, b_ids)
-            ]
-
-            try:
-                # Send the current batch to the database
-                self.client.upload_points(
-                    collection_name=collection_name,
-                    points=batch_records,
-                )
-                successful_batches += 1
-            except Exception as e:
-                # Log the error for this specific batch and continue with the next
-                self.logger.error(f"Error while inserting batch starting at index {i}: {e}")
+                    for txt, meta in zip(texts, metadatas)
+                ),
+                ids=record_ids,
+                batch_size=batch_size,
+                parallel=parallel
+            )
+            return True
+        except Exception as e:
+            self.logger.error(f"Error while uploading to collection '{collection_name}': {e}")
+            return False
+        finally:
+            if restore_threshold is not None:
+                self._set_indexing_threshold(collection_name, restore_threshold)
 
-        if successful_batches == 0:
-            self.logger.error(f"All {total_batches} batches failed for collection '{collection_name}'")
+    def _set_indexing_threshold(self, collection_name: str, threshold: int) -> bool:
+        """Updates the collection's optimizer indexing_threshold; logs and returns False on error."""
+        try:
+            self.client.update_collection(
+                collection_name=collection_name,
+                optimizers_config=indexing_threshold_config(threshold)
+            )
+            return True
+        except Exception as e:
+            self.logger.error(f"Error setting indexing_threshold={threshold} on '{collection_name}': {e}")
             return False
-        
-        if successful_batches < total_batches:
-            self.logger.warning(f"Only {successful_batches}/{total_batches} batches succeeded for collection '{collection_name}'")
-        
-        return True
+
+    def _pause_indexing(self, collection_name: str) -> Optional[int]:
+        """
+        Disables indexing (indexing_threshold=0) for a bulk ingest.
+        Returns the threshold to restore afterwards, or None if indexing wasn't paused.
+        """
+        info = self.get_collection_info(collection_name)
+        if info is None:
+            return None
+        restore = threshold_to_restore(info)
+        if not self._set_indexing_threshold(collection_name, 0):
+            return None
+        return restore
 
     def search_by_vector(self, collection_name: str, vector: list, limit: int = 5):
         """
@@ -245,6 +287,9 @@ class QDrantProvider(VectorDBInterface):
             list: List of search results with scores and payloads
         """
         self._ensure_connected()
+        # Embeddings arrive as numpy arrays; the client wants plain lists
+        if hasattr(vector, "tolist"):
+            vector = vector.tolist()
         try:
             if not self.is_collection_exists(collection_name):
                 self.logger.error(f"Cannot search: Collection '{collection_name}' does not exist.")
@@ -258,4 +303,37 @@ class QDrantProvider(VectorDBInterface):
             )
         except Exception as e:
             self.logger.error(f"Error searching in collection '{collection_name}': {e}")
-            return []
\ No newline at end of file
+            return []
+
+    def search_many_by_vector(self, collection_name: str, vectors: list, limit: int = 5):
+        """
+        Search for several query vectors in one query_batch_points call instead of
+        one query_points round-trip per vector.
+
+        Args:
+            collection_name (str): The name of the collection to search in
+            vectors (np.ndarray | list): (N, dim) matrix or list of query vectors
+            limit (int): Maximum number of results per query (default: 5)
+
+        Returns:
+            list: One QueryResponse per query vector, in input order
+        """
+        self._ensure_connected()
+        # Convert the whole query matrix in one C-level pass
+        if hasattr(vectors, "tolist"):
+            vectors = vectors.tolist()
+        try:
+            if not self.is_collection_exists(collection_name):
+                self.logger.error(f"Cannot search: Collection '{collection_name}' does not exist.")
+                return [[] for _ in vectors]
+
+            return self.client.query_batch_points(
+                collection_name=collection_name,
+                requests=[
+                    models.QueryRequest(query=vector, limit=limit, with_payload=True)
+                    for vector in vectors
+                ]
+            )
+        except Exception as e:
+            self.logger.error(f"Error batch searching in collection '{collection_name}': {e}")
+            return [[] for _ in vectors]